@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.schemas.token_schema import Token, RefreshTokenRequest
-from app.core.database import get_db
+from app.core.database import get_async_read_db
 from app.services.auth_service import (
-    login_for_access_token,
-    refresh_token_service
+    login_for_access_token_async,
+    refresh_token_service_async
 )
 
 router = APIRouter()
@@ -14,13 +14,13 @@ router = APIRouter()
 
 @router.post("/login", response_model=Token)
 async def login(
-    db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
+    db: AsyncSession = Depends(get_async_read_db), form_data: OAuth2PasswordRequestForm = Depends()
 ):
-    return login_for_access_token(db, form_data.username, form_data.password)
+    return await login_for_access_token_async(db, form_data.username, form_data.password)
 
 @router.post("/refresh", response_model=Token)
 async def refresh(
     request: RefreshTokenRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    return refresh_token_service(request.refresh_token, db)
+    return await refresh_token_service_async(request.refresh_token, db)
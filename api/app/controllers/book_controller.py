@@ -1,27 +1,98 @@
-from fastapi import APIRouter, Depends, Path, Query, status
+import csv
+import io
+import orjson
+from fastapi import APIRouter, Depends, Path, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Iterator, List, Literal, Optional, Tuple
+from app.core.database import get_async_read_db, get_read_db
 from app.schemas.book_schema import BookSchema
-from app.services.books_service import get_all_books, get_books_by_title_and_category, get_book_by_id, get_top_rated_books, get_books_by_price_range
+from app.services.books_service import (
+    get_all_book_rows,
+    iter_book_row_chunks,
+    BOOK_COLUMNS,
+    get_books_by_title_and_category_async,
+    get_book_by_id_async,
+    get_top_rated_books_async,
+    get_books_by_price_range_async
+)
 from app.core.auth import get_current_user
+from app.core.response_cache import CachedResponse, cached_response
 from app.exceptions.custom_exceptions import BookNotFoundInRangePriceException
 import logging
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter(
-    dependencies=[Depends(get_current_user)]
+    dependencies=[Depends(get_current_user)],
+    default_response_class=ORJSONResponse
 )
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def page_headers(books: List, limit: int) -> Tuple[List, Dict[str, str]]:
+    if len(books) > limit:
+        books = books[:limit]
+        return books, {NEXT_CURSOR_HEADER: str(books[-1].id)}
+    return books, {}
+
+
+def set_next_cursor(response: Response, books: List, limit: int) -> List:
+    books, headers = page_headers(books, limit)
+    response.headers.update(headers)
+    return books
+
+
+EXPORT_FIELDS = [column.key for column in BOOK_COLUMNS]
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def ndjson_chunks(chunks: Iterator[List]) -> Iterator[bytes]:
+    for rows in chunks:
+        yield b"".join(orjson.dumps(dict(zip(EXPORT_FIELDS, row)), option=orjson.OPT_APPEND_NEWLINE) for row in rows)
+
+
+def csv_chunks(chunks: Iterator[List]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    yield buffer.getvalue().encode()
+    for rows in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+
+
+def render_book_rows(rows: List, headers: Optional[Dict[str, str]] = None) -> CachedResponse:
+    fields = rows[0]._fields if rows else ()
+    return CachedResponse(orjson.dumps([dict(zip(fields, row)) for row in rows]), headers or {})
+
 
 @router.get("/",
             response_model=List[BookSchema],
             status_code=status.HTTP_200_OK,
             )
-async def list_books(db: Session = Depends(get_db)) -> List[BookSchema]:
-    logger.info("Endpoint /books/ accessed - Listing all books")
-    return get_all_books(db)
+async def list_books(
+        request: Request,
+        after_id: Optional[int] = Query(None, description="Return books with ID greater than this cursor", ge=0),
+        limit: int = Query(DEFAULT_PAGE_SIZE, description="Maximum number of books to return", ge=1, le=MAX_PAGE_SIZE),
+        db: AsyncSession = Depends(get_async_read_db)
+) -> List[BookSchema]:
+    logger.info(f"Endpoint /books/ accessed - Listing books after_id={after_id}, limit={limit}")
+
+    def render(session: Session) -> CachedResponse:
+        rows, headers = page_headers(get_all_book_rows(session, after_id, limit + 1), limit)
+        return render_book_rows(rows, headers)
+
+    return await cached_response(request, db, render)
 
 
 @router.get("/search",
@@ -29,13 +100,16 @@ async def list_books(db: Session = Depends(get_db)) -> List[BookSchema]:
             status_code=status.HTTP_200_OK,
             )
 async def list_books_by_title_and_category(
+        response: Response,
         title: Optional[str] = Query(None, description="Title or part of the book title"),
         category: Optional[str] = Query(None, description="Book category (optional)"),
-        db: Session = Depends(get_db)
+        after_id: Optional[int] = Query(None, description="Return books with ID greater than this cursor", ge=0),
+        limit: int = Query(DEFAULT_PAGE_SIZE, description="Maximum number of books to return", ge=1, le=MAX_PAGE_SIZE),
+        db: AsyncSession = Depends(get_async_read_db)
 ) -> List[BookSchema]:
     logger.info(f"Endpoint /books/search accessed - Searching books by title: '{title}' and category: '{category}'")
-    books = get_books_by_title_and_category(db, title, category)
-    return books
+    books = await get_books_by_title_and_category_async(db, title, category, after_id, limit + 1)
+    return set_next_cursor(response, books, limit)
 
 
 @router.get("/top-rated",
@@ -44,24 +118,49 @@ async def list_books_by_title_and_category(
             )
 async def top_rated_books(
         limit: int = Query(10, description="Number of top books to return"),
-        db: Session = Depends(get_db)
+        then_by: Optional[Literal["price", "-price", "title", "-title"]] = Query(
+            None, description="Secondary sort key for books with the same rating ('-' for descending)"
+        ),
+        db: AsyncSession = Depends(get_async_read_db)
 ) -> List[BookSchema]:
     logger.info("Endpoint /books/top-rated accessed")
-    return get_top_rated_books(db, limit)
+    return await get_top_rated_books_async(db, limit, then_by)
 
 
 @router.get("/price-range",
             response_model=List[BookSchema],
             status_code=status.HTTP_200_OK)
 async def books_by_price_range(
+        response: Response,
         min: float = Query(..., description="Minimum price"),
         max: float = Query(..., description="Maximum price"),
-        db: Session = Depends(get_db)
+        category: Optional[str] = Query(None, description="Only books in this category (exact name)"),
+        min_rating: Optional[int] = Query(None, description="Only books rated at least this many stars", ge=1, le=5),
+        availability: Optional[str] = Query(None, description="Only books with this availability (case-insensitive)"),
+        after_id: Optional[int] = Query(None, description="Return books with ID greater than this cursor", ge=0),
+        limit: int = Query(DEFAULT_PAGE_SIZE, description="Maximum number of books to return", ge=1, le=MAX_PAGE_SIZE),
+        db: AsyncSession = Depends(get_async_read_db)
 ) -> List[BookSchema]:
     logger.info(f"Endpoint /books/price-range accessed with min={min}, max={max}")
     if min > max:
         raise BookNotFoundInRangePriceException
-    return get_books_by_price_range(db, min, max)
+    books = await get_books_by_price_range_async(db, min, max, category, min_rating, availability, after_id,
+                                                 limit + 1)
+    return set_next_cursor(response, books, limit)
+
+
+@router.get("/export",
+            response_class=StreamingResponse,
+            status_code=status.HTTP_200_OK)
+async def export_books(
+        format: Literal["ndjson", "csv"] = Query("ndjson", description="Export format"),
+        db: Session = Depends(get_read_db)
+) -> StreamingResponse:
+    logger.info(f"Endpoint /books/export accessed - Streaming catalog as {format}")
+    chunks = iter_book_row_chunks(db)
+    body = ndjson_chunks(chunks) if format == "ndjson" else csv_chunks(chunks)
+    return StreamingResponse(body, media_type=EXPORT_MEDIA_TYPES[format],
+                             headers={"Content-Disposition": f'attachment; filename="books.{format}"'})
 
 
 @router.get("/{id}",
@@ -70,7 +169,7 @@ async def books_by_price_range(
             )
 async def get_book(
         id: int = Path(..., title="Book ID", description="ID of the book to be searched", gt=0),
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_read_db)
 ) -> BookSchema:
     logger.info(f"Endpoint /books/{id} accessed - Searching book by ID")
-    return get_book_by_id(db, id)
+    return await get_book_by_id_async(db, id)
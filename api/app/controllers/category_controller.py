@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends
+import json
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from app.core.database import get_db
+from app.core.database import get_async_read_db
 from app.services.category_service import get_all_categories
 from app.core.auth import get_current_user
+from app.core.response_cache import CachedResponse, cached_response
 
 router = APIRouter(
     dependencies=[Depends(get_current_user)]
@@ -11,6 +14,9 @@ router = APIRouter(
 
 
 @router.get("/", response_model=List[str])
-async def list_categories(db: Session = Depends(get_db)):
-    categories = get_all_categories(db)
-    return [category.category for category in categories]
+async def list_categories(request: Request, db: AsyncSession = Depends(get_async_read_db)):
+    def render(session: Session) -> CachedResponse:
+        categories = get_all_categories(session)
+        return CachedResponse(json.dumps([category.category for category in categories]).encode())
+
+    return await cached_response(request, db, render)
@@ -1,7 +1,13 @@
 from fastapi import APIRouter
+from app.core.auth import password_executor
+from app.core.catalog_snapshot import catalog_snapshot
+from app.core.response_cache import response_cache
+from app.core.token_cache import verified_tokens
 
 router = APIRouter()
 
 @router.get("/")
 def health_check():
-    return {"status": "ok", "message": "API is running!"}
+    return {"status": "ok", "message": "API is running!", "response_cache": response_cache.stats(),
+            "catalog_snapshot": catalog_snapshot.stats(), "token_cache": verified_tokens.stats(),
+            "password_executor": password_executor.stats()}
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, status, HTTPException
+from typing import Literal
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, status, HTTPException
 from app.core.auth import get_current_user
-from app.services.scrapper.scrapper_service import run_scraping
+from app.services.scrapper.scrapper_service import run_scraping, PARSE_WORKERS
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,10 +14,16 @@ router = APIRouter(
     status_code=status.HTTP_202_ACCEPTED,
 )
 async def trigger_scraping(
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    mode: Literal["sequential", "async"] = Query("sequential", description="Crawl mode"),
+    incremental: bool = Query(False, description="Skip book pages unchanged since the last scrape"),
+    listing_only: bool = Query(False, description="Build books from category listing pages only"),
+    streaming: bool = Query(False, description="Write books to the database in batches while scraping"),
+    parse_workers: int = Query(PARSE_WORKERS, ge=0, le=32, description="Worker processes for HTML parsing in async mode")
 ):
     try:
-        background_tasks.add_task(run_scraping)
+        background_tasks.add_task(run_scraping, mode, incremental, listing_only=listing_only, streaming=streaming,
+                                  parse_workers=parse_workers)
         return {"message": "Scraping agendado com sucesso."}
     except Exception as e:
         raise HTTPException(
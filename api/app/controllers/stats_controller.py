@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+import json
+from fastapi import APIRouter, Depends, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Dict, Any
-from app.core.database import get_db
+from app.core.database import get_async_read_db
 from app.core.auth import get_current_user
+from app.core.response_cache import CachedResponse, cached_response
 from app.services.stats_service import get_overview_stats, get_category_stats
 import logging
 
@@ -17,15 +19,17 @@ router = APIRouter(
             response_model=Dict[str, Any],
             status_code=status.HTTP_200_OK
             )
-async def stats_overview(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def stats_overview(request: Request, db: AsyncSession = Depends(get_async_read_db)) -> Dict[str, Any]:
     logger.info("Endpoint /stats/overview accessed - Getting general book statistics")
-    return get_overview_stats(db)
+    return await cached_response(request, db,
+                                 lambda session: CachedResponse(json.dumps(get_overview_stats(session)).encode()))
 
 
 @router.get("/categories",
             response_model=List[Dict[str, Any]],
             status_code=status.HTTP_200_OK
             )
-async def stats_by_category(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+async def stats_by_category(request: Request, db: AsyncSession = Depends(get_async_read_db)) -> List[Dict[str, Any]]:
     logger.info("Endpoint /stats/categories accessed - Getting statistics per book category")
-    return get_category_stats(db)
+    return await cached_response(request, db,
+                                 lambda session: CachedResponse(json.dumps(get_category_stats(session)).encode()))
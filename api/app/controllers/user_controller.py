@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.user_schema import UserCreate, UserOut
-from app.core.database import get_db
+from app.core.database import get_db, get_async_read_db
 from app.services import user_service
 from app.core.auth import (
     authenticate_user,
@@ -15,11 +16,12 @@ from app.core.auth import (
 router = APIRouter()
 
 @router.post("/", response_model=UserCreate)
-async def create_user(user: UserCreate, db: Session = Depends(get_db)):
-    db_user = user_service.get_user_by_username(db, user.username)
+async def create_user(user: UserCreate, read_db: AsyncSession = Depends(get_async_read_db),
+                      db: Session = Depends(get_db)):
+    db_user = await user_service.get_user_by_username_async(read_db, user.username)
     if db_user:
         raise HTTPException(status_code=409, detail="User already exists.")
-    user_service.create_user(db, user)
+    await user_service.create_user_async(db, user)
     return user
 
 @router.get("/me", response_model=UserOut)
@@ -0,0 +1,51 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+from app.exceptions.custom_exceptions import ExecutorSaturatedException
+
+
+class BoundedExecutor:
+
+    def __init__(self, max_workers: int, queue_limit: int, thread_name_prefix: str = "", niceness: int = 0):
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.niceness = niceness
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix,
+                                            initializer=self._lower_priority)
+        self._lock = threading.Lock()
+
+    def _lower_priority(self):
+        # On Linux the nice value is per thread, so the event loop keeps its priority
+        if self.niceness and hasattr(os, "setpriority"):
+            try:
+                os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), self.niceness)
+            except OSError:
+                pass
+
+    async def run(self, fn: Callable, *args) -> Any:
+        with self._lock:
+            if self.in_flight >= self.max_workers + self.queue_limit:
+                self.rejected += 1
+                raise ExecutorSaturatedException()
+            self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.completed += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queue_limit": self.queue_limit,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
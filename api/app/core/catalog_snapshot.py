@@ -0,0 +1,153 @@
+import asyncio
+import time
+import logging
+import numpy as np
+from typing import Dict, List, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.response_cache import dataset_version
+from app.entities.book_entity import Book
+from app.schemas.book_schema import BookSchema
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_COLUMNS = (Book.id, Book.title, Book.price, Book.availability, Book.rating, Book.rating_value,
+                    Book.category, Book.image_url)
+
+
+class CatalogSnapshot:
+
+    def __init__(self, rows, version: int):
+        self.version = version
+        self.load_ms = 0.0
+        self.books = [BookSchema.model_construct(**row._mapping) for row in rows]
+        count = len(rows)
+
+        self.ids = np.fromiter((row.id for row in rows), dtype=np.int64, count=count)
+        self.prices = np.fromiter((row.price for row in rows), dtype=np.float64, count=count)
+        self.ratings = np.fromiter((row.rating_value for row in rows), dtype=np.int8, count=count)
+        self.categories, self.category_codes = np.unique(
+            np.array([row.category for row in rows], dtype=object), return_inverse=True
+        )
+        self.availabilities, self.availability_codes = np.unique(
+            np.array([row.availability.lower() for row in rows], dtype=object), return_inverse=True
+        )
+        _, title_ranks = np.unique(np.array([row.title for row in rows], dtype=object), return_inverse=True)
+
+        self.price_order = np.lexsort((self.ids, self.prices))
+        self.sorted_prices = self.prices[self.price_order]
+        by_rating = -self.ratings.astype(np.int16)
+        self.top_rated_orders = {
+            None: np.lexsort((self.ids, by_rating)),
+            "price": np.lexsort((self.ids, self.prices, by_rating)),
+            "-price": np.lexsort((self.ids, -self.prices, by_rating)),
+            "title": np.lexsort((self.ids, title_ranks, by_rating)),
+            "-title": np.lexsort((self.ids, -title_ranks, by_rating)),
+        }
+
+    @classmethod
+    def load(cls, db: Session, version: int) -> "CatalogSnapshot":
+        started_at = time.perf_counter()
+        rows = db.execute(select(*SNAPSHOT_COLUMNS).order_by(Book.id)).all()
+        snapshot = cls(rows, version)
+        snapshot.load_ms = (time.perf_counter() - started_at) * 1000
+        logger.info(f"Loaded catalog snapshot v{version}: {len(rows)} books in {snapshot.load_ms:.1f} ms")
+        return snapshot
+
+    def __len__(self) -> int:
+        return len(self.books)
+
+    def _page(self, positions: np.ndarray, after_id: Optional[int], limit: Optional[int]) -> List[BookSchema]:
+        if after_id is not None:
+            positions = positions[np.searchsorted(self.ids[positions], after_id, side="right"):]
+        if limit is not None:
+            positions = positions[:limit]
+        return [self.books[position] for position in positions]
+
+    @staticmethod
+    def _code(values: np.ndarray, value: str) -> Optional[int]:
+        code = np.searchsorted(values, value)
+        if code == len(values) or values[code] != value:
+            return None
+        return code
+
+    def price_range(self, min_price: float, max_price: float, category: Optional[str] = None,
+                    min_rating: Optional[int] = None, availability: Optional[str] = None,
+                    after_id: Optional[int] = None, limit: Optional[int] = None) -> List[BookSchema]:
+        start = np.searchsorted(self.sorted_prices, min_price, side="left")
+        stop = np.searchsorted(self.sorted_prices, max_price, side="right")
+        positions = np.sort(self.price_order[start:stop])
+
+        if category is not None:
+            code = self._code(self.categories, category)
+            if code is None:
+                return []
+            positions = positions[self.category_codes[positions] == code]
+        if availability is not None:
+            code = self._code(self.availabilities, availability.lower())
+            if code is None:
+                return []
+            positions = positions[self.availability_codes[positions] == code]
+        if min_rating is not None:
+            positions = positions[self.ratings[positions] >= min_rating]
+        return self._page(positions, after_id, limit)
+
+    def top_rated(self, limit: int = 10, then_by: Optional[str] = None) -> List[BookSchema]:
+        order = self.top_rated_orders[then_by]
+        return [self.books[position] for position in (order if limit < 0 else order[:limit])]
+
+
+class CatalogSnapshotHolder:
+
+    def __init__(self):
+        self._snapshot = None
+        self._loading = None
+
+    def _swap(self, snapshot: CatalogSnapshot) -> CatalogSnapshot:
+        current = self._snapshot
+        if current is None or current.version <= snapshot.version:
+            self._snapshot = snapshot
+        return snapshot
+
+    def get(self, db: Session) -> CatalogSnapshot:
+        version = dataset_version.get(db)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        return self._swap(CatalogSnapshot.load(db, version))
+
+    async def get_async(self, db: AsyncSession) -> CatalogSnapshot:
+        version = await db.run_sync(dataset_version.get)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        # Single flight: concurrent requests wait for the reload already in progress
+        if self._loading is not None:
+            return await self._loading
+        loading = self._loading = asyncio.get_running_loop().create_future()
+        try:
+            snapshot = self._swap(await db.run_sync(CatalogSnapshot.load, version))
+            loading.set_result(snapshot)
+            return snapshot
+        except BaseException as e:
+            loading.set_exception(e)
+            loading.exception()
+            raise
+        finally:
+            self._loading = None
+
+    def clear(self):
+        self._snapshot = None
+        self._loading = None
+
+    def stats(self) -> Dict[str, float]:
+        snapshot = self._snapshot
+        if snapshot is None:
+            return {"loaded": False}
+        return {"loaded": True, "version": snapshot.version, "books": len(snapshot),
+                "load_ms": round(snapshot.load_ms, 2)}
+
+
+catalog_snapshot = CatalogSnapshotHolder()
@@ -0,0 +1,135 @@
+import gzip
+import os
+import zlib
+import brotli
+from typing import Dict, Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 5))
+
+ENCODERS = {
+    "br": lambda body: brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY),
+    "gzip": lambda body: gzip.compress(body, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0),
+}
+
+
+def _brotli_stream():
+    compressor = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+    return compressor.process, compressor.finish
+
+
+def _gzip_stream():
+    compressor = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress, compressor.flush
+
+
+# Incremental encoders for responses compressed on the way out, returning (process, finish)
+STREAM_ENCODERS = {"br": _brotli_stream, "gzip": _gzip_stream}
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    if not accept_encoding:
+        return None
+
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    default = weights.get("*", 0.0)
+    candidates = [(weights.get(name, default), -preference, name)
+                  for preference, name in enumerate(ENCODERS)]
+    weight, _, name = max(candidates)
+    return name if weight > 0 else None
+
+
+def compress_variants(body: bytes) -> Dict[str, bytes]:
+    if len(body) < COMPRESSION_MIN_SIZE:
+        return {}
+    variants = {name: encode(body) for name, encode in ENCODERS.items()}
+    return {name: data for name, data in variants.items() if len(data) < len(body)}
+
+
+# Compresses responses not served from the cache, including streamed ones, with the negotiated encoding
+class CompressionMiddleware:
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+            if encoding in STREAM_ENCODERS:
+                responder = CompressionResponder(self.app, encoding, self.minimum_size)
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+class CompressionResponder:
+
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send = None
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+        self.process, self.finish = STREAM_ENCODERS[encoding]()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    def _encode(self, body: bytes, more_body: bool) -> bytes:
+        return self.process(body) if more_body else self.process(body) + self.finish()
+
+    async def send_compressed(self, message: Message):
+        if message["type"] == "http.response.start":
+            # Hold the headers until the first body chunk tells whether to compress
+            self.initial_message = message
+            self.passthrough = "content-encoding" in Headers(raw=message["headers"])
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            if not self.started and self.initial_message:
+                self.started = True
+                await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.started:
+            message["body"] = self._encode(body, more_body)
+            await self.send(message)
+            return
+
+        self.started = True
+        if len(body) < self.minimum_size and not more_body:
+            self.passthrough = True
+            await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        message["body"] = self._encode(body, more_body)
+        headers = MutableHeaders(raw=self.initial_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if more_body:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(len(message["body"]))
+        await self.send(self.initial_message)
+        await self.send(message)
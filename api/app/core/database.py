@@ -1,15 +1,20 @@
 import os
 import logging
+import sqlite3
+from typing import List
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy import event
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-db_path = os.path.join(os.path.dirname(__file__), "data", "data.db")
+db_path = os.getenv("SQLITE_DATABASE_PATH", os.path.join(os.path.dirname(__file__), "data", "data.db"))
 SQLALCHEMY_DATABASE_URL = f"sqlite:///{db_path}"
+SQLALCHEMY_ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{db_path}"
 logger.info(f"Using database at: {db_path}")
 logger.info(f"File exists: {os.path.exists(db_path)}")
 
@@ -18,18 +23,104 @@ if not os.path.exists(db_dir):
     os.makedirs(db_dir)
     logger.info(f"Database directory created: {db_dir}")
 
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", -64000))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", 268435456))
+SQLITE_TEMP_STORE = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+SQLITE_BUSY_TIMEOUT = int(os.getenv("SQLITE_BUSY_TIMEOUT", 5000))
+READ_POOL_SIZE = int(os.getenv("SQLITE_READ_POOL_SIZE", 8))
+READ_MAX_OVERFLOW = int(os.getenv("SQLITE_READ_MAX_OVERFLOW", 8))
+WRITE_POOL_SIZE = int(os.getenv("SQLITE_WRITE_POOL_SIZE", 2))
+WRITE_MAX_OVERFLOW = int(os.getenv("SQLITE_WRITE_MAX_OVERFLOW", 2))
+
+
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.close()
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    echo=False
-)
+
+def storage_pragmas(read_only: bool = False) -> List[str]:
+    pragmas = [
+        f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT}",
+        f"PRAGMA cache_size={SQLITE_CACHE_SIZE}",
+        f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+        f"PRAGMA temp_store={SQLITE_TEMP_STORE}",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+    else:
+        pragmas.append(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+    return pragmas
+
+
+def is_writable(path: str) -> bool:
+    # WAL needs to create the -wal and -shm files next to the database
+    return os.access(path, os.W_OK) and os.access(os.path.dirname(os.path.abspath(path)), os.W_OK)
+
+
+def set_journal_mode(dbapi_connection, path: str):
+    if not is_writable(path):
+        logger.warning(f"Database at {path} is read-only, keeping its journal mode")
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Could not set journal_mode={SQLITE_JOURNAL_MODE}: {str(e)}")
+    finally:
+        cursor.close()
+
+
+def attach_storage_pragmas(sqlite_engine: Engine, read_only: bool = False):
+    pragmas = storage_pragmas(read_only)
+    path = sqlite_engine.url.database
+
+    @event.listens_for(sqlite_engine, "connect")
+    def set_storage_pragmas(dbapi_connection, connection_record):
+        if not read_only:
+            set_journal_mode(dbapi_connection, path)
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def create_sqlite_engine(url: str, read_only: bool = False, pool_size: int = 5, max_overflow: int = 10) -> Engine:
+    sqlite_engine = create_engine(
+        url,
+        connect_args={"check_same_thread": False},
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        echo=False
+    )
+    attach_storage_pragmas(sqlite_engine, read_only)
+    return sqlite_engine
+
+
+def create_async_sqlite_engine(url: str, read_only: bool = False, pool_size: int = 5,
+                               max_overflow: int = 10) -> AsyncEngine:
+    async_engine = create_async_engine(
+        url,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        echo=False
+    )
+    attach_storage_pragmas(async_engine.sync_engine, read_only)
+    return async_engine
+
+
+engine = create_sqlite_engine(SQLALCHEMY_DATABASE_URL, pool_size=WRITE_POOL_SIZE, max_overflow=WRITE_MAX_OVERFLOW)
+read_engine = create_sqlite_engine(SQLALCHEMY_DATABASE_URL, read_only=True,
+                                   pool_size=READ_POOL_SIZE, max_overflow=READ_MAX_OVERFLOW)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+async_read_engine = create_async_sqlite_engine(SQLALCHEMY_ASYNC_DATABASE_URL, read_only=True,
+                                               pool_size=READ_POOL_SIZE, max_overflow=READ_MAX_OVERFLOW)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 def get_db():
@@ -41,3 +132,21 @@ def get_db():
         raise
     finally:
         db.close()
+
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    except Exception as e:
+        logger.error(f"Error in database session: {str(e)}")
+        raise
+    finally:
+        db.close()
+
+async def get_async_read_db():
+    async with AsyncReadSessionLocal() as db:
+        try:
+            yield db
+        except Exception as e:
+            logger.error(f"Error in database session: {str(e)}")
+            raise
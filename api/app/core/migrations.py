@@ -0,0 +1,131 @@
+import csv
+import glob
+import logging
+import os
+from sqlalchemy import String, inspect, text
+from sqlalchemy.engine import Engine
+from app.entities.book_entity import Book, ADOPT_LEGACY_BOOK_SQL, BOOKS_FTS_DDL, RATING_VALUES
+from app.entities.category_stats_entity import CategoryStats, CATEGORY_STATS_REBUILD_SQL, CATEGORY_STATS_TRIGGERS_DDL
+
+logger = logging.getLogger(__name__)
+
+LEGACY_CSV_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+def _rebuild_derived_tables(conn):
+    conn.execute(text("INSERT INTO books_fts(books_fts) VALUES ('rebuild')"))
+    for statement in CATEGORY_STATS_REBUILD_SQL:
+        conn.execute(text(statement))
+
+
+def _rebuild_books_table(conn, columns, select_expressions):
+    conn.execute(text("ALTER TABLE books RENAME TO books_old"))
+    for index in inspect(conn).get_indexes('books_old'):
+        conn.execute(text(f'DROP INDEX "{index["name"]}"'))
+    triggers = conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'books_old'"))
+    for trigger in triggers.scalars().all():
+        conn.execute(text(f'DROP TRIGGER "{trigger}"'))
+
+    CategoryStats.__table__.create(conn, checkfirst=True)
+    Book.__table__.create(conn)
+    names = [column.name for column in Book.__table__.columns if column.name in columns]
+    select_list = ", ".join(select_expressions.get(name, name) for name in names)
+    conn.execute(text(f"INSERT INTO books ({', '.join(names)}) SELECT {select_list} FROM books_old"))
+    conn.execute(text("DROP TABLE books_old"))
+    _rebuild_derived_tables(conn)
+
+
+def _add_book_url(conn, columns):
+    if 'book_url' not in columns:
+        logger.info("Adding books.book_url column...")
+        conn.execute(text("ALTER TABLE books ADD COLUMN book_url VARCHAR"))
+    conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ix_books_book_url ON books (book_url)"))
+
+
+def _backfill_book_url(conn, columns):
+    if conn.execute(text("SELECT 1 FROM books WHERE book_url IS NULL LIMIT 1")).first() is None:
+        return
+
+    backfilled = 0
+    for path in sorted(glob.glob(os.path.join(LEGACY_CSV_DIR, "books_data_*.csv")), reverse=True):
+        with open(path, newline='', encoding='utf-8') as file:
+            rows = [row for row in csv.DictReader(file) if row.get('book_url')]
+        if rows:
+            backfilled += conn.execute(text(ADOPT_LEGACY_BOOK_SQL), rows).rowcount
+    if backfilled:
+        logger.info(f"Backfilled books.book_url for {backfilled} legacy records from scraped CSV files")
+
+
+def _numeric_price(conn, columns):
+    if not isinstance(columns['price']['type'], String):
+        return
+
+    logger.info("Converting books.price to a numeric column...")
+    _rebuild_books_table(conn, columns, {'price': "CAST(price AS REAL)"})
+
+
+def _add_rating_value(conn, columns):
+    if 'rating_value' not in columns:
+        logger.info("Adding books.rating_value column...")
+        conn.execute(text("ALTER TABLE books ADD COLUMN rating_value INTEGER NOT NULL DEFAULT 0"))
+
+    cases = " ".join(f"WHEN '{rating}' THEN {value}" for rating, value in RATING_VALUES.items())
+    ratings = ", ".join(f"'{rating}'" for rating in RATING_VALUES)
+    pending = f"WHERE rating_value = 0 AND rating IN ({ratings})"
+    if conn.execute(text(f"SELECT 1 FROM books {pending} LIMIT 1")).first() is not None:
+        conn.execute(text(f"UPDATE books SET rating_value = CASE rating {cases} END {pending}"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_books_rating_value_id ON books (rating_value DESC, id)"))
+
+
+def _add_search_index(conn, columns):
+    if inspect(conn).has_table('books_fts'):
+        return
+
+    logger.info("Creating books_fts full-text index...")
+    for statement in BOOKS_FTS_DDL:
+        conn.execute(text(statement))
+    conn.execute(text("INSERT INTO books_fts(books_fts) VALUES ('rebuild')"))
+
+
+def _add_category_stats(conn, columns):
+    installed = conn.execute(text(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'books_stats_%'"
+    )).scalar_one()
+    if installed == len(CATEGORY_STATS_TRIGGERS_DDL):
+        return
+
+    logger.info("Building category_stats summary table...")
+    CategoryStats.__table__.create(conn, checkfirst=True)
+    for statement in CATEGORY_STATS_TRIGGERS_DDL:
+        conn.execute(text(statement))
+    for statement in CATEGORY_STATS_REBUILD_SQL:
+        conn.execute(text(statement))
+
+
+# PRAGMA user_version records how many of these have been applied, so new migrations go at the end
+MIGRATIONS = [
+    _add_book_url,
+    _backfill_book_url,
+    _numeric_price,
+    _add_rating_value,
+    _add_search_index,
+    _add_category_stats,
+]
+
+
+def schema_version(bind: Engine) -> int:
+    with bind.connect() as conn:
+        return conn.execute(text("PRAGMA user_version")).scalar_one()
+
+
+def run_migrations(bind: Engine):
+    applied = schema_version(bind)
+    if applied >= len(MIGRATIONS) or not inspect(bind).has_table('books'):
+        return
+
+    with bind.begin() as conn:
+        for migration in MIGRATIONS[applied:]:
+            columns = {column['name']: column for column in inspect(conn).get_columns('books')}
+            migration(conn, columns)
+        conn.execute(text(f"PRAGMA user_version = {len(MIGRATIONS)}"))
+    logger.info(f"Database schema migrated from version {applied} to {len(MIGRATIONS)}")
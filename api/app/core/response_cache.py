@@ -0,0 +1,172 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+from urllib.parse import urlencode
+from fastapi import Request, Response
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.compression import compress_variants, negotiate_encoding
+from app.entities.dataset_version_entity import DatasetVersion
+
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+DATASET_VERSION_CHECK_INTERVAL = float(os.getenv("DATASET_VERSION_CHECK_INTERVAL", 1.0))
+RESPONSE_CACHE_CONTROL = os.getenv("RESPONSE_CACHE_CONTROL", "no-cache")
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    media_type: str = "application/json"
+    encodings: Dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return (len(self.body) + sum(len(k) + len(v) for k, v in self.headers.items())
+                + sum(len(data) for data in self.encodings.values()))
+
+    def to_response(self, encoding: Optional[str] = None) -> Response:
+        if not self.encodings:
+            return Response(content=self.body, headers=self.headers, media_type=self.media_type)
+        headers = {**self.headers, "Vary": "Accept-Encoding"}
+        if encoding not in self.encodings:
+            return Response(content=self.body, headers=headers, media_type=self.media_type)
+        headers["Content-Encoding"] = encoding
+        return Response(content=self.encodings[encoding], headers=headers, media_type=self.media_type)
+
+
+class ResponseCache:
+
+    def __init__(self, max_bytes: int = RESPONSE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: CachedResponse):
+        if entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous.size
+            self._entries[key] = entry
+            self.current_bytes += entry.size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class DatasetVersionTracker:
+
+    def __init__(self, check_interval: float = DATASET_VERSION_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._version = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> int:
+        now = time.monotonic()
+        if self._version is not None and now - self._checked_at < self.check_interval:
+            return self._version
+
+        version = db.execute(select(DatasetVersion.version).where(DatasetVersion.id == 1)).scalar()
+        with self._lock:
+            self._version = version or 0
+            self._checked_at = now
+        return self._version
+
+    def bump(self, db: Session):
+        db.execute(text(
+            "INSERT INTO dataset_version (id, version) VALUES (1, 1) "
+            "ON CONFLICT (id) DO UPDATE SET version = version + 1"
+        ))
+        self.invalidate()
+
+    def invalidate(self):
+        with self._lock:
+            self._version = None
+
+
+response_cache = ResponseCache()
+dataset_version = DatasetVersionTracker()
+
+
+def cache_key(request: Request, version: int) -> str:
+    params = sorted((key, value) for key, value in request.query_params.multi_items() if value != "")
+    return f"{version}:{request.url.path}?{urlencode(params)}"
+
+
+def etag_for(key: str) -> str:
+    return f'"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+async def cached_response(request: Request, db: AsyncSession,
+                          render: Callable[[Session], CachedResponse]) -> Response:
+    key = cache_key(request, await db.run_sync(dataset_version.get))
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    etag = etag_for(key)
+    validators = {"ETag": f"W/{etag}" if encoding else etag, "Cache-Control": RESPONSE_CACHE_CONTROL,
+                  "Vary": "Accept-Encoding"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=validators)
+
+    entry = response_cache.get(key)
+    if entry is None:
+        entry = await db.run_sync(render)
+        entry.encodings = await run_in_threadpool(compress_variants, entry.body)
+        response_cache.put(key, entry)
+
+    response = entry.to_response(encoding)
+    response.headers.update(validators)
+    return response
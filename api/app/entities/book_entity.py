@@ -1,22 +1,72 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, DDL, Float, Index, Integer, String, event
+from sqlalchemy.orm import validates
 from app.core.database import Base
 import logging
 
 logger = logging.getLogger(__name__)
 
+RATING_VALUES = {
+    "One": 1,
+    "Two": 2,
+    "Three": 3,
+    "Four": 4,
+    "Five": 5
+}
+
+BOOKS_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5("
+    "title, category, content='books', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER IF NOT EXISTS books_fts_ai AFTER INSERT ON books BEGIN "
+    "INSERT INTO books_fts(rowid, title, category) VALUES (new.id, new.title, new.category); END",
+    "CREATE TRIGGER IF NOT EXISTS books_fts_ad AFTER DELETE ON books BEGIN "
+    "INSERT INTO books_fts(books_fts, rowid, title, category) VALUES ('delete', old.id, old.title, old.category); END",
+    "CREATE TRIGGER IF NOT EXISTS books_fts_au AFTER UPDATE OF title, category ON books BEGIN "
+    "INSERT INTO books_fts(books_fts, rowid, title, category) VALUES ('delete', old.id, old.title, old.category); "
+    "INSERT INTO books_fts(rowid, title, category) VALUES (new.id, new.title, new.category); END",
+)
+
+ADOPT_LEGACY_BOOK_SQL = (
+    "UPDATE books SET book_url = :book_url WHERE id = ("
+    "SELECT id FROM books WHERE book_url IS NULL AND title = :title AND category = :category "
+    "ORDER BY image_url IS :image_url DESC, id LIMIT 1) "
+    "AND NOT EXISTS (SELECT 1 FROM books WHERE book_url = :book_url)"
+)
+
+
+def rating_to_value(rating: str) -> int:
+    return RATING_VALUES.get(rating, 0)
+
+
 class Book(Base):
     __tablename__ = "books"
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False, index=True)
-    price = Column(String, nullable=False)
+    price = Column(Float, nullable=False, index=True)
     availability = Column(String, nullable=False)
     rating = Column(String, nullable=True)
+    rating_value = Column(Integer, nullable=False, default=0, server_default="0")
     category = Column(String, nullable=False, index=True)
     image_url = Column(String, nullable=True)
+    book_url = Column(String, nullable=True, unique=True, index=True)
+
+    __table_args__ = (
+        Index("ix_books_rating_value_id", rating_value.desc(), id),
+    )
+
+    @validates("rating")
+    def _set_rating_value(self, key, rating):
+        self.rating_value = rating_to_value(rating)
+        return rating
     
     def __repr__(self):
         return f"<Book(id={self.id}, title='{self.title}', category='{self.category}')>"
         
     def __str__(self):
         return f"Book: {self.title} (ID: {self.id})"
+
+
+for statement in BOOKS_FTS_DDL:
+    event.listen(Book.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(Book.__table__, "before_drop", DDL("DROP TABLE IF EXISTS books_fts").execute_if(dialect="sqlite"))
@@ -0,0 +1,72 @@
+from sqlalchemy import Column, DDL, Float, Integer, String, event
+from app.core.database import Base
+from app.entities.book_entity import Book, RATING_VALUES
+
+RATING_BUCKETS = range(0, max(RATING_VALUES.values()) + 1)
+RATING_COLUMNS = ", ".join(f"rating_{value}" for value in RATING_BUCKETS)
+
+
+class CategoryStats(Base):
+    __tablename__ = "category_stats"
+
+    category = Column(String, primary_key=True)
+    book_count = Column(Integer, nullable=False, default=0)
+    price_sum = Column(Float, nullable=False, default=0.0)
+    min_price = Column(Float, nullable=True)
+    max_price = Column(Float, nullable=True)
+    rating_0 = Column(Integer, nullable=False, default=0)
+    rating_1 = Column(Integer, nullable=False, default=0)
+    rating_2 = Column(Integer, nullable=False, default=0)
+    rating_3 = Column(Integer, nullable=False, default=0)
+    rating_4 = Column(Integer, nullable=False, default=0)
+    rating_5 = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<CategoryStats(category='{self.category}', book_count={self.book_count})>"
+
+
+def _add_book_sql(row: str) -> str:
+    ratings = ", ".join(f"{row}.rating_value = {value}" for value in RATING_BUCKETS)
+    rating_updates = ", ".join(f"rating_{value} = rating_{value} + excluded.rating_{value}" for value in RATING_BUCKETS)
+    return (
+        f"INSERT INTO category_stats (category, book_count, price_sum, min_price, max_price, {RATING_COLUMNS}) "
+        f"VALUES ({row}.category, 1, {row}.price, {row}.price, {row}.price, {ratings}) "
+        "ON CONFLICT (category) DO UPDATE SET "
+        "book_count = book_count + 1, price_sum = price_sum + excluded.price_sum, "
+        "min_price = MIN(min_price, excluded.min_price), max_price = MAX(max_price, excluded.max_price), "
+        f"{rating_updates};"
+    )
+
+
+def _remove_book_sql(row: str) -> str:
+    rating_updates = ", ".join(f"rating_{value} = rating_{value} - ({row}.rating_value = {value})"
+                               for value in RATING_BUCKETS)
+    return (
+        "UPDATE category_stats SET "
+        f"book_count = book_count - 1, price_sum = price_sum - {row}.price, {rating_updates}, "
+        f"min_price = CASE WHEN {row}.price <= min_price "
+        f"THEN (SELECT MIN(price) FROM books WHERE category = {row}.category) ELSE min_price END, "
+        f"max_price = CASE WHEN {row}.price >= max_price "
+        f"THEN (SELECT MAX(price) FROM books WHERE category = {row}.category) ELSE max_price END "
+        f"WHERE category = {row}.category; "
+        f"DELETE FROM category_stats WHERE category = {row}.category AND book_count <= 0;"
+    )
+
+
+CATEGORY_STATS_TRIGGERS_DDL = (
+    f"CREATE TRIGGER IF NOT EXISTS books_stats_ai AFTER INSERT ON books BEGIN {_add_book_sql('new')} END",
+    f"CREATE TRIGGER IF NOT EXISTS books_stats_ad AFTER DELETE ON books BEGIN {_remove_book_sql('old')} END",
+    "CREATE TRIGGER IF NOT EXISTS books_stats_au AFTER UPDATE OF price, category, rating_value ON books BEGIN "
+    f"{_remove_book_sql('old')} {_add_book_sql('new')} END",
+)
+
+CATEGORY_STATS_REBUILD_SQL = (
+    "DELETE FROM category_stats",
+    f"INSERT INTO category_stats (category, book_count, price_sum, min_price, max_price, {RATING_COLUMNS}) "
+    "SELECT category, COUNT(*), SUM(price), MIN(price), MAX(price), "
+    + ", ".join(f"SUM(rating_value = {value})" for value in RATING_BUCKETS)
+    + " FROM books GROUP BY category",
+)
+
+for statement in CATEGORY_STATS_TRIGGERS_DDL:
+    event.listen(Book.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
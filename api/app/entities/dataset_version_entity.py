@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer
+from app.core.database import Base
+
+
+class DatasetVersion(Base):
+    __tablename__ = "dataset_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<DatasetVersion(version={self.version})>"
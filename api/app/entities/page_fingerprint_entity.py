@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String
+from app.core.database import Base
+
+
+class PageFingerprint(Base):
+    __tablename__ = "page_fingerprints"
+
+    url = Column(String, primary_key=True)
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    content_hash = Column(String, nullable=False)
+
+    def __repr__(self):
+        return f"<PageFingerprint(url='{self.url}', etag='{self.etag}')>"
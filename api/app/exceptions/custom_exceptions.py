@@ -17,4 +17,9 @@ class DatabaseException(CustomException):
     def __init__(self, original_error: Exception = None):
         self.original_error = original_error
         message = "An unexpected error occurred while accessing the database."
+        super().__init__(message)
+
+class ExecutorSaturatedException(CustomException):
+    def __init__(self):
+        message = "Server is busy processing other requests, try again later."
         super().__init__(message)
\ No newline at end of file
@@ -1,8 +1,10 @@
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.token_schema import Token, RefreshTokenRequest
 from app.core.auth import (
     authenticate_user,
+    authenticate_user_async,
     create_access_token,
     create_refresh_token,
     refresh_access_token
@@ -14,7 +16,10 @@ def login_for_access_token(
     username: str,
     password: str
 ) -> Token:
-    user = authenticate_user(db, username, password)
+    return issue_tokens(authenticate_user(db, username, password))
+
+
+def issue_tokens(user) -> Token:
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -37,3 +42,11 @@ def refresh_token_service(
 ) -> Token:
     tokens = refresh_access_token(refresh_token, db)
     return Token(**tokens)
+
+
+async def login_for_access_token_async(db: AsyncSession, username: str, password: str) -> Token:
+    return issue_tokens(await authenticate_user_async(db, username, password))
+
+
+async def refresh_token_service_async(refresh_token: str, db: AsyncSession) -> Token:
+    return await db.run_sync(lambda session: refresh_token_service(refresh_token, session))
@@ -1,16 +1,71 @@
-from sqlalchemy.orm import Session
+import re
+from sqlalchemy import select, text
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import cast, Float
+from app.core.catalog_snapshot import CatalogSnapshot, catalog_snapshot
 from app.entities.book_entity import Book
+from app.schemas.book_schema import BookSchema
 from fastapi import HTTPException, status
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from app.exceptions.custom_exceptions import BookNotFoundException
+import logging
+
+logger = logging.getLogger(__name__)
+
+TOP_RATED_SECONDARY_SORTS = {
+    "price": Book.price.asc(),
+    "-price": Book.price.desc(),
+    "title": Book.title.asc(),
+    "-title": Book.title.desc(),
+}
+
+BOOK_COLUMNS = (Book.id, Book.title, Book.price, Book.availability, Book.rating, Book.category, Book.image_url)
+
+EXPORT_CHUNK_SIZE = 1000
+
+SEARCH_TITLE_WEIGHT = 10.0
+SEARCH_CATEGORY_WEIGHT = 1.0
+SEARCH_QUERY = text("""
+    WITH matches AS (
+        SELECT rowid AS id, bm25(books_fts, :title_weight, :category_weight) AS score
+        FROM books_fts
+        WHERE books_fts MATCH :match
+    )
+    SELECT id FROM matches
+    WHERE :after_id IS NULL
+       OR score > (SELECT score FROM matches WHERE id = :after_id)
+       OR (score = (SELECT score FROM matches WHERE id = :after_id) AND id > :after_id)
+    ORDER BY score, id
+    LIMIT :limit
+""")
+
+
+def paginate(query: Query, after_id: Optional[int] = None, limit: Optional[int] = None) -> Query:
+    query = query.order_by(Book.id)
+    if after_id is not None:
+        query = query.filter(Book.id > after_id)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def get_all_books(db: Session, after_id: Optional[int] = None, limit: Optional[int] = None) -> List[Book]:
+    try:
+        books = paginate(db.query(Book), after_id, limit).all()
+        return books
+
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error accessing the database: {str(e)}"
+        )
 
 
-def get_all_books(db: Session) -> List[Book]:
+def get_all_book_rows(db: Session, after_id: Optional[int] = None, limit: Optional[int] = None) -> List[Row]:
     try:
-        books = db.query(Book).all()
-        return books
+        return db.connection().execute(paginate(select(*BOOK_COLUMNS), after_id, limit)).all()
 
     except SQLAlchemyError as e:
         raise HTTPException(
@@ -19,17 +74,44 @@ def get_all_books(db: Session) -> List[Book]:
         )
 
 
-def get_books_by_title_and_category(db: Session, title: str = None, category: str = None) -> List[Book]:
+def iter_book_row_chunks(db: Session, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[List[Row]]:
     try:
-        query = db.query(Book)
+        result = db.execute(select(*BOOK_COLUMNS).order_by(Book.id).execution_options(yield_per=chunk_size))
+        for chunk in result.partitions():
+            yield chunk
+    except SQLAlchemyError as e:
+        logger.error(f"Error streaming books: {str(e)}")
+        raise
 
-        if title:
-            query = query.filter(Book.title.ilike(f"%{title}%"))
-        if category:
-            query = query.filter(Book.category.ilike(f"%{category}%"))
 
-        books = query.all()
-        return books
+def build_match_query(title: str = None, category: str = None) -> str:
+    terms = []
+    for column, value in (("title", title), ("category", category)):
+        for token in re.findall(r"\w+", value or ""):
+            terms.append(f'{column} : "{token}"*')
+    return " AND ".join(terms)
+
+
+def get_books_by_title_and_category(db: Session, title: str = None, category: str = None,
+                                    after_id: Optional[int] = None, limit: Optional[int] = None) -> List[Book]:
+    try:
+        if not title and not category:
+            return paginate(db.query(Book), after_id, limit).all()
+
+        match = build_match_query(title, category)
+        if not match:
+            return []
+
+        book_ids = db.execute(SEARCH_QUERY, {
+            "match": match,
+            "title_weight": SEARCH_TITLE_WEIGHT,
+            "category_weight": SEARCH_CATEGORY_WEIGHT,
+            "after_id": after_id,
+            "limit": -1 if limit is None else limit,
+        }).scalars().all()
+
+        books_by_id = {book.id: book for book in db.query(Book).filter(Book.id.in_(book_ids))}
+        return [books_by_id[book_id] for book_id in book_ids]
 
     except SQLAlchemyError as e:
         raise HTTPException(
@@ -53,35 +135,73 @@ def get_book_by_id(db: Session, book_id: int) -> Optional[Book]:
         )
 
 
-def get_top_rated_books(db: Session, limit: int = 10) -> List[Book]:
+def get_top_rated_books(db: Session, limit: int = 10, then_by: Optional[str] = None) -> List[Book]:
     try:
-        rating_map = {
-            "One": 1,
-            "Two": 2,
-            "Three": 3,
-            "Four": 4,
-            "Five": 5
-        }
-
-        books = db.query(Book).all()
-        books_sorted = sorted(
-            books,
-            key=lambda b: rating_map.get(b.rating, 0),
-            reverse=True
-        )
-        return books_sorted[:limit]
+        query = db.query(Book).order_by(Book.rating_value.desc())
+        if then_by:
+            query = query.order_by(TOP_RATED_SECONDARY_SORTS[then_by])
+
+        books = query.order_by(Book.id).limit(limit).all()
+        return books
     except SQLAlchemyError as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=f"Error fetching top-rated books: {str(e)}")
 
 
-def get_books_by_price_range(db: Session, min_price: float, max_price: float) -> List[Book]:
+def get_books_by_price_range(db: Session, min_price: float, max_price: float,
+                             after_id: Optional[int] = None, limit: Optional[int] = None) -> List[Book]:
     try:
-        books = db.query(Book).filter(
-            cast(Book.price, Float) >= min_price,
-            cast(Book.price, Float) <= max_price
-        ).all()
+        query = db.query(Book).filter(
+            Book.price >= min_price,
+            Book.price <= max_price
+        )
+        books = paginate(query, after_id, limit).all()
         return books
     except SQLAlchemyError as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail=f"Error fetching books by price range: {str(e)}")
+
+
+async def get_books_by_title_and_category_async(db: AsyncSession, title: str = None, category: str = None,
+                                                after_id: Optional[int] = None,
+                                                limit: Optional[int] = None) -> List[Book]:
+    return await db.run_sync(get_books_by_title_and_category, title, category, after_id, limit)
+
+
+async def get_book_by_id_async(db: AsyncSession, book_id: int) -> Optional[Book]:
+    return await db.run_sync(get_book_by_id, book_id)
+
+
+def get_catalog_snapshot(db: Session) -> CatalogSnapshot:
+    try:
+        return catalog_snapshot.get(db)
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error accessing the database: {str(e)}"
+        )
+
+
+async def get_catalog_snapshot_async(db: AsyncSession) -> CatalogSnapshot:
+    try:
+        return await catalog_snapshot.get_async(db)
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error accessing the database: {str(e)}"
+        )
+
+
+async def get_top_rated_books_async(db: AsyncSession, limit: int = 10,
+                                    then_by: Optional[str] = None) -> List[BookSchema]:
+    snapshot = await get_catalog_snapshot_async(db)
+    return snapshot.top_rated(limit, then_by)
+
+
+async def get_books_by_price_range_async(db: AsyncSession, min_price: float, max_price: float,
+                                         category: Optional[str] = None, min_rating: Optional[int] = None,
+                                         availability: Optional[str] = None, after_id: Optional[int] = None,
+                                         limit: Optional[int] = None) -> List[BookSchema]:
+    snapshot = await get_catalog_snapshot_async(db)
+    return snapshot.price_range(min_price, max_price, category=category, min_rating=min_rating,
+                                availability=availability, after_id=after_id, limit=limit)
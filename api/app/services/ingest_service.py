@@ -0,0 +1,81 @@
+import logging
+from typing import List, Dict, Any
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+from app.core.response_cache import dataset_version
+from app.entities.book_entity import Book, ADOPT_LEGACY_BOOK_SQL, rating_to_value
+
+logger = logging.getLogger(__name__)
+
+UPSERT_CHUNK_SIZE = 500
+UPSERT_COLUMNS = ('title', 'price', 'availability', 'rating', 'rating_value', 'category', 'image_url')
+
+
+def _book_row(book: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'title': book.get("title", ""),
+        'price': float(book.get("price", 0)),
+        'category': book.get("category", ""),
+        'rating': book.get("rating", ""),
+        'rating_value': rating_to_value(book.get("rating", "")),
+        'availability': book.get("availability", ""),
+        'image_url': book.get("image_url", ""),
+        'book_url': book.get("book_url") or None,
+    }
+
+
+def _upsert_chunk(db: Session, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+    urls = [row['book_url'] for row in rows]
+    existing = db.execute(
+        select(func.count()).select_from(Book).where(Book.book_url.in_(urls))
+    ).scalar_one()
+
+    stmt = insert(Book.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Book.book_url],
+        set_={column: stmt.excluded[column] for column in UPSERT_COLUMNS},
+        where=or_(*(Book.__table__.c[column].is_distinct_from(stmt.excluded[column]) for column in UPSERT_COLUMNS))
+    )
+    changed = db.connection().execute(stmt, rows).rowcount
+
+    inserted = len(rows) - existing
+    updated = changed - inserted
+    return {'inserted': inserted, 'updated': updated, 'unchanged': existing - updated}
+
+
+def upsert_books(db: Session, books_data: List[Dict[str, Any]], chunk_size: int = UPSERT_CHUNK_SIZE) -> Dict[str, int]:
+    counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+
+    keyed = {}
+    unkeyed = []
+    for book in books_data:
+        row = _book_row(book)
+        if row['book_url']:
+            keyed[row['book_url']] = row
+        else:
+            unkeyed.append(row)
+
+    rows = list(keyed.values())
+    if rows and db.execute(select(Book.id).where(Book.book_url.is_(None)).limit(1)).first() is not None:
+        adopted = db.connection().execute(text(ADOPT_LEGACY_BOOK_SQL), rows).rowcount
+        logger.info(f"Assigned book_url to {adopted} legacy records without one")
+
+    for start in range(0, len(rows), chunk_size):
+        chunk_counts = _upsert_chunk(db, rows[start:start + chunk_size])
+        for key, value in chunk_counts.items():
+            counts[key] += value
+
+    if unkeyed:
+        logger.warning(f"{len(unkeyed)} records without book_url inserted without deduplication")
+        db.connection().execute(insert(Book.__table__), unkeyed)
+        counts['inserted'] += len(unkeyed)
+
+    if counts['inserted'] or counts['updated']:
+        dataset_version.bump(db)
+    db.commit()
+    dataset_version.invalidate()
+
+    logger.info(f"Upserted books: {counts['inserted']} inserted, {counts['updated']} updated, "
+                f"{counts['unchanged']} unchanged")
+    return counts
@@ -0,0 +1,83 @@
+import json
+import os
+import threading
+import logging
+from typing import Dict, Any, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "core", "data", "scrape_checkpoint.jsonl")
+
+
+class CheckpointJournal:
+
+    def __init__(self, path: str = CHECKPOINT_PATH):
+        self.path = os.path.abspath(path)
+        self.completed_categories = set()
+        self.completed_books = set()
+        self._file = None
+        self._lock = threading.Lock()
+        self._load()
+
+    def _entries(self) -> Iterator[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring truncated checkpoint entry at line {line_number}")
+
+    def _load(self):
+        for entry in self._entries():
+            if entry['type'] == 'category':
+                self.completed_categories.add(entry['url'])
+            elif entry['type'] == 'book':
+                self.completed_books.add(entry['url'])
+
+    def is_category_done(self, url: str) -> bool:
+        return url in self.completed_categories
+
+    def has_book(self, url: str) -> bool:
+        return url in self.completed_books
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+        seen = set()
+        for entry in self._entries():
+            if entry['type'] == 'book' and entry['data'] and entry['url'] not in seen:
+                seen.add(entry['url'])
+                yield entry['data']
+
+    def _append(self, entry: Dict[str, Any]):
+        with self._lock:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._file.flush()
+
+    def record_book(self, url: str, data: Optional[Dict[str, Any]]):
+        self.completed_books.add(url)
+        self._append({'type': 'book', 'url': url, 'data': data})
+
+    def record_category(self, url: str):
+        self.completed_categories.add(url)
+        self._append({'type': 'category', 'url': url})
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def clear(self):
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.completed_categories = set()
+        self.completed_books = set()
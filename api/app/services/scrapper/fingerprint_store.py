@@ -0,0 +1,72 @@
+import hashlib
+import logging
+from typing import Optional, Dict, Any
+from sqlalchemy.orm import Session
+from ...entities.page_fingerprint_entity import PageFingerprint
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class FingerprintStore:
+
+    def __init__(self, fingerprints: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.fingerprints = fingerprints or {}
+        self.pending = {}
+
+    @classmethod
+    def load(cls, db: Session) -> "FingerprintStore":
+        fingerprints = {
+            row.url: {
+                'etag': row.etag,
+                'last_modified': row.last_modified,
+                'content_hash': row.content_hash
+            }
+            for row in db.query(PageFingerprint).all()
+        }
+        logger.info(f"Loaded {len(fingerprints)} page fingerprints")
+        return cls(fingerprints)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        fingerprint = self.fingerprints.get(url)
+        if not fingerprint:
+            return {}
+
+        headers = {}
+        if fingerprint['etag']:
+            headers['If-None-Match'] = fingerprint['etag']
+        if fingerprint['last_modified']:
+            headers['If-Modified-Since'] = fingerprint['last_modified']
+        return headers
+
+    def is_unchanged(self, url: str, response_data: Dict[str, Any]) -> bool:
+        if response_data['status_code'] == 304:
+            return url in self.fingerprints
+
+        fingerprint = self.fingerprints.get(url)
+        return bool(fingerprint) and fingerprint['content_hash'] == content_hash(response_data['content'])
+
+    def record(self, url: str, response_data: Dict[str, Any]):
+        headers = response_data.get('headers') or {}
+        self.pending[url] = {
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'content_hash': content_hash(response_data['content'])
+        }
+
+    def save(self, db: Session) -> int:
+        if not self.pending:
+            return 0
+
+        for url, fingerprint in self.pending.items():
+            db.merge(PageFingerprint(url=url, **fingerprint))
+        db.commit()
+
+        saved = len(self.pending)
+        self.fingerprints.update(self.pending)
+        self.pending = {}
+        logger.info(f"Saved {saved} page fingerprints")
+        return saved
@@ -0,0 +1,41 @@
+import os
+import logging
+from typing import Optional
+from bs4 import BeautifulSoup, SoupStrainer, FeatureNotFound
+
+logger = logging.getLogger(__name__)
+
+PARSER_BACKEND = os.getenv("SCRAPER_PARSER_BACKEND", "html.parser")
+PARSER_BACKENDS = ("html.parser", "strained", "lxml")
+
+PAGE_STRAINERS = {
+    'index': SoupStrainer(class_='side_categories'),
+    'listing': SoupStrainer(class_=['product_pod', 'pager']),
+    'book': SoupStrainer(class_=['breadcrumb', 'product_page']),
+}
+
+
+def validate_parser_backend(backend: str) -> str:
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Invalid parser backend: {backend}. Choose one of {', '.join(PARSER_BACKENDS)}")
+
+    if backend == "lxml":
+        try:
+            BeautifulSoup(b"", "lxml")
+        except FeatureNotFound:
+            raise ValueError("Parser backend 'lxml' requires the lxml package to be installed")
+
+    return backend
+
+
+def make_soup(content: bytes, page_type: str, backend: Optional[str] = None) -> BeautifulSoup:
+    backend = backend or PARSER_BACKEND
+
+    if backend == "html.parser":
+        return BeautifulSoup(content, 'html.parser')
+    if backend == "strained":
+        return BeautifulSoup(content, 'html.parser', parse_only=PAGE_STRAINERS[page_type])
+    if backend == "lxml":
+        return BeautifulSoup(content, 'lxml', parse_only=PAGE_STRAINERS[page_type])
+
+    raise ValueError(f"Invalid parser backend: {backend}")
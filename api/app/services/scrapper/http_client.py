@@ -0,0 +1,131 @@
+import os
+import random
+import threading
+import time
+import logging
+from typing import Optional, Dict, Any
+import requests
+from requests.adapters import HTTPAdapter
+from ...services.scrapper.recorder import ResponseRecorder
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+POOL_CONNECTIONS = int(os.getenv("SCRAPER_POOL_CONNECTIONS", 4))
+POOL_MAXSIZE = int(os.getenv("SCRAPER_POOL_MAXSIZE", 16))
+CONNECT_TIMEOUT = float(os.getenv("SCRAPER_CONNECT_TIMEOUT", 10))
+READ_TIMEOUT = float(os.getenv("SCRAPER_READ_TIMEOUT", 30))
+MAX_RETRIES = int(os.getenv("SCRAPER_MAX_RETRIES", 3))
+BACKOFF_BASE = float(os.getenv("SCRAPER_BACKOFF_BASE", 1.0))
+BACKOFF_MAX = float(os.getenv("SCRAPER_BACKOFF_MAX", 30))
+RETRY_BUDGET = int(os.getenv("SCRAPER_RETRY_BUDGET", 100))
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class RetryBudget:
+
+    def __init__(self, max_retries: int = RETRY_BUDGET):
+        self.max_retries = max_retries
+        self.used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        return max(self.max_retries - self.used, 0)
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.used >= self.max_retries:
+                return False
+            self.used += 1
+            return True
+
+    def reset(self):
+        with self._lock:
+            self.used = 0
+
+
+class HttpClient:
+
+    def __init__(self, pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE,
+                 connect_timeout: float = CONNECT_TIMEOUT, read_timeout: float = READ_TIMEOUT,
+                 max_retries: int = MAX_RETRIES, backoff_base: float = BACKOFF_BASE,
+                 backoff_max: float = BACKOFF_MAX, retry_budget: int = RETRY_BUDGET,
+                 headers: Optional[Dict[str, str]] = None, recorder: Optional[ResponseRecorder] = None):
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_budget = RetryBudget(retry_budget)
+        self.recorder = recorder
+
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT})
+        if headers:
+            self.session.headers.update(headers)
+
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=True)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def backoff_delay(self, attempt: int, base: Optional[float] = None) -> float:
+        base = self.backoff_base if base is None else base
+        return random.uniform(0, min(self.backoff_max, base * (2 ** attempt)))
+
+    def reset_retry_budget(self):
+        self.retry_budget.reset()
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, max_retries: Optional[int] = None,
+            backoff_base: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        max_retries = self.max_retries if max_retries is None else max_retries
+
+        for attempt in range(max_retries):
+            try:
+                logger.info(f"Requesting: {url} (attempt {attempt + 1}/{max_retries})")
+
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+                response.raise_for_status()
+
+                response_data = {
+                    'status_code': response.status_code,
+                    'content': response.content,
+                    'url': response.url,
+                    'headers': response.headers
+                }
+                if self.recorder:
+                    self.recorder.record(url, response_data)
+                return response_data
+
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
+
+                status_code = e.response.status_code if e.response is not None else None
+                if status_code is not None and status_code not in RETRYABLE_STATUS_CODES:
+                    logger.error(f"Non-retryable status {status_code} for {url}")
+                    return None
+                if attempt >= max_retries - 1:
+                    logger.error(f"All retry attempts failed for {url}")
+                    return None
+                if not self.retry_budget.try_acquire():
+                    logger.error(f"Retry budget exhausted, giving up on {url}")
+                    return None
+
+                time.sleep(self.backoff_delay(attempt, backoff_base))
+
+        return None
+
+    def close(self):
+        self.session.close()
+
+
+_default_client: Optional[HttpClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = HttpClient()
+    return _default_client
@@ -0,0 +1,141 @@
+import csv
+import os
+import queue
+import threading
+import time
+import logging
+from collections import Counter
+from typing import Callable, List, Dict, Any, Optional
+from sqlalchemy.orm import Session
+from ...core.database import SessionLocal
+from ...services.scrapper.scrapper_utils import BOOK_FIELDS, normalize_book_record, create_filename
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = int(os.getenv("SCRAPER_BATCH_SIZE", 50))
+FLUSH_INTERVAL = float(os.getenv("SCRAPER_FLUSH_INTERVAL", 2.0))
+QUEUE_MAXSIZE = int(os.getenv("SCRAPER_QUEUE_MAXSIZE", 200))
+PUT_TIMEOUT = 0.5
+
+_STOP = object()
+
+
+class BatchWriter:
+
+    def __init__(self, write_batch: Callable[[List[Dict[str, Any]], Session], Dict[str, int]],
+                 session_factory: Callable[[], Session] = SessionLocal,
+                 batch_size: int = BATCH_SIZE, flush_interval: float = FLUSH_INTERVAL,
+                 queue_maxsize: int = QUEUE_MAXSIZE, csv_dir: Optional[str] = None):
+        self.write_batch = write_batch
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.csv_dir = csv_dir
+        self.csv_path = None
+        self.books_written = 0
+        self.batches_written = 0
+        self.counts = Counter()
+        self.error = None
+        self._queue = queue.Queue(maxsize=queue_maxsize)
+        self._thread = None
+        self._csv_file = None
+        self._csv_writer = None
+
+    def start(self) -> "BatchWriter":
+        self._thread = threading.Thread(target=self._run, name="scrape-batch-writer", daemon=True)
+        self._thread.start()
+        return self
+
+    def put(self, book_data: Dict[str, Any]):
+        record = normalize_book_record(book_data)
+        while True:
+            if self.error is not None:
+                raise RuntimeError(f"Batch writer failed: {self.error}") from self.error
+            try:
+                self._queue.put(record, timeout=PUT_TIMEOUT)
+                return
+            except queue.Full:
+                continue
+
+    def close(self) -> int:
+        if self._thread is not None:
+            while self._thread.is_alive():
+                try:
+                    self._queue.put(_STOP, timeout=PUT_TIMEOUT)
+                    break
+                except queue.Full:
+                    continue
+            self._thread.join()
+            self._thread = None
+
+        if self.error is not None:
+            raise RuntimeError(f"Batch writer failed: {self.error}") from self.error
+
+        logger.info(f"Streamed {self.books_written} records in {self.batches_written} batches")
+        return self.books_written
+
+    def __enter__(self) -> "BatchWriter":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            try:
+                self.close()
+            except RuntimeError:
+                pass
+
+    def _run(self):
+        db = self.session_factory()
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    item = None
+
+                if item is _STOP:
+                    break
+                if item is not None:
+                    batch.append(item)
+
+                if len(batch) >= self.batch_size or (batch and time.monotonic() >= deadline):
+                    self._flush(batch, db)
+                    batch = []
+                if time.monotonic() >= deadline:
+                    deadline = time.monotonic() + self.flush_interval
+
+            if batch:
+                self._flush(batch, db)
+        except Exception as e:
+            logger.exception(f"Batch writer stopped: {e}")
+            self.error = e
+            db.rollback()
+        finally:
+            db.close()
+            if self._csv_file is not None:
+                self._csv_file.close()
+                self._csv_file = None
+
+    def _flush(self, batch: List[Dict[str, Any]], db: Session):
+        self.counts.update(self.write_batch(batch, db))
+        self._append_csv(batch)
+        self.books_written += len(batch)
+        self.batches_written += 1
+
+    def _append_csv(self, batch: List[Dict[str, Any]]):
+        if not self.csv_dir:
+            return
+
+        if self._csv_writer is None:
+            os.makedirs(self.csv_dir, exist_ok=True)
+            self.csv_path = os.path.join(self.csv_dir, create_filename("books_data"))
+            self._csv_file = open(self.csv_path, 'w', newline='', encoding='utf-8')
+            self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=BOOK_FIELDS)
+            self._csv_writer.writeheader()
+
+        self._csv_writer.writerows(batch)
+        self._csv_file.flush()
@@ -0,0 +1,36 @@
+import os
+import threading
+import logging
+from typing import Dict, Any
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+def url_to_path(directory: str, url: str) -> str:
+    path = urlparse(url).path.lstrip('/')
+    if not path or path.endswith('/'):
+        path += 'index.html'
+    return os.path.join(directory, *path.split('/'))
+
+
+class ResponseRecorder:
+
+    def __init__(self, directory: str):
+        self.directory = os.path.abspath(directory)
+        self.pages_recorded = 0
+        self._lock = threading.Lock()
+
+    def record(self, url: str, response_data: Dict[str, Any]):
+        if response_data['status_code'] != 200:
+            return
+
+        path = url_to_path(self.directory, url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(response_data['content'])
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self.pages_recorded += 1
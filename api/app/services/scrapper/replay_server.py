@@ -0,0 +1,128 @@
+import argparse
+import os
+import random
+import threading
+import time
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from ...services.scrapper.recorder import url_to_path
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayServer:
+
+    def __init__(self, directory: str, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 503, seed: Optional[int] = None, host: str = "127.0.0.1", port: int = 0):
+        if not os.path.isdir(directory):
+            raise ValueError(f"Corpus directory not found: {directory}")
+        if not 0 <= error_rate <= 1:
+            raise ValueError(f"Invalid error rate: {error_rate}")
+
+        self.directory = os.path.abspath(directory)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests_served = 0
+        self.errors_injected = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def _make_handler(self):
+        replay = self
+
+        class ReplayHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                replay._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        return ReplayHandler
+
+    def _next_delay_and_error(self):
+        with self._lock:
+            self.requests_served += 1
+            delay = self.latency + self._random.uniform(0, self.jitter) if self.jitter else self.latency
+            inject_error = self.error_rate and self._random.random() < self.error_rate
+            if inject_error:
+                self.errors_injected += 1
+        return delay, inject_error
+
+    def _handle(self, handler: BaseHTTPRequestHandler):
+        delay, inject_error = self._next_delay_and_error()
+        if delay:
+            time.sleep(delay)
+
+        path = url_to_path(self.directory, handler.path.split('?', 1)[0])
+        if inject_error:
+            self._send(handler, self.error_status, b"Injected error")
+        elif os.path.isfile(path) and os.path.abspath(path).startswith(self.directory + os.sep):
+            with open(path, 'rb') as f:
+                self._send(handler, 200, f.read(), "text/html; charset=utf-8")
+        else:
+            self._send(handler, 404, b"Not found")
+
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, status_code: int, body: bytes, content_type: str = "text/plain"):
+        handler.send_response(status_code)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        logger.info(f"Replaying {self.directory} at {self.base_url}")
+        return self
+
+    def serve_forever(self):
+        logger.info(f"Replaying {self.directory} at {self.base_url}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a recorded Books to Scrape corpus over HTTP")
+    parser.add_argument("directory")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra latency, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    server = ReplayServer(args.directory, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                          seed=args.seed, port=args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
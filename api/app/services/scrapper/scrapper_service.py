@@ -1,17 +1,27 @@
+import asyncio
+import functools
+import multiprocessing
 import os
 import sys
 import time
-from typing import List, Dict, Any, Optional
-from urllib.parse import urljoin
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
+from urllib.parse import urljoin, urlparse
 import pandas as pd
-from bs4 import BeautifulSoup
 import logging
 from sqlalchemy.orm import Session
-from ...core.database import get_db, engine, Base
-from ...entities.book_entity import Book
+from ...core.database import get_db, engine, Base, ReadSessionLocal
+from ...core.migrations import run_migrations
+from ...services.ingest_service import upsert_books
+from ...services.scrapper.http_client import HttpClient, get_http_client
+from ...services.scrapper.fingerprint_store import FingerprintStore
+from ...services.scrapper.checkpoint_journal import CheckpointJournal
+from ...services.scrapper.html_parsers import PARSER_BACKEND, make_soup, validate_parser_backend
+from ...services.scrapper.pipeline import BatchWriter
+from ...services.scrapper.recorder import ResponseRecorder
 from ...services.scrapper.scrapper_utils import (
     clean_text, extract_price, extract_rating, check_availability,
-    safe_request, validate_url, create_filename
+    safe_request, validate_url, create_filename, BOOK_FIELDS
 )
 
 logger = logging.getLogger(__name__)
@@ -22,28 +32,195 @@ BASE_URL = "https://books.toscrape.com/"
 CATALOG_URL = urljoin(BASE_URL, "catalogue/")
 DELAY_BETWEEN_REQUESTS = 1.0
 MAX_RETRIES = 3
+MAX_CONCURRENT_REQUESTS_PER_HOST = 8
+PARSE_WORKERS = int(os.getenv("SCRAPER_PARSE_WORKERS", 0))
+CSV_OUTPUT_DIR = "../api/app/core/data"
+CRAWL_MODES = ("sequential", "async")
 
 
 class BooksToScrapeScraper:
 
-    def __init__(self, base_url: str = BASE_URL, delay: float = DELAY_BETWEEN_REQUESTS):
+    def __init__(self, base_url: str = BASE_URL, delay: float = DELAY_BETWEEN_REQUESTS,
+                 max_concurrency_per_host: int = MAX_CONCURRENT_REQUESTS_PER_HOST,
+                 http_client: Optional[HttpClient] = None,
+                 fingerprint_store: Optional[FingerprintStore] = None,
+                 checkpoint: Optional[CheckpointJournal] = None,
+                 listing_only: bool = False,
+                 parser_backend: str = PARSER_BACKEND,
+                 sink: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 parse_workers: int = PARSE_WORKERS):
         self.base_url = base_url
         self.delay = delay
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self.http_client = http_client or get_http_client()
+        self.fingerprint_store = fingerprint_store
+        self.checkpoint = checkpoint
+        self.listing_only = listing_only
+        self.parser_backend = validate_parser_backend(parser_backend)
+        self.sink = sink
+        self.parse_workers = parse_workers
+        self.books_emitted = 0
         self.session_data = []
         self.categories = {}
+        self.pages_fetched = 0
+        self.pages_unchanged = 0
+        self.pages_per_second = 0.0
+        self.pages_parsed = 0
+        self.parse_seconds = 0.0
+        self._host_semaphores = {}
+        self._executor = None
+        self._parse_executor = None
 
         if not validate_url(base_url):
             raise ValueError(f"Invalid base URL: {base_url}")
+        if parse_workers < 0:
+            raise ValueError(f"Invalid parse worker count: {parse_workers}")
+
+    def _fetch(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        response_data = safe_request(url, client=self.http_client, headers=headers)
+        if response_data:
+            self.pages_fetched += 1
+        return response_data
+
+    async def _fetch_async(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        host = urlparse(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency_per_host)
+            self._host_semaphores[host] = semaphore
+
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            response_data = await loop.run_in_executor(
+                self._executor, functools.partial(safe_request, url, client=self.http_client, headers=headers)
+            )
+            if self.delay:
+                await asyncio.sleep(self.delay)
+
+        if response_data:
+            self.pages_fetched += 1
+        return response_data
+
+    def _parse(self, parse_page: Callable, *args):
+        started_at = time.perf_counter()
+        try:
+            return parse_page(*args)
+        finally:
+            self.parse_seconds += time.perf_counter() - started_at
+            self.pages_parsed += 1
+
+    async def _parse_async(self, parse_page: Callable, *args):
+        if self._parse_executor is None:
+            return self._parse(parse_page, *args)
+
+        started_at = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._parse_executor, functools.partial(parse_page, *args)
+            )
+        finally:
+            self.parse_seconds += time.perf_counter() - started_at
+            self.pages_parsed += 1
+
+    def _conditional_headers(self, url: str) -> Optional[Dict[str, str]]:
+        if not self.fingerprint_store:
+            return None
+        return self.fingerprint_store.conditional_headers(url)
+
+    def _skip_unchanged(self, url: str, response_data: Dict[str, Any]) -> bool:
+        if not self.fingerprint_store:
+            return False
+
+        if self.fingerprint_store.is_unchanged(url, response_data):
+            logger.info(f"Unchanged since last scrape, skipping: {url}")
+            self.pages_unchanged += 1
+            if self.checkpoint:
+                self.checkpoint.record_book(url, None)
+            return True
+
+        self.fingerprint_store.record(url, response_data)
+        return False
+
+    def _record_book(self, book_url: str, book_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if self.checkpoint and book_data:
+            self.checkpoint.record_book(book_url, book_data)
+        return book_data
+
+    @staticmethod
+    def _is_listing_complete(listing_book: Dict[str, Any]) -> bool:
+        return all(listing_book.get(field) is not None for field in BOOK_FIELDS)
+
+    def _get_category_listing(self, category_url: str) -> List[Dict[str, Any]]:
+        if self.listing_only:
+            return self.get_all_books_from_category_listing(category_url)
+        return [{'book_url': book_url} for book_url in self.get_all_book_urls_from_category(category_url)]
+
+    async def _get_category_listing_async(self, category_url: str) -> List[Dict[str, Any]]:
+        if self.listing_only:
+            return await self.get_all_books_from_category_listing_async(category_url)
+        book_urls = await self.get_all_book_urls_from_category_async(category_url)
+        return [{'book_url': book_url} for book_url in book_urls]
+
+    async def _book_from_listing_async(self, listing_book: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if self._is_listing_complete(listing_book):
+            return self._record_book(listing_book['book_url'], listing_book)
+        return await self.extract_book_data_async(listing_book['book_url'])
+
+    def _is_book_done(self, book_url: str) -> bool:
+        return bool(self.checkpoint) and self.checkpoint.has_book(book_url)
+
+    def _record_category(self, category_url: str, book_urls: List[str]):
+        if self.checkpoint and book_urls and all(self.checkpoint.has_book(url) for url in book_urls):
+            self.checkpoint.record_category(category_url)
+
+    def _emit(self, book_data: Dict[str, Any], all_books: List[Dict[str, Any]]):
+        self.books_emitted += 1
+        if self.sink is not None:
+            self.sink(book_data)
+        else:
+            all_books.append(book_data)
+
+    async def _collect_book_async(self, listing_book: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        book_data = await self._book_from_listing_async(listing_book)
+        if not book_data:
+            return None
+
+        self.books_emitted += 1
+        if self.sink is None:
+            return book_data
+
+        await asyncio.get_running_loop().run_in_executor(None, self.sink, book_data)
+        return None
+
+    def _restored_books(self) -> Iterator[Dict[str, Any]]:
+        if not self.checkpoint or not self.checkpoint.completed_books:
+            return iter(())
+
+        logger.info(f"Resuming from checkpoint: {len(self.checkpoint.completed_categories)} categories "
+                    f"and {len(self.checkpoint.completed_books)} book pages already done")
+        return self.checkpoint.records()
+
+    def _log_throughput(self, started_at: float) -> float:
+        elapsed = time.perf_counter() - started_at
+        self.pages_per_second = self.pages_fetched / elapsed if elapsed > 0 else 0.0
+        logger.info(f"Fetched {self.pages_fetched} pages in {elapsed:.2f}s ({self.pages_per_second:.2f} pages/sec)")
+        if self.pages_parsed:
+            logger.info(f"Parsed {self.pages_parsed} pages ({self.parse_ms_per_page:.2f} ms/page)")
+        return self.pages_per_second
+
+    @property
+    def parse_ms_per_page(self) -> float:
+        return self.parse_seconds * 1000 / self.pages_parsed if self.pages_parsed else 0.0
 
     def get_all_category_urls(self) -> List[str]:
         logger.info("Fetching category URLs...")
 
-        response_data = safe_request(self.base_url)
+        response_data = self._fetch(self.base_url)
         if not response_data:
             logger.error("Failed to fetch main page")
             return []
 
-        soup = BeautifulSoup(response_data['content'], 'html.parser')
+        soup = make_soup(response_data['content'], 'index', self.parser_backend)
         category_links = []
 
         sidebar = soup.find('div', class_='side_categories')
@@ -52,7 +229,7 @@ class BooksToScrapeScraper:
             for link in links:
                 href = link.get('href')
                 if href and 'category' in href:
-                    full_url = urljoin('https://books.toscrape.com/', href)
+                    full_url = urljoin(self.base_url, href)
                     category_name = clean_text(link.get_text())
                     self.categories[full_url] = category_name
                     category_links.append(full_url)
@@ -61,48 +238,142 @@ class BooksToScrapeScraper:
         return category_links[1:]
 
     @staticmethod
-    def get_all_book_urls_from_category(category_url: str) -> List[str]:
+    def parse_category_page(content: bytes, page_url: str,
+                            parser_backend: Optional[str] = None) -> Tuple[List[str], Optional[str]]:
+        soup = make_soup(content, 'listing', parser_backend)
+
+        book_urls = []
+        book_links = soup.find_all('h3')
+        for link in book_links:
+            parent_link = link.find('a')
+            if parent_link:
+                href = parent_link.get('href')
+                if href:
+                    book_urls.append(urljoin(page_url, href))
+
+        next_url = None
+        next_button = soup.select_one('li.next > a')
+        if next_button:
+            next_href = next_button.get('href')
+            if next_href:
+                next_url = urljoin(page_url, next_href)
+
+        return book_urls, next_url
+
+    def get_all_book_urls_from_category(self, category_url: str) -> List[str]:
 
         book_urls = []
         current_url = category_url
 
         while current_url:
-            response_data = safe_request(current_url)
+            response_data = self._fetch(current_url)
             if not response_data:
                 logger.error(f"Failed to fetch category page: {current_url}")
                 break
 
-            soup = BeautifulSoup(response_data['content'], 'html.parser')
-
-            book_links = soup.find_all('h3')
-            for link in book_links:
-                parent_link = link.find('a')
-                if parent_link:
-                    href = parent_link.get('href')
-                    if href:
-                        full_url = urljoin(current_url, href)
-                        book_urls.append(full_url)
-
-            next_button = soup.select_one('li.next > a')
-            if next_button:
-                next_href = next_button.get('href')
-                current_url = urljoin(current_url, next_href)
-            else:
-                break
+            page_book_urls, current_url = self._parse(
+                self.parse_category_page, response_data['content'], current_url, self.parser_backend
+            )
+            book_urls.extend(page_book_urls)
 
         return book_urls
 
     @staticmethod
-    def extract_book_data(book_url: str) -> Optional[Dict[str, Any]]:
+    def parse_listing_page(content: bytes, page_url: str, category: str,
+                           parser_backend: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        soup = make_soup(content, 'listing', parser_backend)
+
+        books = []
+        for product in soup.find_all('article', class_='product_pod'):
+            link = product.find('h3').find('a') if product.find('h3') else None
+            if not link or not link.get('href'):
+                continue
+
+            price_element = product.find('p', class_='price_color')
+            rating_element = product.find('p', class_='star-rating')
+            availability_element = product.find('p', class_='instock availability')
+            image_element = product.find('img')
+
+            books.append({
+                'title': clean_text(link.get('title')) if link.get('title') else None,
+                'price': extract_price(price_element.get_text()) if price_element else None,
+                'rating': extract_rating(' '.join(rating_element.get('class'))) if rating_element else None,
+                'availability': check_availability(availability_element.get_text()) if availability_element else None,
+                'category': category or None,
+                'image_url': urljoin(page_url, image_element.get('src')) if image_element and image_element.get('src') else None,
+                'book_url': urljoin(page_url, link.get('href'))
+            })
+
+        next_url = None
+        next_button = soup.select_one('li.next > a')
+        if next_button:
+            next_href = next_button.get('href')
+            if next_href:
+                next_url = urljoin(page_url, next_href)
+
+        return books, next_url
+
+    def get_all_books_from_category_listing(self, category_url: str) -> List[Dict[str, Any]]:
+
+        books = []
+        category = self.categories.get(category_url, "")
+        current_url = category_url
 
-        logger.info(f"Extracting data from: {book_url}")
-        print(f'book_url: {book_url}')
-        response_data = safe_request(book_url)
-        if not response_data:
-            logger.error(f"Failed to fetch book page: {book_url}")
-            return None
+        while current_url:
+            response_data = self._fetch(current_url)
+            if not response_data:
+                logger.error(f"Failed to fetch category page: {current_url}")
+                break
+
+            page_books, current_url = self._parse(
+                self.parse_listing_page, response_data['content'], current_url, category, self.parser_backend
+            )
+            books.extend(page_books)
+
+        return books
+
+    async def get_all_books_from_category_listing_async(self, category_url: str) -> List[Dict[str, Any]]:
+
+        books = []
+        category = self.categories.get(category_url, "")
+        current_url = category_url
+
+        while current_url:
+            response_data = await self._fetch_async(current_url)
+            if not response_data:
+                logger.error(f"Failed to fetch category page: {current_url}")
+                break
+
+            page_books, current_url = await self._parse_async(
+                self.parse_listing_page, response_data['content'], current_url, category, self.parser_backend
+            )
+            books.extend(page_books)
+
+        return books
+
+    async def get_all_book_urls_from_category_async(self, category_url: str) -> List[str]:
 
-        soup = BeautifulSoup(response_data['content'], 'html.parser')
+        book_urls = []
+        current_url = category_url
+
+        while current_url:
+            response_data = await self._fetch_async(current_url)
+            if not response_data:
+                logger.error(f"Failed to fetch category page: {current_url}")
+                break
+
+            page_book_urls, current_url = await self._parse_async(
+                self.parse_category_page, response_data['content'], current_url, self.parser_backend
+            )
+            book_urls.extend(page_book_urls)
+
+        return book_urls
+
+    @staticmethod
+    def parse_book_page(content: bytes, book_url: str,
+                        parser_backend: Optional[str] = None) -> Optional[Dict[str, Any]]:
+
+        soup = make_soup(content, 'book', parser_backend)
 
         try:
             title_element = soup.find('h1')
@@ -127,8 +398,8 @@ class BooksToScrapeScraper:
                 if len(category_links) >= 2:
                     category = clean_text(category_links[2].get_text())
 
-            image_element = soup.find('div', class_='item active').find('img') if soup.find('div',
-                                                                                            class_='item active') else None
+            gallery_item = soup.find('div', class_='item active')
+            image_element = gallery_item.find('img') if gallery_item else None
             image_url = ""
             if image_element:
                 image_src = image_element.get('src')
@@ -152,10 +423,48 @@ class BooksToScrapeScraper:
             logger.error(f"Error extracting data from {book_url}: {e}")
             return None
 
+    def extract_book_data(self, book_url: str) -> Optional[Dict[str, Any]]:
+
+        logger.info(f"Extracting data from: {book_url}")
+        print(f'book_url: {book_url}')
+        response_data = self._fetch(book_url, self._conditional_headers(book_url))
+        if not response_data:
+            logger.error(f"Failed to fetch book page: {book_url}")
+            return None
+        if self._skip_unchanged(book_url, response_data):
+            return None
+
+        book_data = self._parse(self.parse_book_page, response_data['content'], book_url, self.parser_backend)
+        return self._record_book(book_url, book_data)
+
+    async def extract_book_data_async(self, book_url: str) -> Optional[Dict[str, Any]]:
+
+        logger.info(f"Extracting data from: {book_url}")
+        response_data = await self._fetch_async(book_url, self._conditional_headers(book_url))
+        if not response_data:
+            logger.error(f"Failed to fetch book page: {book_url}")
+            return None
+        if self._skip_unchanged(book_url, response_data):
+            return None
+
+        book_data = await self._parse_async(
+            self.parse_book_page, response_data['content'], book_url, self.parser_backend
+        )
+        return self._record_book(book_url, book_data)
+
     def scrape_all_books(self) -> List[Dict[str, Any]]:
         logger.info("Starting to scrape all books...")
 
         all_books = []
+        self.pages_fetched = 0
+        self.pages_unchanged = 0
+        self.pages_parsed = 0
+        self.parse_seconds = 0.0
+        self.books_emitted = 0
+        self.http_client.reset_retry_budget()
+        started_at = time.perf_counter()
+        for book_data in self._restored_books():
+            self._emit(book_data, all_books)
 
         category_urls = self.get_all_category_urls()
 
@@ -166,22 +475,102 @@ class BooksToScrapeScraper:
 
         for category_url in category_urls:
             category_name = self.categories.get(category_url, "Unknown")
+            if self.checkpoint and self.checkpoint.is_category_done(category_url):
+                logger.info(f"Skipping category already in checkpoint: {category_name}")
+                continue
             logger.info(f"Scraping category: {category_name}")
 
-            book_urls = self.get_all_book_urls_from_category(category_url)
+            listing_books = self._get_category_listing(category_url)
+
+            for listing_book in listing_books:
+                book_url = listing_book['book_url']
+                if self._is_book_done(book_url):
+                    continue
+
+                if self._is_listing_complete(listing_book):
+                    self._emit(self._record_book(book_url, listing_book), all_books)
+                    continue
 
-            for book_url in book_urls:
                 book_data = self.extract_book_data(book_url)
                 if book_data:
-                    all_books.append(book_data)
+                    self._emit(book_data, all_books)
 
                 time.sleep(self.delay)
 
-        logger.info(f"Scraping completed. Total books extracted: {len(all_books)}")
+            self._record_category(category_url, [book['book_url'] for book in listing_books])
+
+        self._log_throughput(started_at)
+        if self.fingerprint_store:
+            logger.info(f"Skipped {self.pages_unchanged} unchanged book pages")
+        logger.info(f"Scraping completed. Total books extracted: {self.books_emitted}")
+        return all_books
+
+    async def _scrape_category_async(self, category_url: str) -> List[Dict[str, Any]]:
+        category_name = self.categories.get(category_url, "Unknown")
+        if self.checkpoint and self.checkpoint.is_category_done(category_url):
+            logger.info(f"Skipping category already in checkpoint: {category_name}")
+            return []
+        logger.info(f"Scraping category: {category_name}")
+
+        listing_books = await self._get_category_listing_async(category_url)
+        books = await asyncio.gather(
+            *(self._collect_book_async(listing_book) for listing_book in listing_books
+              if not self._is_book_done(listing_book['book_url']))
+        )
+        self._record_category(category_url, [book['book_url'] for book in listing_books])
+        return [book for book in books if book]
+
+    async def scrape_all_books_async(self) -> List[Dict[str, Any]]:
+        logger.info(f"Starting to scrape all books (async, {self.max_concurrency_per_host} requests per host, "
+                    f"{self.parse_workers or 'no'} parse workers)...")
+
+        all_books = []
+        self.pages_fetched = 0
+        self.pages_unchanged = 0
+        self.pages_parsed = 0
+        self.parse_seconds = 0.0
+        self.books_emitted = 0
+        self.http_client.reset_retry_budget()
+        self._host_semaphores = {}
+        started_at = time.perf_counter()
+        for book_data in self._restored_books():
+            self._emit(book_data, all_books)
+
+        if self.parse_workers:
+            self._parse_executor = ProcessPoolExecutor(
+                max_workers=self.parse_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency_per_host) as executor:
+            self._executor = executor
+            try:
+                loop = asyncio.get_running_loop()
+                category_urls = await loop.run_in_executor(executor, self.get_all_category_urls)
+
+                if not category_urls:
+                    logger.error("No categories found")
+                    return all_books
+
+                results = await asyncio.gather(
+                    *(self._scrape_category_async(category_url) for category_url in category_urls)
+                )
+            finally:
+                self._executor = None
+                if self._parse_executor is not None:
+                    self._parse_executor.shutdown()
+                    self._parse_executor = None
+
+        for books in results:
+            all_books.extend(books)
+
+        self._log_throughput(started_at)
+        if self.fingerprint_store:
+            logger.info(f"Skipped {self.pages_unchanged} unchanged book pages")
+        logger.info(f"Scraping completed. Total books extracted: {self.books_emitted}")
         return all_books
 
     @staticmethod
-    def save_to_csv(books_data: List[Dict[str, Any]], output_dir: str = "../api/app/core/data") -> str:
+    def save_to_csv(books_data: List[Dict[str, Any]], output_dir: str = CSV_OUTPUT_DIR) -> str:
         if not books_data:
             logger.warning("No data to save")
             return ""
@@ -207,69 +596,130 @@ class BooksToScrapeScraper:
         return filepath
 
     @staticmethod
-    def save_to_db(books_data: List[Dict[str, Any]], db: Session) -> int:
+    def save_to_db(books_data: List[Dict[str, Any]], db: Session) -> Dict[str, int]:
         if not books_data:
             logger.warning("No data to save")
-            return 0
-
-        books_to_add = []
-        for book in books_data:
-            b = Book(
-                title=book.get("title", ""),
-                price=float(book.get("price", 0)),
-                category=book.get("category", ""),
-                rating=book.get("rating", ""),
-                availability=book.get("availability", ""),
-                image_url=book.get("image_url", ""),
-            )
-            books_to_add.append(b)
+            return {'inserted': 0, 'updated': 0, 'unchanged': 0}
 
-        db.add_all(books_to_add)
-        db.commit()
+        return upsert_books(db, books_data)
 
-        logger.info(f"Inserted {len(books_to_add)} records into the database.")
-        return len(books_to_add)
 
-
-def run_scraping():
+def run_scraping(mode: str = "sequential", incremental: bool = False, resume: bool = True,
+                 listing_only: bool = False, parser_backend: str = PARSER_BACKEND,
+                 streaming: bool = False, parse_workers: int = PARSE_WORKERS,
+                 record_dir: Optional[str] = None) -> bool:
+    checkpoint = None
     try:
+        if mode not in CRAWL_MODES:
+            raise ValueError(f"Invalid crawl mode: {mode}")
+
         logger.info("Initializing the database and creating tables if necessary...")
         Base.metadata.create_all(bind=engine)
+        run_migrations(engine)
         logger.info("Database ready.")
 
-        logger.info("Starting Books to Scrape scraper...")
-        scraper = BooksToScrapeScraper()
-        books_data = scraper.scrape_all_books()
+        db = next(get_db())
+        fingerprint_store = None
+        if incremental:
+            with ReadSessionLocal() as read_db:
+                fingerprint_store = FingerprintStore.load(read_db)
+
+        checkpoint = CheckpointJournal()
+        if not resume:
+            checkpoint.clear()
+
+        logger.info(f"Starting Books to Scrape scraper ({mode} mode{', incremental' if incremental else ''}"
+                    f"{', listing only' if listing_only else ''}{', streaming' if streaming else ''})...")
+        http_client = HttpClient(recorder=ResponseRecorder(record_dir)) if record_dir else None
+        scraper = BooksToScrapeScraper(http_client=http_client, fingerprint_store=fingerprint_store,
+                                       checkpoint=checkpoint, listing_only=listing_only,
+                                       parser_backend=parser_backend, parse_workers=parse_workers)
+        if parse_workers and mode != "async":
+            logger.warning("Parse workers are only used in async mode; parsing inline")
+        if streaming:
+            return _run_streaming(scraper, mode, db, fingerprint_store, checkpoint)
+
+        if mode == "async":
+            books_data = asyncio.run(scraper.scrape_all_books_async())
+        else:
+            books_data = scraper.scrape_all_books()
+
+        if not books_data and incremental and scraper.pages_unchanged:
+            logger.info("Catalog unchanged since last scrape. Nothing to save.")
+            checkpoint.clear()
+            return True
 
         if not books_data:
             logger.error("No books were scraped. Exiting.")
-            sys.exit(1)
+            return False
 
-        db = next(get_db())
-        output_file = scraper.save_to_db(books_data, db)
+        counts = scraper.save_to_db(books_data, db)
         output_file_csv = scraper.save_to_csv(books_data)
 
-        if output_file:
-            logger.info("Scraping completed successfully!")
-            logger.info(f"Data saved to db: {output_file}")
-        else:
-            logger.error("Failed to save data")
-            sys.exit(1)
+        logger.info("Scraping completed successfully!")
+        logger.info(f"Data saved to db: {counts['inserted']} inserted, {counts['updated']} updated, "
+                    f"{counts['unchanged']} unchanged")
+
+        if fingerprint_store:
+            fingerprint_store.save(db)
+        checkpoint.clear()
 
         if output_file_csv:
             logger.info("Scraping completed successfully!")
             logger.info(f"Data saved to: {output_file_csv}")
         else:
             logger.error("Failed to save data in csv file")
-            sys.exit(1)
+            return False
+
+        return True
 
     except KeyboardInterrupt:
         logger.warning("Scraping interrupted by user")
-        sys.exit(0)
+        return False
     except Exception as e:
         logger.exception(f"An error occurred: {e}")
-        sys.exit(1)
+        return False
+    finally:
+        if checkpoint and checkpoint.completed_books:
+            checkpoint.close()
+            logger.warning(f"Progress kept in checkpoint {checkpoint.path}; run the scraper again to resume")
+
+
+def _run_streaming(scraper: BooksToScrapeScraper, mode: str, db: Session,
+                   fingerprint_store: Optional[FingerprintStore], checkpoint: CheckpointJournal) -> bool:
+    with BatchWriter(BooksToScrapeScraper.save_to_db, csv_dir=CSV_OUTPUT_DIR) as writer:
+        scraper.sink = writer.put
+        if mode == "async":
+            asyncio.run(scraper.scrape_all_books_async())
+        else:
+            scraper.scrape_all_books()
+
+    if not writer.books_written and not scraper.pages_unchanged:
+        logger.error("No books were scraped. Exiting.")
+        return False
+
+    if fingerprint_store:
+        fingerprint_store.save(db)
+    checkpoint.clear()
+
+    logger.info("Scraping completed successfully!")
+    logger.info(f"Data saved to db: {writer.counts['inserted']} inserted, {writer.counts['updated']} updated, "
+                f"{writer.counts['unchanged']} unchanged")
+    if writer.csv_path:
+        logger.info(f"Data saved to: {writer.csv_path}")
+    return True
 
 
 if __name__ == "__main__":
-    run_scraping()
+    succeeded = run_scraping(
+        sys.argv[1] if len(sys.argv) > 1 and not sys.argv[1].startswith("--") else "sequential",
+        incremental="--incremental" in sys.argv,
+        resume="--fresh" not in sys.argv,
+        listing_only="--listing-only" in sys.argv,
+        streaming="--streaming" in sys.argv,
+        parse_workers=next(
+            (int(arg.split("=", 1)[1]) for arg in sys.argv if arg.startswith("--parse-workers=")), PARSE_WORKERS
+        ),
+        record_dir=next((arg.split("=", 1)[1] for arg in sys.argv if arg.startswith("--record=")), None)
+    )
+    sys.exit(0 if succeeded else 1)
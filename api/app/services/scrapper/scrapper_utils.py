@@ -1,10 +1,9 @@
 import re
-import requests
-import time
 from datetime import datetime
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
 import logging
+from ...services.scrapper.http_client import HttpClient, get_http_client
 
 logging.basicConfig(
     level=logging.INFO,
@@ -12,6 +11,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+BOOK_FIELDS = ('title', 'price', 'rating', 'availability', 'category', 'image_url', 'book_url')
+
 
 def clean_text(text: str) -> str:
     if not text:
@@ -55,33 +56,19 @@ def check_availability(availability_text: str) -> str:
         return availability.title()
 
 
-def safe_request(url: str, max_retries: int = 3, delay: float = 1.0) -> Optional[Dict[str, Any]]:
-    for attempt in range(max_retries):
-        try:
-            logger.info(f"Requesting: {url} (attempt {attempt + 1}/{max_retries})")
-
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            return {
-                'status_code': response.status_code,
-                'content': response.content,
-                'url': response.url
-            }
+def safe_request(url: str, max_retries: Optional[int] = None, delay: Optional[float] = None,
+                 client: Optional[HttpClient] = None,
+                 headers: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+    client = client or get_http_client()
+    return client.get(url, headers=headers, max_retries=max_retries, backoff_base=delay)
 
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
-            if attempt < max_retries - 1:
-                time.sleep(delay)
-            else:
-                logger.error(f"All retry attempts failed for {url}")
-                return None
 
-    return None
+def normalize_book_record(book_data: Dict[str, Any]) -> Dict[str, Any]:
+    record = {field: book_data.get(field) or "" for field in BOOK_FIELDS}
+    record['title'] = clean_text(record['title'])
+    record['category'] = clean_text(record['category'])
+    record['price'] = float(book_data.get('price') or 0)
+    return record
 
 
 def validate_url(url: str) -> bool:
@@ -1,21 +1,57 @@
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from sqlalchemy import func, Float
-from app.entities.book_entity import Book
+from sqlalchemy import func
+from app.entities.book_entity import Book, RATING_VALUES
+from app.entities.category_stats_entity import CategoryStats, RATING_BUCKETS
 from fastapi import HTTPException, status
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+RATING_NAMES = {value: rating for rating, value in RATING_VALUES.items()}
+
+
+def _rating_distribution(counts, unrated: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    distribution = {RATING_NAMES[value]: count for value, count in zip(RATING_BUCKETS, counts) if value and count}
+    distribution.update(unrated or {})
+    return distribution
+
+
+def _unrated_labels(db: Session) -> Dict[str, Dict[str, int]]:
+    # Ratings outside RATING_VALUES share bucket 0; report them under their stored label
+    rows = db.query(Book.category, Book.rating, func.count(Book.id)).filter(Book.rating_value == 0) \
+        .group_by(Book.category, Book.rating).all()
+    labels = {}
+    for category, rating, count in rows:
+        labels.setdefault(category, {})[rating] = count
+    return labels
+
+
+def _average(price_sum, book_count) -> float:
+    return round(price_sum / book_count, 2) if book_count else 0.0
 
 
 def get_overview_stats(db: Session) -> Dict:
     try:
-        total_books = db.query(func.count(Book.id)).scalar()
-        avg_price = db.query(func.avg(func.cast(Book.price, Float))).scalar()
-        rating_distribution = db.query(Book.rating, func.count(Book.id)).group_by(Book.rating).all()
+        rating_columns = [getattr(CategoryStats, f"rating_{value}") for value in RATING_BUCKETS]
+        row = db.query(
+            func.sum(CategoryStats.book_count),
+            func.sum(CategoryStats.price_sum),
+            func.min(CategoryStats.min_price),
+            func.max(CategoryStats.max_price),
+            *(func.sum(column) for column in rating_columns)
+        ).one()
+        total_books, price_sum, min_price, max_price = row[:4]
+        unrated = {}
+        if row[4]:
+            for labels in _unrated_labels(db).values():
+                for rating, count in labels.items():
+                    unrated[rating] = unrated.get(rating, 0) + count
 
         return {
-            "total_books": total_books,
-            "average_price": round(avg_price, 2) if avg_price else 0.0,
-            "rating_distribution": {r[0]: r[1] for r in rating_distribution}
+            "total_books": total_books or 0,
+            "average_price": _average(price_sum, total_books),
+            "min_price": min_price or 0.0,
+            "max_price": max_price or 0.0,
+            "rating_distribution": _rating_distribution(row[4:], unrated)
         }
 
 
@@ -28,17 +64,19 @@ def get_overview_stats(db: Session) -> Dict:
 
 def get_category_stats(db: Session) -> List[Dict]:
     try:
-        results = db.query(
-            Book.category,
-            func.count(Book.id),
-            func.avg(func.cast(Book.price, Float))
-        ).group_by(Book.category).all()
+        results = db.query(CategoryStats).order_by(CategoryStats.category).all()
+        unrated = _unrated_labels(db) if any(row.rating_0 for row in results) else {}
 
         return [
             {
-                "category": row[0],
-                "total_books": row[1],
-                "average_price": round(row[2], 2) if row[2] else 0.0
+                "category": row.category,
+                "total_books": row.book_count,
+                "average_price": _average(row.price_sum, row.book_count),
+                "min_price": row.min_price,
+                "max_price": row.max_price,
+                "rating_distribution": _rating_distribution(
+                    (getattr(row, f"rating_{value}") for value in RATING_BUCKETS), unrated.get(row.category)
+                )
             }
             for row in results
         ]
@@ -1,15 +1,27 @@
+from typing import Optional
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from app.entities.user_entity import User
 from app.schemas.user_schema import UserCreate
-from app.core.auth import get_password_hash
+from app.core.auth import get_password_hash, get_password_hash_async
+from app.core.token_cache import verified_tokens
 
 def get_user_by_username(db: Session, username: str):
     return db.query(User).filter(username == User.username).first()
 
-def create_user(db: Session, user: UserCreate):
-    hashed_password = get_password_hash(user.password)
+async def get_user_by_username_async(db: AsyncSession, username: str):
+    return await db.run_sync(get_user_by_username, username)
+
+def create_user(db: Session, user: UserCreate, hashed_password: Optional[str] = None):
+    hashed_password = hashed_password or get_password_hash(user.password)
     db_user = User(username=user.username, hashed_password=hashed_password)
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
+    verified_tokens.invalidate_user(db_user.username)
     return db_user
+
+async def create_user_async(db: Session, user: UserCreate):
+    hashed_password = await get_password_hash_async(user.password)
+    return await run_in_threadpool(create_user, db, user, hashed_password)
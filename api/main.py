@@ -12,9 +12,15 @@ from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.exc import SQLAlchemyError
-from app.exceptions.custom_exceptions import BookNotFoundException, BookNotFoundInRangePriceException
+from app.exceptions.custom_exceptions import (
+    BookNotFoundException,
+    BookNotFoundInRangePriceException,
+    ExecutorSaturatedException
+)
 from app.routes import router
+from app.core.compression import COMPRESSION_MIN_SIZE, CompressionMiddleware
 from app.core.database import Base, engine
+from app.core.migrations import run_migrations
 
 logging.basicConfig(
     level=logging.INFO,
@@ -27,6 +33,7 @@ logger = logging.getLogger(__name__)
 
 logger.info("Initializing database...")
 Base.metadata.create_all(bind=engine)
+run_migrations(engine)
 logger.info("Database initialized successfully")
 
 def load_openapi():
@@ -60,7 +67,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
+app.add_middleware(CompressionMiddleware, minimum_size=COMPRESSION_MIN_SIZE)
 
 logger.info("Registering API routes...")
 app.include_router(router)
@@ -90,4 +99,14 @@ async def book_exception_handler(request: Request, exc: BookNotFoundInRangePrice
         content={
             "detail": exc.message,
         }
-    )
\ No newline at end of file
+    )
+
+@app.exception_handler(ExecutorSaturatedException)
+async def executor_saturated_exception_handler(request: Request, exc: ExecutorSaturatedException):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "detail": exc.message,
+        },
+        headers={"Retry-After": "1"}
+    )
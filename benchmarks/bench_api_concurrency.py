@@ -0,0 +1,120 @@
+"""Mede a vazão da API com um número crescente de clientes concorrentes.
+
+Uso:
+    python benchmarks/bench_api_concurrency.py [--path /api/v1/books/search?title=the]
+        [--concurrency 1,2,4,8,16,32] [--duration 5] [--workers 1] [--user test_user]
+
+A API roda com uvicorn em um subprocesso, sobre uma cópia temporária
+do `data.db`, de modo que o banco versionado não é alterado pelas migrações. Para
+cada nível de concorrência, N clientes fazem requisições em sequência durante
+`--duration` segundos, e são reportados requisições/s e latências p50/p95.
+O padrão usa a busca textual, que não passa pelo cache de respostas. Assim, a
+vazão reflete o acesso ao banco pelas sessões assíncronas. Com `--workers N`, o
+uvicorn sobe N processos lendo o mesmo banco em modo WAL.
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import statistics
+import sys
+import subprocess
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DB = os.path.join(ROOT, 'api', 'app', 'core', 'data', 'data.db')
+sys.path.insert(0, os.path.join(ROOT, 'api'))
+
+
+def start_server(port: int, workers: int, env: dict) -> subprocess.Popen:
+    import httpx
+
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--workers", str(workers),
+         "--log-level", "warning"],
+        cwd=os.path.join(ROOT, 'api'), env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/api/v1/health/").status_code == 200:
+                return process
+        except httpx.TransportError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("API did not start")
+
+
+async def run_level(base_url: str, path: str, headers: dict, concurrency: int, duration: float):
+    import httpx
+
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def client_loop(client):
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started_at = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append(time.perf_counter() - started_at)
+            if response.status_code != 200:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        started_at = time.perf_counter()
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+        wall_time = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'requests_per_second': len(latencies) / wall_time,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--path', default='/api/v1/books/search?title=the&limit=50')
+    parser.add_argument('--concurrency', default='1,2,4,8,16,32')
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--user', default='test_user')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench-api-")
+    db_copy = os.path.join(workdir, 'data.db')
+    shutil.copyfile(DATA_DB, db_copy)
+    os.environ['SQLITE_DATABASE_PATH'] = db_copy
+    for name, value in (('SECRET_KEY', 'bench-secret'), ('ALGORITHM', 'HS256'),
+                        ('ACCESS_TOKEN_EXPIRE_MINUTES', '60'), ('REFRESH_TOKEN_EXPIRE_DAYS', '1')):
+        os.environ.setdefault(name, value)
+
+    import logging
+    logging.disable(logging.INFO)
+    from app.core.auth import create_access_token
+
+    process = start_server(args.port, args.workers, dict(os.environ))
+    try:
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': args.user})}"}
+        base_url = f"http://127.0.0.1:{args.port}"
+        print(f"GET {args.path} for {args.duration:.0f} s per level ({args.workers} worker(s))")
+        print(f"{'clients':>7} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8}")
+        for concurrency in (int(level) for level in args.concurrency.split(',')):
+            result = asyncio.run(run_level(base_url, args.path, headers, concurrency, args.duration))
+            print(f"{concurrency:>7} {result['requests']:>9} {result['errors']:>7} "
+                  f"{result['requests_per_second']:>9.1f} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f}")
+    finally:
+        process.terminate()
+        process.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Mede bytes trafegados e CPU por requisição com e sem compressão de respostas.
+
+Uso:
+    python benchmarks/bench_compression.py [--requests 200]
+        [--path /api/v1/books/?limit=1000] [--path /api/v1/stats/categories]
+
+A API roda em processo (`TestClient`) sobre uma cópia temporária do `data.db`.
+Cada caminho é requisitado uma vez para popular o cache de respostas e depois
+`--requests` vezes em cada modo, reportando bytes por resposta e ms de CPU do
+processo por requisição:
+
+- `identity`: sem compressão.
+- `gzip/hit`: gzip aplicado pelo middleware a cada resposta, como seria sem as
+  variantes pré-comprimidas no cache.
+- `gzip/cached`: variante gzip guardada junto da entrada do cache.
+- `br/cached`: variante brotli guardada no cache.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DB = os.path.join(ROOT, 'api', 'app', 'core', 'data', 'data.db')
+sys.path.insert(0, os.path.join(ROOT, 'api'))
+
+DEFAULT_PATHS = ('/api/v1/books/?limit=1000', '/api/v1/books/?limit=100', '/api/v1/stats/categories',
+                 '/api/v1/books/export')
+
+
+def measure(client, path: str, headers: dict, requests: int):
+    client.get(path, headers=headers)
+    wire_bytes = 0
+    started_at = time.process_time()
+    for _ in range(requests):
+        response = client.get(path, headers=headers)
+        wire_bytes += response.num_bytes_downloaded
+    cpu_time = time.process_time() - started_at
+    return wire_bytes / requests, cpu_time / requests * 1000, response.headers.get('content-encoding', 'identity')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--path', action='append')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--user', default='test_user')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench-compression-")
+    db_copy = os.path.join(workdir, 'data.db')
+    shutil.copyfile(DATA_DB, db_copy)
+    os.environ['SQLITE_DATABASE_PATH'] = db_copy
+    for name, value in (('SECRET_KEY', 'bench-secret'), ('ALGORITHM', 'HS256'),
+                        ('ACCESS_TOKEN_EXPIRE_MINUTES', '60'), ('REFRESH_TOKEN_EXPIRE_DAYS', '1')):
+        os.environ.setdefault(name, value)
+
+    import logging
+    logging.disable(logging.INFO)
+    from fastapi.testclient import TestClient
+    import app.core.response_cache as response_cache_module
+    from app.core.auth import create_access_token
+    from app.core.compression import compress_variants
+    from main import app
+
+    token = create_access_token({'sub': args.user})
+    modes = [('identity', 'identity', compress_variants), ('gzip/hit', 'gzip', lambda body: {}),
+             ('gzip/cached', 'gzip', compress_variants), ('br/cached', 'br', compress_variants)]
+
+    try:
+        with TestClient(app) as client:
+            print(f"{args.requests} requests per mode after one warm-up request")
+            print(f"{'path':<28} {'mode':<12} {'encoding':>9} {'bytes/resp':>11} {'ratio':>6} {'cpu ms/req':>11}")
+            for path in args.path or DEFAULT_PATHS:
+                raw_bytes = None
+                for mode, accept_encoding, precompress in modes:
+                    response_cache_module.compress_variants = precompress
+                    response_cache_module.response_cache.clear()
+                    headers = {'Authorization': f'Bearer {token}', 'Accept-Encoding': accept_encoding}
+                    wire_bytes, cpu_ms, encoding = measure(client, path, headers, args.requests)
+                    raw_bytes = raw_bytes or wire_bytes
+                    print(f"{path:<28} {mode:<12} {encoding:>9} {wire_bytes:>11.0f} "
+                          f"{wire_bytes / raw_bytes:>6.2f} {cpu_ms:>11.3f}")
+    finally:
+        response_cache_module.compress_variants = compress_variants
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""Mede a latência de outros endpoints enquanto a API recebe uma rajada de logins.
+
+Uso:
+    python benchmarks/bench_login_load.py [--path /api/v1/books/search?title=the]
+        [--probe-clients 4] [--login-clients 16] [--duration 5] [--bcrypt-rounds 12]
+
+A API roda com uvicorn em um subprocesso, sobre uma cópia temporária do
+`data.db`, com um usuário criado para o teste. Primeiro, `--probe-clients`
+clientes consultam `--path` sozinhos; depois, a mesma consulta é repetida
+enquanto `--login-clients` clientes fazem login em sequência. São reportados
+logins/s, respostas 503 (pool do bcrypt cheio) e as latências p50/p99 da
+consulta nas duas fases.
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DB = os.path.join(ROOT, 'api', 'app', 'core', 'data', 'data.db')
+sys.path.insert(0, os.path.join(ROOT, 'api'))
+
+from bench_api_concurrency import start_server  # noqa: E402
+
+
+def percentile(latencies, fraction: float) -> float:
+    return latencies[max(int(len(latencies) * fraction) - 1, 0)] * 1000
+
+
+async def run_phase(base_url: str, path: str, headers: dict, credentials: dict, probe_clients: int,
+                    login_clients: int, duration: float):
+    import httpx
+
+    latencies = []
+    logins = {'ok': 0, 'busy': 0, 'other': 0}
+    deadline = time.perf_counter() + duration
+
+    async def probe_loop(client):
+        while time.perf_counter() < deadline:
+            started_at = time.perf_counter()
+            await client.get(path, headers=headers)
+            latencies.append(time.perf_counter() - started_at)
+
+    async def login_loop(client):
+        while time.perf_counter() < deadline:
+            response = await client.post("/api/v1/auth/login", data=credentials)
+            status = {200: 'ok', 503: 'busy'}.get(response.status_code, 'other')
+            logins[status] += 1
+
+    limits = httpx.Limits(max_connections=probe_clients + login_clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        started_at = time.perf_counter()
+        await asyncio.gather(*(probe_loop(client) for _ in range(probe_clients)),
+                             *(login_loop(client) for _ in range(login_clients)))
+        wall_time = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        'probes': len(latencies),
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p99_ms': percentile(latencies, 0.99),
+        'logins_per_second': logins['ok'] / wall_time,
+        'busy': logins['busy'],
+        'failed': logins['other'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--path', default='/api/v1/books/search?title=the&limit=50')
+    parser.add_argument('--probe-clients', type=int, default=4)
+    parser.add_argument('--login-clients', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--bcrypt-rounds', type=int, default=12)
+    parser.add_argument('--port', type=int, default=8766)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench-login-")
+    db_copy = os.path.join(workdir, 'data.db')
+    shutil.copyfile(DATA_DB, db_copy)
+    os.environ['SQLITE_DATABASE_PATH'] = db_copy
+    os.environ['BCRYPT_ROUNDS'] = str(args.bcrypt_rounds)
+    for name, value in (('SECRET_KEY', 'bench-secret'), ('ALGORITHM', 'HS256'),
+                        ('ACCESS_TOKEN_EXPIRE_MINUTES', '60'), ('REFRESH_TOKEN_EXPIRE_DAYS', '1')):
+        os.environ.setdefault(name, value)
+
+    import httpx
+    import logging
+    logging.disable(logging.INFO)
+    from app.core.auth import create_access_token
+
+    process = start_server(args.port, 1, dict(os.environ))
+    try:
+        base_url = f"http://127.0.0.1:{args.port}"
+        credentials = {'username': 'bench_user', 'password': 'bench-password'}
+        httpx.post(f"{base_url}/api/v1/users/", json=credentials, timeout=60).raise_for_status()
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': credentials['username']})}"}
+
+        print(f"GET {args.path} with {args.probe_clients} client(s) for {args.duration:.0f} s per phase "
+              f"(bcrypt rounds {args.bcrypt_rounds})")
+        print(f"{'phase':<12} {'probes':>7} {'p50 ms':>8} {'p99 ms':>8} {'logins/s':>9} {'503':>5} {'failed':>7}")
+        for phase, login_clients in (('idle', 0), ('login load', args.login_clients)):
+            result = asyncio.run(run_phase(base_url, args.path, headers, credentials, args.probe_clients,
+                                           login_clients, args.duration))
+            print(f"{phase:<12} {result['probes']:>7} {result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} "
+                  f"{result['logins_per_second']:>9.1f} {result['busy']:>5} {result['failed']:>7}")
+    finally:
+        process.terminate()
+        process.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""Compara o tempo de parsing por página entre os backends de parser do scraper.
+
+Uso:
+    python benchmarks/bench_parsers.py [diretorio_html] [--repeat N]
+
+O diretório deve espelhar os caminhos do site (ex.: o corpus salvo em
+tests/fixtures/books_toscrape). Além do tempo, o script confere que todos os
+backends produzem exatamente os mesmos dicionários que o `html.parser`.
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from urllib.parse import urljoin
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'api'))
+
+from app.services.scrapper.html_parsers import PARSER_BACKENDS, validate_parser_backend  # noqa: E402
+from app.services.scrapper.scrapper_service import BASE_URL, BooksToScrapeScraper  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(ROOT, 'tests', 'fixtures', 'books_toscrape')
+
+
+def load_pages(directory):
+    pages = []
+    for current_dir, _, files in os.walk(directory):
+        for name in sorted(files):
+            if not name.endswith('.html'):
+                continue
+            path = os.path.join(current_dir, name)
+            relative = os.path.relpath(path, directory).replace(os.sep, '/')
+            if '/category/' in relative:
+                page_type = 'listing'
+            elif relative.startswith('catalogue/'):
+                page_type = 'book'
+            else:
+                continue
+            with open(path, 'rb') as f:
+                pages.append((page_type, urljoin(BASE_URL, relative), f.read()))
+    return pages
+
+
+def parse_page(page_type, url, content, backend):
+    if page_type == 'book':
+        return BooksToScrapeScraper.parse_book_page(content, url, backend)
+    return BooksToScrapeScraper.parse_listing_page(content, url, '', backend)
+
+
+def available_backends():
+    backends = []
+    for backend in PARSER_BACKENDS:
+        try:
+            backends.append(validate_parser_backend(backend))
+        except ValueError as e:
+            print(f"Skipping {backend}: {e}")
+    return backends
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('corpus', nargs='?', default=DEFAULT_CORPUS)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    pages = load_pages(args.corpus)
+    if not pages:
+        sys.exit(f"No listing or book pages found in {args.corpus}")
+
+    baseline = [parse_page(page_type, url, content, 'html.parser') for page_type, url, content in pages]
+
+    print(f"{len(pages)} pages from {args.corpus}, {args.repeat} repetitions")
+    print(f"{'backend':<12} {'listing ms/page':>16} {'book ms/page':>13} {'all ms/page':>12} {'speedup':>8}  output")
+    reference_ms = None
+    for backend in available_backends():
+        totals = {'listing': 0.0, 'book': 0.0}
+        counts = {'listing': 0, 'book': 0}
+        outputs = []
+        for _ in range(args.repeat):
+            outputs = []
+            for page_type, url, content in pages:
+                started_at = time.perf_counter()
+                outputs.append(parse_page(page_type, url, content, backend))
+                totals[page_type] += time.perf_counter() - started_at
+                counts[page_type] += 1
+
+        def ms_per_page(page_type):
+            return totals[page_type] * 1000 / counts[page_type] if counts[page_type] else 0.0
+
+        all_ms = sum(totals.values()) * 1000 / sum(counts.values())
+        reference_ms = reference_ms or all_ms
+        identical = 'identical' if outputs == baseline else 'DIFFERENT'
+        print(f"{backend:<12} {ms_per_page('listing'):>16.3f} {ms_per_page('book'):>13.3f} "
+              f"{all_ms:>12.3f} {reference_ms / all_ms:>7.2f}x  {identical}")
+
+
+if __name__ == '__main__':
+    main()
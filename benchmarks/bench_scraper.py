@@ -0,0 +1,95 @@
+"""Mede o scraper de ponta a ponta contra um corpus gravado servido localmente.
+
+Uso:
+    python benchmarks/bench_scraper.py [diretorio_html] [--mode sequential|async|both]
+        [--latency 0.05] [--jitter 0.02] [--error-rate 0.01] [--concurrency 8]
+        [--parse-workers N] [--parser-backend lxml] [--listing-only] [--repeat 3]
+
+O corpus é um diretório que espelha os caminhos do site, como o gravado com
+`--record=DIR` no scraper ou o de tests/fixtures/books_toscrape. Ele é servido
+por `ReplayServer`, que adiciona latência e erros 503 conforme os parâmetros.
+Para cada execução são reportados requisições/s, ms de parsing por página e o
+tempo total.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'api'))
+
+from app.services.scrapper.http_client import HttpClient  # noqa: E402
+from app.services.scrapper.replay_server import ReplayServer  # noqa: E402
+from app.services.scrapper.scrapper_service import BooksToScrapeScraper  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(ROOT, 'tests', 'fixtures', 'books_toscrape')
+
+
+def run_once(server, mode, args):
+    client = HttpClient(backoff_base=args.backoff, pool_maxsize=max(args.concurrency, 1))
+    scraper = BooksToScrapeScraper(base_url=server.base_url, delay=0, max_concurrency_per_host=args.concurrency,
+                                   http_client=client, listing_only=args.listing_only,
+                                   parser_backend=args.parser_backend, parse_workers=args.parse_workers)
+    requests_before = server.requests_served
+    started_at = time.perf_counter()
+    if mode == 'async':
+        books = asyncio.run(scraper.scrape_all_books_async())
+    else:
+        books = scraper.scrape_all_books()
+    wall_time = time.perf_counter() - started_at
+    client.close()
+
+    requests_made = server.requests_served - requests_before
+    return {
+        'books': len(books),
+        'requests': requests_made,
+        'requests_per_second': requests_made / wall_time if wall_time else 0.0,
+        'parse_ms_per_page': scraper.parse_ms_per_page,
+        'wall_time': wall_time,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('corpus', nargs='?', default=DEFAULT_CORPUS)
+    parser.add_argument('--mode', choices=('sequential', 'async', 'both'), default='both')
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--parse-workers', type=int, default=0)
+    parser.add_argument('--parser-backend', default='html.parser')
+    parser.add_argument('--listing-only', action='store_true')
+    parser.add_argument('--backoff', type=float, default=0.01)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    modes = ('sequential', 'async') if args.mode == 'both' else (args.mode,)
+
+    with ReplayServer(args.corpus, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                      seed=args.seed) as server:
+        print(f"Corpus {args.corpus} at {server.base_url} (latency {args.latency * 1000:.0f} ms, "
+              f"jitter {args.jitter * 1000:.0f} ms, error rate {args.error_rate:.1%})")
+        print(f"{'mode':<11} {'run':>3} {'books':>6} {'requests':>9} {'req/s':>8} {'parse ms/page':>14} {'wall s':>8}")
+        for mode in modes:
+            results = []
+            for run in range(1, args.repeat + 1):
+                result = run_once(server, mode, args)
+                results.append(result)
+                print(f"{mode:<11} {run:>3} {result['books']:>6} {result['requests']:>9} "
+                      f"{result['requests_per_second']:>8.1f} {result['parse_ms_per_page']:>14.3f} "
+                      f"{result['wall_time']:>8.3f}")
+
+            best = min(results, key=lambda r: r['wall_time'])
+            print(f"{mode:<11} {'best':>3} {best['books']:>6} {best['requests']:>9} "
+                  f"{best['requests_per_second']:>8.1f} {best['parse_ms_per_page']:>14.3f} {best['wall_time']:>8.3f}")
+        print(f"Errors injected: {server.errors_injected} of {server.requests_served} requests")
+
+
+if __name__ == '__main__':
+    main()
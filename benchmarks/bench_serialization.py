@@ -0,0 +1,141 @@
+"""Compara a serialização de listas de livros: ORM + Pydantic contra linhas Core + orjson.
+
+Uso:
+    python benchmarks/bench_serialization.py [--rows 100000] [--page-size 1000] [--repeat 3]
+
+Um catálogo sintético com `--rows` livros é criado num SQLite temporário. Para
+cada caminho, o catálogo é percorrido em páginas de `--page-size` livros (como
+na listagem `/api/v1/books`), medindo consulta e serialização até os bytes JSON
+finais. O resultado é reportado em linhas/s.
+
+- `orm+pydantic`: entidades ORM validadas por `BookSchema` (`from_attributes`)
+  e serializadas pelo Pydantic, como a listagem fazia antes.
+- `orm+json`: entidades ORM convertidas com `BookSchema.model_dump()` e
+  codificadas com `json.dumps`, o caminho padrão de um endpoint FastAPI.
+- `core+orjson`: tuplas Core (`get_all_book_rows`) codificadas com orjson por
+  `render_book_rows`, o caminho usado hoje pela listagem.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'api'))
+for name, value in (('SECRET_KEY', 'bench-secret'), ('ALGORITHM', 'HS256'),
+                    ('ACCESS_TOKEN_EXPIRE_MINUTES', '60'), ('REFRESH_TOKEN_EXPIRE_DAYS', '1')):
+    os.environ.setdefault(name, value)
+
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from typing import List  # noqa: E402
+from app.core.database import Base, create_sqlite_engine  # noqa: E402
+from app.entities.book_entity import Book, RATING_VALUES  # noqa: E402
+from app.schemas.book_schema import BookSchema  # noqa: E402
+from app.controllers.book_controller import render_book_rows  # noqa: E402
+from app.services.books_service import get_all_books, get_all_book_rows  # noqa: E402
+
+BOOK_LIST_ADAPTER = TypeAdapter(List[BookSchema])
+CATEGORIES = ["Poetry", "Travel", "Mystery", "Historical Fiction", "Science", "Fantasy", "Romance", "Classics"]
+
+
+def create_catalog(engine, rows: int, seed: int = 42):
+    generator = random.Random(seed)
+    ratings = list(RATING_VALUES)
+    Base.metadata.create_all(bind=engine)
+    batch = []
+    with engine.begin() as conn:
+        for number in range(rows):
+            rating = generator.choice(ratings)
+            batch.append({
+                'title': f"Synthetic Book {number} {generator.choice(CATEGORIES)}",
+                'price': round(generator.uniform(10, 60), 2),
+                'availability': "In stock",
+                'rating': rating,
+                'rating_value': RATING_VALUES[rating],
+                'category': generator.choice(CATEGORIES),
+                'image_url': f"https://books.toscrape.com/media/cache/{number:08x}.jpg",
+                'book_url': f"https://books.toscrape.com/catalogue/synthetic-book_{number}/index.html",
+            })
+            if len(batch) == 5000:
+                conn.execute(insert(Book.__table__), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(Book.__table__), batch)
+
+
+def orm_pydantic(db, after_id, limit):
+    books = get_all_books(db, after_id, limit)
+    return books, BOOK_LIST_ADAPTER.dump_json(BOOK_LIST_ADAPTER.validate_python(books, from_attributes=True))
+
+
+def orm_json(db, after_id, limit):
+    books = get_all_books(db, after_id, limit)
+    return books, json.dumps([BookSchema.model_validate(book).model_dump() for book in books]).encode()
+
+
+def core_orjson(db, after_id, limit):
+    rows = get_all_book_rows(db, after_id, limit)
+    return rows, render_book_rows(rows).body
+
+
+PATHS = (("orm+pydantic", orm_pydantic), ("orm+json", orm_json), ("core+orjson", core_orjson))
+
+
+def walk_catalog(session_factory, render, page_size: int):
+    rows = 0
+    payload_bytes = 0
+    after_id = None
+    started_at = time.perf_counter()
+    with session_factory() as db:
+        while True:
+            page, body = render(db, after_id, page_size)
+            if not page:
+                break
+            rows += len(page)
+            payload_bytes += len(body)
+            after_id = page[-1].id
+            db.expunge_all()
+    return rows, payload_bytes, time.perf_counter() - started_at
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--page-size', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    import logging
+    logging.disable(logging.INFO)
+
+    workdir = tempfile.mkdtemp(prefix="bench-serialization-")
+    try:
+        engine = create_sqlite_engine(f"sqlite:///{os.path.join(workdir, 'catalog.db')}")
+        started_at = time.perf_counter()
+        create_catalog(engine, args.rows)
+        print(f"Catalog of {args.rows} books created in {time.perf_counter() - started_at:.1f} s; "
+              f"pages of {args.page_size}")
+        session_factory = sessionmaker(bind=engine, autoflush=False)
+
+        print(f"{'path':<13} {'rows':>8} {'MB':>7} {'best s':>8} {'rows/s':>10}")
+        baseline = None
+        for name, render in PATHS:
+            runs = [walk_catalog(session_factory, render, args.page_size) for _ in range(args.repeat)]
+            rows, payload_bytes, best = min(runs, key=lambda run: run[2])
+            rate = rows / best
+            baseline = baseline or rate
+            print(f"{name:<13} {rows:>8} {payload_bytes / 1e6:>7.1f} {best:>8.3f} {rate:>10.0f}  "
+                  f"({rate / baseline:.1f}x)")
+        engine.dispose()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,27 @@
+import atexit
 import os
+import shutil
 import sys
+import tempfile
 import pytest
 from faker import Faker
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
-from app.core.database import Base, get_db
+
+# Importing main runs migrations, so point the app at a copy of the bundled database
+DATA_DB = os.path.join(os.path.dirname(__file__), '..', 'api', 'app', 'core', 'data', 'data.db')
+DATA_DIR = tempfile.mkdtemp(prefix="books-api-tests-")
+atexit.register(shutil.rmtree, DATA_DIR, ignore_errors=True)
+shutil.copyfile(DATA_DB, os.path.join(DATA_DIR, 'data.db'))
+os.environ['SQLITE_DATABASE_PATH'] = os.path.join(DATA_DIR, 'data.db')
+from app.core.database import Base, get_db, get_read_db, get_async_read_db
+from app.core.catalog_snapshot import catalog_snapshot
+from app.core.response_cache import response_cache, dataset_version
+from app.core.token_cache import verified_tokens
 from app.entities.book_entity import Book
 from app.entities.user_entity import User
 from main import app
@@ -16,11 +31,14 @@ fake = Faker('pt_BR')
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 @pytest.fixture(scope="function")
 def db_session():
     """Cria uma sessão de banco de dados para testes."""
     Base.metadata.create_all(bind=engine)
+    catalog_snapshot.clear()
     session = TestingSessionLocal()
     try:
         yield session
@@ -38,6 +56,15 @@ def client(db_session):
             db_session.close()
     
     app.dependency_overrides[get_db] = override_get_db
+    async def override_get_async_read_db():
+        async with TestingAsyncSessionLocal() as session:
+            yield session
+
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_read_db
+    response_cache.clear()
+    dataset_version.invalidate()
+    verified_tokens.clear()
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
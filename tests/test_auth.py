@@ -1,5 +1,9 @@
+import asyncio
 from datetime import datetime, timedelta
+import app.core.auth as auth
 from app.core.auth import get_password_hash, verify_password, authenticate_user, create_access_token, SECRET_KEY, ALGORITHM
+from app.core.bounded_executor import BoundedExecutor
+import app.services.user_service as user_service
 from jose import jwt
 
 class TestAuth:
@@ -109,4 +113,50 @@ class TestAuth:
         headers = {"Authorization": f"Bearer {token}"}
         response = client.get("/api/v1/books/", headers=headers)
         
-        assert response.status_code == 401
\ No newline at end of file
+        assert response.status_code == 401
+
+    def test_login_returns_tokens(self, client, sample_user):
+        """Testa login com usuário e senha corretos e incorretos."""
+        
+        response = client.post("/api/v1/auth/login", data={"username": "testuser", "password": "secret"})
+        wrong = client.post("/api/v1/auth/login", data={"username": "testuser", "password": "wrongpass"})
+        
+        assert response.status_code == 200
+        assert jwt.decode(response.json()["access_token"], SECRET_KEY, algorithms=[ALGORITHM])["sub"] == "testuser"
+        assert wrong.status_code == 401
+    
+    def test_login_returns_503_when_password_executor_is_saturated(self, client, sample_user, monkeypatch):
+        """Testa que o login responde 503 com Retry-After quando o pool do bcrypt está cheio."""
+        
+        saturated = BoundedExecutor(max_workers=1, queue_limit=0)
+        saturated.in_flight = 1
+        monkeypatch.setattr(auth, "password_executor", saturated)
+        
+        response = client.post("/api/v1/auth/login", data={"username": "testuser", "password": "secret"})
+        
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        assert saturated.stats()["rejected"] == 1
+
+    def test_create_user_writes_off_the_event_loop(self, client, sample_user, monkeypatch):
+        """Testa que o cadastro grava o usuário fora do event loop e recusa nomes já existentes."""
+        create_user = user_service.create_user
+        on_event_loop = []
+
+        def tracking_create_user(*args):
+            try:
+                asyncio.get_running_loop()
+                on_event_loop.append(True)
+            except RuntimeError:
+                on_event_loop.append(False)
+            return create_user(*args)
+
+        monkeypatch.setattr(user_service, "create_user", tracking_create_user)
+        existing = sample_user.username
+
+        created = client.post("/api/v1/users/", json={"username": "newuser", "password": "secret"})
+        duplicate = client.post("/api/v1/users/", json={"username": existing, "password": "secret"})
+
+        assert created.status_code == 200
+        assert duplicate.status_code == 409
+        assert on_event_loop == [False]
@@ -1,7 +1,11 @@
+import csv
+import io
+import json
 import os
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
 from app.core.auth import create_access_token
+from app.schemas.book_schema import BookSchema
 
 
 class TestBookController:
@@ -21,6 +25,43 @@ class TestBookController:
         assert len(data) == 3
         assert data[0]["title"] == "Python Programming"
     
+    def test_list_books_body_matches_schema(self, client, multiple_books, sample_user):
+        """Testa que a serialização rápida da listagem produz o mesmo JSON do schema de livro."""
+        token = create_access_token({"sub": sample_user.username})
+        response = client.get("/api/v1/books/", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == [
+            BookSchema.model_validate(book, from_attributes=True).model_dump(mode="json") for book in multiple_books
+        ]
+
+    def test_export_books_ndjson(self, client, multiple_books, sample_user):
+        """Testa a exportação do catálogo em NDJSON, um livro por linha."""
+        expected = [BookSchema.model_validate(book, from_attributes=True).model_dump(mode="json")
+                    for book in multiple_books]
+        token = create_access_token({"sub": sample_user.username})
+        response = client.get("/api/v1/books/export", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.headers["content-disposition"] == 'attachment; filename="books.ndjson"'
+        assert [json.loads(line) for line in response.text.splitlines()] == expected
+
+    def test_export_books_csv(self, client, multiple_books, sample_user):
+        """Testa a exportação do catálogo em CSV com cabeçalho."""
+        titles = [book.title for book in multiple_books]
+        token = create_access_token({"sub": sample_user.username})
+        response = client.get("/api/v1/books/export?format=csv", headers={"Authorization": f"Bearer {token}"})
+        invalid = client.get("/api/v1/books/export?format=xml", headers={"Authorization": f"Bearer {token}"})
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/csv; charset=utf-8"
+        assert [row["title"] for row in rows] == titles
+        assert rows[0]["price"] == "45.99"
+        assert list(rows[0]) == ["id", "title", "price", "availability", "rating", "category", "image_url"]
+        assert invalid.status_code == 422
+
     def test_list_books_empty(self, client, db_session, sample_user):
         """Testa a listagem quando não há livros."""
         
@@ -164,6 +205,53 @@ class TestBookController:
         assert response.status_code == 200
         assert response.json() == []
     
+    def test_list_books_keyset_pagination(self, client, multiple_books, sample_user):
+        """Testa a paginação por cursor (after_id + limit) na listagem de livros."""
+        
+        token_data = {"sub": sample_user.username}
+        token = create_access_token(token_data)
+        headers = {"Authorization": f"Bearer {token}"}
+        
+        first = client.get("/api/v1/books/?limit=2", headers=headers)
+        cursor = first.headers["X-Next-Cursor"]
+        second = client.get(f"/api/v1/books/?limit=2&after_id={cursor}", headers=headers)
+        
+        assert first.status_code == 200
+        assert [book["id"] for book in first.json()] == [multiple_books[0].id, multiple_books[1].id]
+        assert cursor == str(multiple_books[1].id)
+        assert [book["id"] for book in second.json()] == [multiple_books[2].id]
+        assert "X-Next-Cursor" not in second.headers
+    
+    def test_search_and_price_range_keyset_pagination(self, client, multiple_books, sample_user):
+        """Testa a paginação por cursor na busca e na faixa de preço."""
+        
+        token_data = {"sub": sample_user.username}
+        token = create_access_token(token_data)
+        headers = {"Authorization": f"Bearer {token}"}
+        
+        search = client.get("/api/v1/books/search?category=Technology&limit=1", headers=headers)
+        search_next = client.get(
+            f"/api/v1/books/search?category=Technology&limit=1&after_id={search.headers['X-Next-Cursor']}",
+            headers=headers
+        )
+        price = client.get("/api/v1/books/price-range?min=10.0&max=60.0&limit=2", headers=headers)
+        
+        assert [book["title"] for book in search.json()] == ["Python Programming"]
+        assert [book["title"] for book in search_next.json()] == ["Data Science Handbook"]
+        assert "X-Next-Cursor" not in search_next.headers
+        assert len(price.json()) == 2
+        assert price.headers["X-Next-Cursor"] == str(multiple_books[1].id)
+    
+    def test_list_books_invalid_limit(self, client, sample_user):
+        """Testa que limites fora do intervalo permitido são rejeitados."""
+        
+        token_data = {"sub": sample_user.username}
+        token = create_access_token(token_data)
+        headers = {"Authorization": f"Bearer {token}"}
+        
+        assert client.get("/api/v1/books/?limit=0", headers=headers).status_code == 422
+        assert client.get("/api/v1/books/?limit=5000", headers=headers).status_code == 422
+    
     def test_unauthorized_access(self, client):
         """Testa acesso sem autenticação."""
         response = client.get("/api/v1/books/")
@@ -1,17 +1,25 @@
+import asyncio
 import os
 import sys
 import pytest
 from fastapi import HTTPException
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
 from app.entities.book_entity import Book
+from app.schemas.book_schema import BookSchema
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
 from app.exceptions.custom_exceptions import BookNotFoundException
 from app.services.books_service import (
     get_all_books,
+    get_all_book_rows,
+    iter_book_row_chunks,
     get_books_by_title_and_category,
     get_book_by_id,
     get_top_rated_books,
-    get_books_by_price_range
+    get_books_by_price_range,
+    get_top_rated_books_async,
+    get_books_by_price_range_async
 )
 
 
@@ -34,6 +42,29 @@ class TestBooksService:
         assert books == []
         assert len(books) == 0
     
+    def test_get_all_books_keyset_pagination(self, db_session, multiple_books):
+        """Testa a paginação por cursor ordenada pelo ID."""
+        first_page = get_all_books(db_session, limit=2)
+        second_page = get_all_books(db_session, after_id=first_page[-1].id, limit=2)
+
+        assert [book.id for book in first_page] == [book.id for book in multiple_books[:2]]
+        assert [book.id for book in second_page] == [multiple_books[2].id]
+    
+    def test_get_all_book_rows_match_schema(self, db_session, multiple_books):
+        """Testa que as linhas Core trazem os mesmos campos e valores do schema, com paginação."""
+        rows = get_all_book_rows(db_session, after_id=multiple_books[0].id, limit=5)
+
+        assert [row._asdict() for row in rows] == [
+            BookSchema.model_validate(book, from_attributes=True).model_dump() for book in multiple_books[1:]
+        ]
+
+    def test_iter_book_row_chunks(self, db_session, multiple_books):
+        """Testa a leitura do catálogo em blocos de tamanho fixo, em ordem de ID."""
+        chunks = list(iter_book_row_chunks(db_session, chunk_size=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert [row.id for chunk in chunks for row in chunk] == [book.id for book in multiple_books]
+
     def test_get_all_books_database_error(self, db_session, monkeypatch):
         """Testa erro de banco ao buscar todos os livros."""
 
@@ -82,6 +113,44 @@ class TestBooksService:
         assert books == []
         assert len(books) == 0
     
+    def test_search_books_prefix_and_accent_insensitive(self, db_session, multiple_books):
+        """Testa a busca por prefixo e sem acentos no índice full-text."""
+        db_session.add(Book(title="Introdução à Programação", price="10.0", availability="In stock",
+                            rating="One", category="Tecnologia", image_url=""))
+        db_session.commit()
+
+        prefix = get_books_by_title_and_category(db_session, title="Progr")
+        accents = get_books_by_title_and_category(db_session, title="introducao")
+
+        assert {book.title for book in prefix} == {"Python Programming", "Introdução à Programação"}
+        assert [book.title for book in accents] == ["Introdução à Programação"]
+
+    def test_search_books_ranked_by_relevance(self, db_session, multiple_books):
+        """Testa que os resultados são ordenados por relevância (bm25) e paginados pelo cursor."""
+        db_session.add(Book(title="The Complete Reference Guide to Data Engineering", price="10.0",
+                            availability="In stock", rating="One", category="Technology", image_url=""))
+        db_session.add(Book(title="Data", price="10.0", availability="In stock", rating="One",
+                            category="Technology", image_url=""))
+        db_session.commit()
+
+        books = get_books_by_title_and_category(db_session, title="data")
+        first_page = get_books_by_title_and_category(db_session, title="data", limit=2)
+        second_page = get_books_by_title_and_category(db_session, title="data", after_id=first_page[-1].id, limit=2)
+
+        assert books[0].title == "Data"
+        assert len(books) == 3
+        assert [book.id for book in first_page + second_page] == [book.id for book in books]
+
+    def test_search_index_follows_updates_and_deletes(self, db_session, multiple_books):
+        """Testa que o índice full-text acompanha alterações e remoções de livros."""
+        multiple_books[2].title = "Mystery Novel"
+        db_session.delete(multiple_books[0])
+        db_session.commit()
+
+        assert get_books_by_title_and_category(db_session, title="Fiction") == []
+        assert [book.title for book in get_books_by_title_and_category(db_session, title="mystery")] == ["Mystery Novel"]
+        assert get_books_by_title_and_category(db_session, title="Python") == []
+
     def test_get_book_by_id_success(self, db_session, sample_book):
         """Testa a busca de livro por ID com sucesso."""
         book = get_book_by_id(db_session, sample_book.id)
@@ -120,6 +189,22 @@ class TestBooksService:
         assert len(books) == 1
         assert books[0].rating == "Five"
     
+    def test_get_top_rated_books_tie_break(self, db_session, multiple_books):
+        """Testa o desempate determinístico e a ordenação secundária por preço."""
+        for title, price in (("Cheap Classic", "9.99"), ("Pricey Classic", "99.99")):
+            db_session.add(Book(title=title, price=price, availability="In stock", rating="Five",
+                                category="Classics", image_url=""))
+        db_session.commit()
+
+        by_id = get_top_rated_books(db_session, limit=3)
+        by_price = get_top_rated_books(db_session, limit=3, then_by="price")
+        by_price_desc = get_top_rated_books(db_session, limit=3, then_by="-price")
+
+        assert [book.title for book in by_id] == ["Python Programming", "Cheap Classic", "Pricey Classic"]
+        assert [book.title for book in by_price] == ["Cheap Classic", "Python Programming", "Pricey Classic"]
+        assert [book.title for book in by_price_desc] == ["Pricey Classic", "Python Programming", "Cheap Classic"]
+        assert all(book.rating_value == 5 for book in by_id)
+    
     def test_get_books_by_price_range_success(self, db_session, multiple_books):
         """Testa a busca de livros por faixa de preço."""
         books = get_books_by_price_range(db_session, min_price=20.0, max_price=50.0)
@@ -148,4 +233,19 @@ class TestBooksService:
             get_all_books(db_session)
 
         assert exc_info.value.status_code == 500
-        assert "Error accessing the database" in exc_info.value.detail
\ No newline at end of file
+        assert "Error accessing the database" in exc_info.value.detail
+
+    def test_async_variants_match_sync_results(self, db_session, multiple_books):
+        """Testa que as variantes assíncronas retornam o mesmo que as síncronas."""
+        async def fetch():
+            async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_session.bind.url.database}", poolclass=NullPool)
+            async with AsyncSession(async_engine) as session:
+                top_rated = await get_top_rated_books_async(session, limit=2)
+                in_range = await get_books_by_price_range_async(session, 20.0, 50.0)
+            await async_engine.dispose()
+            return top_rated, in_range
+
+        top_rated, in_range = asyncio.run(fetch())
+
+        assert [book.id for book in top_rated] == [book.id for book in get_top_rated_books(db_session, limit=2)]
+        assert [book.id for book in in_range] == [book.id for book in get_books_by_price_range(db_session, 20.0, 50.0)]
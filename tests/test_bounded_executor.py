@@ -0,0 +1,52 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+from app.core.bounded_executor import BoundedExecutor
+from app.exceptions.custom_exceptions import ExecutorSaturatedException
+
+
+class TestBoundedExecutor:
+    """Testes para o pool de threads com fila limitada usado pelo bcrypt."""
+
+    def test_rejects_work_beyond_workers_and_queue_limit(self):
+        """Testa que tarefas acima de workers + fila são rejeitadas sem esperar."""
+        executor = BoundedExecutor(max_workers=1, queue_limit=1)
+        release = threading.Event()
+
+        async def scenario():
+            running = [asyncio.create_task(executor.run(release.wait)) for _ in range(2)]
+            await asyncio.sleep(0.05)
+            with pytest.raises(ExecutorSaturatedException):
+                await executor.run(release.wait)
+            assert executor.stats()["in_flight"] == 2
+            release.set()
+            return await asyncio.gather(*running)
+
+        assert asyncio.run(scenario()) == [True, True]
+        assert executor.stats() == {"workers": 1, "queue_limit": 1, "in_flight": 0, "completed": 2, "rejected": 1}
+
+    def test_keeps_event_loop_free_while_working(self):
+        """Testa que o trabalho bloqueante roda fora do event loop."""
+        executor = BoundedExecutor(max_workers=1, queue_limit=0)
+
+        async def scenario():
+            ticks = 0
+            done = asyncio.Event()
+
+            async def ticker():
+                nonlocal ticks
+                while not done.is_set():
+                    ticks += 1
+                    await asyncio.sleep(0.005)
+
+            task = asyncio.create_task(ticker())
+            await executor.run(time.sleep, 0.2)
+            done.set()
+            await task
+            return ticks
+
+        assert asyncio.run(scenario()) > 10
@@ -0,0 +1,143 @@
+import asyncio
+import os
+import sys
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+from app.core.auth import create_access_token
+import app.core.catalog_snapshot as catalog_snapshot_module
+from app.core.catalog_snapshot import CatalogSnapshot, catalog_snapshot
+from app.core.response_cache import dataset_version
+from app.entities.book_entity import Book
+from app.services.books_service import get_books_by_price_range, get_top_rated_books
+from app.services.ingest_service import upsert_books
+
+CATALOG = [
+    ("Zebra Tales", 12.5, "Five", "Poetry"), ("Apple Pie", 12.5, "Five", "Food"),
+    ("Mango Dreams", 30.0, "Two", "Poetry"), ("Apple Pie", 45.0, "Five", "Food"),
+    ("Night Train", 30.0, "Four", "Travel"), ("Blue Moon", 59.99, "One", "Poetry"),
+    ("Quiet Hills", 8.0, "Three", "Travel"), ("Echo", 45.0, "Five", "Poetry"),
+]
+
+
+def add_catalog(db_session):
+    for number, (title, price, rating, category) in enumerate(CATALOG):
+        db_session.add(Book(title=title, price=price, availability="Out of stock" if number % 3 == 2 else "In stock",
+                            rating=rating, category=category, image_url=""))
+    db_session.commit()
+
+
+def ids(books):
+    return [book.id for book in books]
+
+
+class TestCatalogSnapshot:
+    """Testes para o snapshot colunar do catálogo em memória."""
+
+    def test_price_range_matches_database(self, db_session):
+        """Testa que a faixa de preço do snapshot retorna o mesmo que a consulta SQL, inclusive com cursor."""
+        add_catalog(db_session)
+        snapshot = catalog_snapshot.get(db_session)
+
+        for min_price, max_price in ((0, 100), (12.5, 30.0), (12.6, 44.99), (45.0, 45.0), (60, 70)):
+            assert ids(snapshot.price_range(min_price, max_price)) == \
+                ids(get_books_by_price_range(db_session, min_price, max_price))
+        assert ids(snapshot.price_range(0, 100, after_id=3, limit=2)) == \
+            ids(get_books_by_price_range(db_session, 0, 100, after_id=3, limit=2))
+
+    def test_price_range_filters_by_category_and_rating(self, db_session):
+        """Testa os filtros opcionais de categoria e classificação mínima."""
+        add_catalog(db_session)
+        snapshot = catalog_snapshot.get(db_session)
+
+        poetry = snapshot.price_range(0, 100, category="Poetry")
+        well_rated = snapshot.price_range(10, 50, min_rating=4)
+
+        assert [book.title for book in poetry] == ["Zebra Tales", "Mango Dreams", "Blue Moon", "Echo"]
+        assert [book.title for book in well_rated] == ["Zebra Tales", "Apple Pie", "Apple Pie", "Night Train", "Echo"]
+        assert snapshot.price_range(0, 100, category="Unknown") == []
+
+    def test_price_range_filters_by_availability(self, db_session):
+        """Testa o filtro de disponibilidade, sem diferenciar maiúsculas e minúsculas."""
+        add_catalog(db_session)
+        snapshot = catalog_snapshot.get(db_session)
+
+        out_of_stock = snapshot.price_range(0, 100, availability="OUT OF STOCK")
+        in_stock_poetry = snapshot.price_range(0, 100, category="Poetry", availability="in stock")
+
+        assert [book.title for book in out_of_stock] == ["Mango Dreams", "Blue Moon"]
+        assert [book.title for book in in_stock_poetry] == ["Zebra Tales", "Echo"]
+        assert snapshot.price_range(0, 100, availability="Preorder") == []
+
+    def test_concurrent_reload_builds_snapshot_once(self, db_session, monkeypatch):
+        """Testa que requisições concorrentes após uma mudança no dataset reconstroem o snapshot uma única vez."""
+        add_catalog(db_session)
+        loads = []
+        load = CatalogSnapshot.load
+        monkeypatch.setattr(catalog_snapshot_module.CatalogSnapshot, "load",
+                            classmethod(lambda cls, db, version: loads.append(version) or load(db, version)))
+
+        async def scenario():
+            engine = create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool)
+            sessions = async_sessionmaker(engine)
+
+            async def request():
+                async with sessions() as db:
+                    return await catalog_snapshot.get_async(db)
+
+            try:
+                return await asyncio.gather(*(request() for _ in range(8)))
+            finally:
+                await engine.dispose()
+
+        snapshots = asyncio.run(scenario())
+
+        assert len(loads) == 1
+        assert all(snapshot is snapshots[0] for snapshot in snapshots)
+        assert len(snapshots[0]) == len(CATALOG)
+
+    def test_top_rated_matches_database_for_every_secondary_sort(self, db_session):
+        """Testa que o top-k do snapshot segue a mesma ordenação e desempate da consulta SQL."""
+        add_catalog(db_session)
+        snapshot = catalog_snapshot.get(db_session)
+
+        for then_by in (None, "price", "-price", "title", "-title"):
+            assert ids(snapshot.top_rated(5, then_by)) == ids(get_top_rated_books(db_session, 5, then_by))
+
+    def test_snapshot_is_swapped_when_dataset_changes(self, db_session):
+        """Testa que o snapshot é reutilizado até uma nova ingestão e então substituído."""
+        add_catalog(db_session)
+        first = catalog_snapshot.get(db_session)
+        assert catalog_snapshot.get(db_session) is first
+
+        upsert_books(db_session, [{
+            "title": "Fresh Book", "price": 1.0, "rating": "Five", "availability": "In stock",
+            "category": "Poetry", "image_url": "", "book_url": "https://books.toscrape.com/catalogue/fresh/index.html"
+        }])
+        second = catalog_snapshot.get(db_session)
+
+        assert second is not first
+        assert second.version == dataset_version.get(db_session) == first.version + 1
+        assert len(second) == len(first) + 1
+        assert [book.title for book in second.price_range(0, 5)] == ["Fresh Book"]
+        assert len(first.price_range(0, 5)) == 0
+
+    def test_empty_catalog(self, db_session):
+        """Testa o snapshot de um catálogo vazio."""
+        snapshot = CatalogSnapshot.load(db_session, 0)
+
+        assert len(snapshot) == 0
+        assert snapshot.price_range(0, 100) == []
+        assert snapshot.top_rated(10) == []
+
+    def test_price_range_endpoint_filters(self, client, multiple_books, sample_user):
+        """Testa os filtros de categoria e classificação no endpoint de faixa de preço."""
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': sample_user.username})}"}
+
+        response = client.get("/api/v1/books/price-range?min=0&max=100&category=Technology&min_rating=5",
+                              headers=headers)
+        invalid = client.get("/api/v1/books/price-range?min=0&max=100&min_rating=6", headers=headers)
+
+        assert response.status_code == 200
+        assert [book["title"] for book in response.json()] == ["Python Programming"]
+        assert invalid.status_code == 422
@@ -0,0 +1,105 @@
+import gzip
+import os
+import sys
+import pytest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+import app.core.compression as compression
+import app.core.response_cache as response_cache_module
+from app.core.auth import create_access_token
+from app.core.compression import compress_variants, negotiate_encoding
+from app.core.response_cache import response_cache
+from app.services.ingest_service import upsert_books
+
+
+def add_books(db_session, count=50):
+    upsert_books(db_session, [{
+        "title": f"Book {number}", "price": 10.0, "rating": "Three", "availability": "In stock",
+        "category": "Poetry", "image_url": "",
+        "book_url": f"https://books.toscrape.com/catalogue/book_{number}/index.html"
+    } for number in range(count)])
+
+
+class TestCompression:
+    """Testes para a negociação de codificação e as variantes pré-comprimidas."""
+
+    def test_negotiate_encoding_respects_quality_values(self, monkeypatch):
+        """Testa a escolha da codificação pelo header Accept-Encoding, incluindo q=0 e curinga."""
+        monkeypatch.setattr(compression, "ENCODERS", {"br": None, "gzip": None})
+
+        assert negotiate_encoding(None) is None
+        assert negotiate_encoding("identity") is None
+        assert negotiate_encoding("gzip, deflate") == "gzip"
+        assert negotiate_encoding("gzip, br") == "br"
+        assert negotiate_encoding("br;q=0.5, gzip") == "gzip"
+        assert negotiate_encoding("br;q=0, *") == "gzip"
+        assert negotiate_encoding("gzip;q=0, br;q=0") is None
+
+    def test_small_payloads_are_not_compressed(self):
+        """Testa que respostas abaixo do tamanho mínimo não geram variantes comprimidas."""
+        assert compress_variants(b"x" * (compression.COMPRESSION_MIN_SIZE - 1)) == {}
+        assert gzip.decompress(compress_variants(b"x" * compression.COMPRESSION_MIN_SIZE)["gzip"]) == \
+            b"x" * compression.COMPRESSION_MIN_SIZE
+
+    def test_cached_response_serves_stored_gzip_variant(self, client, multiple_books, sample_user, monkeypatch):
+        """Testa que a variante gzip é gerada uma vez no cache e reutilizada nos acertos seguintes."""
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': sample_user.username})}"}
+        monkeypatch.setattr(compression, "COMPRESSION_MIN_SIZE", 0)
+        calls = []
+        monkeypatch.setattr(response_cache_module, "compress_variants",
+                            lambda body: calls.append(body) or compress_variants(body))
+
+        identity = client.get("/api/v1/books/?limit=3", headers={**headers, "Accept-Encoding": "identity"})
+        first = client.get("/api/v1/books/?limit=3", headers={**headers, "Accept-Encoding": "gzip"})
+        second = client.get("/api/v1/books/?limit=3", headers={**headers, "Accept-Encoding": "gzip"})
+        not_modified = client.get("/api/v1/books/?limit=3",
+                                  headers={**headers, "Accept-Encoding": "gzip", "If-None-Match": first.headers["ETag"]})
+
+        assert "content-encoding" not in identity.headers
+        assert identity.headers["Vary"] == "Accept-Encoding"
+        assert first.headers["Content-Encoding"] == "gzip"
+        assert first.json() == second.json() == identity.json()
+        assert first.headers["ETag"] == f"W/{identity.headers['ETag']}"
+        assert not_modified.status_code == 304
+        assert not_modified.headers["ETag"] == first.headers["ETag"]
+        assert not_modified.headers["Vary"] == first.headers["Vary"] == "Accept-Encoding"
+        assert len(calls) == 1
+        assert response_cache.hits == 2
+
+    def test_cached_response_serves_brotli_when_preferred(self, client, multiple_books, sample_user, monkeypatch):
+        """Testa que o brotli é escolhido quando o cliente aceita br e gzip."""
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': sample_user.username})}"}
+        monkeypatch.setattr(compression, "COMPRESSION_MIN_SIZE", 0)
+
+        identity = client.get("/api/v1/books/?limit=3", headers={**headers, "Accept-Encoding": "identity"})
+        response = client.get("/api/v1/books/?limit=3", headers={**headers, "Accept-Encoding": "gzip, br"})
+
+        assert response.headers["Content-Encoding"] == "br"
+        assert response.json() == identity.json()
+
+    @pytest.mark.parametrize("accept_encoding, encoding", [("gzip", "gzip"), ("gzip, br", "br")])
+    def test_export_is_compressed_by_middleware(self, client, db_session, sample_user, accept_encoding, encoding):
+        """Testa que respostas não cacheadas, como a exportação em streaming, usam a codificação negociada."""
+        add_books(db_session)
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': sample_user.username})}"}
+
+        compressed = client.get("/api/v1/books/export", headers={**headers, "Accept-Encoding": accept_encoding})
+        plain = client.get("/api/v1/books/export", headers={**headers, "Accept-Encoding": "identity"})
+
+        assert compressed.headers["Content-Encoding"] == encoding
+        assert compressed.headers["Vary"] == "Accept-Encoding"
+        assert "content-length" not in compressed.headers
+        assert compressed.num_bytes_downloaded < plain.num_bytes_downloaded
+        assert compressed.content == plain.content
+
+    def test_uncached_list_is_brotli_compressed_by_middleware(self, client, db_session, sample_user):
+        """Testa que listas grandes fora do cache, como a busca, também recebem brotli."""
+        add_books(db_session)
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': sample_user.username})}"}
+
+        compressed = client.get("/api/v1/books/search?title=book", headers={**headers, "Accept-Encoding": "br"})
+        plain = client.get("/api/v1/books/search?title=book", headers={**headers, "Accept-Encoding": "identity"})
+
+        assert compressed.headers["Content-Encoding"] == "br"
+        assert int(compressed.headers["Content-Length"]) == compressed.num_bytes_downloaded
+        assert compressed.num_bytes_downloaded < plain.num_bytes_downloaded
+        assert compressed.json() == plain.json()
@@ -0,0 +1,149 @@
+import asyncio
+import os
+import shutil
+import sqlite3
+import stat
+import subprocess
+import sys
+import textwrap
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+API_DIR = os.path.join(os.path.dirname(__file__), '..', 'api')
+DATA_DB = os.path.join(API_DIR, 'app', 'core', 'data', 'data.db')
+sys.path.insert(0, API_DIR)
+import app.core.database as database
+from app.core.database import create_sqlite_engine, create_async_sqlite_engine
+
+
+SLOW_QUERY = "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 500000) SELECT SUM(x) FROM n"
+
+
+@pytest.fixture
+def engines(tmp_path):
+    url = f"sqlite:///{tmp_path / 'profile.db'}"
+    write_engine = create_sqlite_engine(url, pool_size=1, max_overflow=0)
+    read_engine = create_sqlite_engine(url, read_only=True, pool_size=2, max_overflow=0)
+    with write_engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name VARCHAR)"))
+        conn.execute(text("INSERT INTO items (name) VALUES ('first')"))
+    yield write_engine, read_engine
+    read_engine.dispose()
+    write_engine.dispose()
+
+
+def test_write_engine_applies_storage_profile(engines):
+    """Testa que o engine de escrita aplica WAL e os pragmas configurados."""
+    write_engine, _ = engines
+
+    with write_engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+
+
+def test_write_engine_keeps_journal_mode_of_read_only_database(tmp_path, monkeypatch):
+    """Testa que, sem permissão de escrita no banco, o engine conecta sem tentar ativar o WAL."""
+    path = tmp_path / 'readonly.db'
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    monkeypatch.setattr(database.os, "access", lambda *args: False)
+    write_engine = create_sqlite_engine(f"sqlite:///{path}")
+
+    with write_engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+        assert conn.execute(text("SELECT COUNT(*) FROM items")).scalar() == 0
+    write_engine.dispose()
+
+
+def test_read_engine_rejects_writes(engines):
+    """Testa que o engine de leitura não permite escrita."""
+    _, read_engine = engines
+
+    with read_engine.connect() as conn:
+        assert conn.execute(text("PRAGMA query_only")).scalar() == 1
+        with pytest.raises(OperationalError):
+            conn.execute(text("INSERT INTO items (name) VALUES ('blocked')"))
+
+
+def test_writes_commit_while_read_is_in_progress(engines):
+    """Testa que a escrita conclui enquanto uma leitura está em andamento, sem bloquear nenhuma das duas."""
+    write_engine, read_engine = engines
+    with write_engine.begin() as writer:
+        writer.execute(text("INSERT INTO items (name) VALUES ('second')"))
+
+    with read_engine.connect() as reader:
+        result = reader.execute(text("SELECT name FROM items ORDER BY id"))
+        assert result.fetchone() == ("first",)
+
+        with write_engine.begin() as writer:
+            writer.execute(text("INSERT INTO items (name) VALUES ('third')"))
+
+        assert result.fetchone() == ("second",)
+        result.close()
+
+    with read_engine.connect() as reader:
+        assert reader.execute(text("SELECT COUNT(*) FROM items")).scalar() == 3
+
+
+def test_async_engine_keeps_event_loop_free_during_queries(engines, tmp_path):
+    """Testa que uma consulta lenta pelo engine assíncrono não bloqueia o event loop."""
+    async_engine = create_async_sqlite_engine(f"sqlite+aiosqlite:///{tmp_path / 'profile.db'}", read_only=True,
+                                              pool_size=1, max_overflow=0)
+
+    async def scenario():
+        ticks = 0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        async with async_engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 1
+            assert (await conn.execute(text(SLOW_QUERY))).scalar() == 125000250000
+        done.set()
+        await task
+        await async_engine.dispose()
+        return ticks
+
+    assert asyncio.run(scenario()) > 10
+
+
+# Root ignores file permissions, so SQLite is also told to open the files read-only, like a read-only mount
+READ_ONLY_STARTUP = textwrap.dedent("""
+    import sqlite3
+    connect = sqlite3.connect
+    sqlite3.connect = sqlite3.dbapi2.connect = lambda database, *args, **kwargs: connect(
+        f"file:{database}?mode=ro", *args, uri=True, **kwargs)
+    from fastapi.testclient import TestClient
+    from main import app
+    client = TestClient(app)
+    print(client.get("/api/v1/health/").status_code,
+          client.post("/api/v1/auth/login", data={"username": "nobody", "password": "secret"}).status_code)
+""")
+
+
+def test_app_starts_on_read_only_copy_of_bundled_database(tmp_path):
+    """Testa que a API importa e responde usando uma cópia somente leitura do data.db distribuído."""
+    data_dir = tmp_path / 'readonly'
+    data_dir.mkdir()
+    shutil.copyfile(DATA_DB, data_dir / 'data.db')
+    (data_dir / 'data.db').chmod(stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+    data_dir.chmod(stat.S_IRUSR | stat.S_IXUSR)
+    env = {**os.environ, 'SQLITE_DATABASE_PATH': str(data_dir / 'data.db'), 'SECRET_KEY': 'secret',
+           'ALGORITHM': 'HS256', 'ACCESS_TOKEN_EXPIRE_MINUTES': '30', 'REFRESH_TOKEN_EXPIRE_DAYS': '7'}
+
+    try:
+        result = subprocess.run([sys.executable, '-c', READ_ONLY_STARTUP], cwd=API_DIR, env=env,
+                                capture_output=True, text=True, timeout=60)
+    finally:
+        data_dir.chmod(stat.S_IRWXU)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["200", "401"]
+    assert sorted(os.listdir(data_dir)) == ['data.db']
@@ -0,0 +1,85 @@
+import os
+import sys
+import requests
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+from app.services.scrapper import http_client as http_client_module
+from app.services.scrapper.http_client import HttpClient
+
+
+def make_response(url, status_code, content=b"<html></html>"):
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response._content = content
+    response.reason = "Test"
+    return response
+
+
+def fake_session_get(responses, calls):
+    def get(url, headers=None, timeout=None):
+        calls.append(url)
+        result = responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return make_response(url, *result)
+    return get
+
+
+class TestHttpClient:
+    """Testes para o cliente HTTP compartilhado do scraper."""
+
+    def test_get_reuses_session_and_returns_content(self, monkeypatch):
+        """Testa que as requisições usam a mesma sessão com keep-alive e os headers padrão."""
+        client = HttpClient(backoff_base=0)
+        calls = []
+        monkeypatch.setattr(client.session, "get", fake_session_get([(200, b"ok"), (200, b"ok")], calls))
+
+        first = client.get("https://books.toscrape.com/")
+        second = client.get("https://books.toscrape.com/catalogue/")
+
+        assert first['status_code'] == 200
+        assert first['content'] == b"ok"
+        assert first['url'] == "https://books.toscrape.com/"
+        assert second['content'] == b"ok"
+        assert len(calls) == 2
+        assert "User-Agent" in client.session.headers
+
+    def test_get_retries_transient_errors_with_backoff(self, monkeypatch):
+        """Testa que erros transitórios são repetidos com backoff exponencial."""
+        client = HttpClient(backoff_base=0.5, max_retries=3)
+        calls = []
+        sleeps = []
+        monkeypatch.setattr(client.session, "get", fake_session_get(
+            [requests.exceptions.ConnectionError("reset"), (503,), (200,)], calls
+        ))
+        monkeypatch.setattr(http_client_module.time, "sleep", sleeps.append)
+
+        result = client.get("https://books.toscrape.com/")
+
+        assert result['status_code'] == 200
+        assert len(calls) == 3
+        assert 0 <= sleeps[0] <= 0.5
+        assert 0 <= sleeps[1] <= 1.0
+        assert client.retry_budget.used == 2
+
+    def test_get_does_not_retry_client_errors(self, monkeypatch):
+        """Testa que erros 4xx não são repetidos."""
+        client = HttpClient(backoff_base=0)
+        calls = []
+        monkeypatch.setattr(client.session, "get", fake_session_get([(404,)], calls))
+
+        assert client.get("https://books.toscrape.com/missing.html") is None
+        assert len(calls) == 1
+
+    def test_get_stops_when_retry_budget_is_exhausted(self, monkeypatch):
+        """Testa que o orçamento de retentativas da execução é respeitado."""
+        client = HttpClient(backoff_base=0, max_retries=5, retry_budget=1)
+        calls = []
+        monkeypatch.setattr(client.session, "get", fake_session_get([(503,)] * 5, calls))
+
+        assert client.get("https://books.toscrape.com/") is None
+        assert len(calls) == 2
+        assert client.retry_budget.remaining == 0
+
+        client.reset_retry_budget()
+        assert client.retry_budget.remaining == 1
@@ -0,0 +1,231 @@
+import os
+import sqlite3
+import sys
+from sqlalchemy import Float, create_engine, event, inspect, text
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+from app.core.database import Base
+from app.entities.book_entity import Book
+from app.services.ingest_service import upsert_books
+from sqlalchemy.orm import sessionmaker
+import app.core.migrations as migrations
+from app.core.migrations import run_migrations, schema_version
+
+
+def make_books(count):
+    return [
+        {
+            'title': f"Book {i}",
+            'price': 10.0 + i,
+            'rating': "Three",
+            'availability': "In Stock",
+            'category': "Poetry",
+            'image_url': f"https://books.toscrape.com/media/{i}.jpg",
+            'book_url': f"https://books.toscrape.com/catalogue/book_{i}/index.html",
+        }
+        for i in range(count)
+    ]
+
+
+class TestUpsertBooks:
+    """Testes para a ingestão em lote com upsert pela URL do livro."""
+
+    def test_upsert_books_inserts_new_records(self, db_session):
+        """Testa que livros novos são inseridos e contabilizados."""
+        counts = upsert_books(db_session, make_books(5))
+
+        assert counts == {'inserted': 5, 'updated': 0, 'unchanged': 0}
+        assert db_session.query(Book).count() == 5
+        assert {book.rating_value for book in db_session.query(Book)} == {3}
+
+    def test_reingest_keeps_table_size(self, db_session):
+        """Testa que reingerir o mesmo catálogo não duplica registros."""
+        upsert_books(db_session, make_books(1200), chunk_size=500)
+
+        counts = upsert_books(db_session, make_books(1200), chunk_size=500)
+
+        assert counts == {'inserted': 0, 'updated': 0, 'unchanged': 1200}
+        assert db_session.query(Book).count() == 1200
+
+    def test_upsert_books_updates_changed_records(self, db_session):
+        """Testa que apenas os livros alterados são atualizados."""
+        upsert_books(db_session, make_books(3))
+        books = make_books(4)
+        books[1]['price'] = 99.5
+        books[2]['availability'] = "Out of stock"
+
+        counts = upsert_books(db_session, books)
+
+        assert counts == {'inserted': 1, 'updated': 2, 'unchanged': 1}
+        assert db_session.query(Book).count() == 4
+        book = db_session.query(Book).filter(Book.book_url == books[1]['book_url']).one()
+        assert float(book.price) == 99.5
+
+    def test_upsert_books_without_url_are_inserted(self, db_session):
+        """Testa que registros sem URL são inseridos sem deduplicação."""
+        books = make_books(2)
+        for book in books:
+            book['book_url'] = ""
+
+        counts = upsert_books(db_session, books)
+
+        assert counts == {'inserted': 2, 'updated': 0, 'unchanged': 0}
+
+
+def create_legacy_database(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE books (id INTEGER PRIMARY KEY, title VARCHAR NOT NULL, price VARCHAR NOT NULL, "
+            "availability VARCHAR NOT NULL, rating VARCHAR, category VARCHAR NOT NULL, image_url VARCHAR)"
+        ))
+        conn.execute(text("CREATE INDEX ix_books_title ON books (title)"))
+        conn.execute(text(
+            "INSERT INTO books (id, title, price, availability, rating, category) VALUES "
+            "(7, 'Old', '51.77', 'In Stock', 'Three', 'Poetry'), (9, 'Older', '9.5', 'In Stock', 'One', 'Travel')"
+        ))
+    return engine
+
+
+def test_run_migrations_adds_book_url_to_legacy_table(tmp_path):
+    """Testa que a migração adiciona a coluna book_url com índice único em bancos antigos."""
+    engine = create_legacy_database(tmp_path)
+
+    run_migrations(engine)
+    run_migrations(engine)
+
+    inspector = inspect(engine)
+    assert 'book_url' in {column['name'] for column in inspector.get_columns('books')}
+    assert any(index['name'] == 'ix_books_book_url' and index['unique'] for index in inspector.get_indexes('books'))
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM books")).scalar_one() == 2
+
+
+def test_run_migrations_converts_price_to_numeric(tmp_path):
+    """Testa que a migração converte o preço para coluna numérica indexada, preservando os dados."""
+    engine = create_legacy_database(tmp_path)
+
+    run_migrations(engine)
+
+    inspector = inspect(engine)
+    price = next(column for column in inspector.get_columns('books') if column['name'] == 'price')
+    assert isinstance(price['type'], Float)
+    assert {index['name'] for index in inspector.get_indexes('books')} >= {'ix_books_price', 'ix_books_title'}
+    assert not inspector.has_table('books_old')
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT id, price, typeof(price) FROM books ORDER BY id")).all()
+        plan = " ".join(row[-1] for row in conn.execute(
+            text("EXPLAIN QUERY PLAN SELECT * FROM books WHERE price BETWEEN 10 AND 60")
+        ))
+    assert rows == [(7, 51.77, 'real'), (9, 9.5, 'real')]
+    assert "ix_books_price" in plan
+
+
+def test_run_migrations_backfills_rating_value(tmp_path):
+    """Testa que a migração preenche a avaliação numérica e que o top-rated usa o índice."""
+    engine = create_legacy_database(tmp_path)
+
+    run_migrations(engine)
+
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT id, rating_value FROM books ORDER BY id")).all()
+        plan = " ".join(row[-1] for row in conn.execute(
+            text("EXPLAIN QUERY PLAN SELECT * FROM books ORDER BY rating_value DESC, id LIMIT 10")
+        ))
+    assert rows == [(7, 3), (9, 1)]
+    assert "ix_books_rating_value_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_run_migrations_is_read_only_once_schema_is_current(tmp_path):
+    """Testa que, com o user_version em dia, a migração só lê o banco e funciona numa conexão somente leitura."""
+    engine = create_legacy_database(tmp_path)
+    run_migrations(engine)
+    path = engine.url.database
+    read_only = create_engine("sqlite://", creator=lambda: sqlite3.connect(f"file:{path}?mode=ro", uri=True))
+
+    run_migrations(read_only)
+
+    assert schema_version(read_only) == len(migrations.MIGRATIONS)
+
+
+def test_run_migrations_skips_rating_backfill_when_up_to_date(tmp_path):
+    """Testa que, com as avaliações já preenchidas, a migração não executa o UPDATE novamente."""
+    engine = create_legacy_database(tmp_path)
+    run_migrations(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    with engine.begin() as conn:
+        migrations._add_rating_value(conn, {'rating_value': {}})
+
+    assert not [statement for statement in statements if statement.startswith("UPDATE")]
+
+
+def test_run_migrations_builds_search_index(tmp_path):
+    """Testa que a migração cria e popula o índice full-text em bancos antigos."""
+    engine = create_legacy_database(tmp_path)
+
+    run_migrations(engine)
+
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO books (title, price, availability, rating, rating_value, category) "
+                          "VALUES ('New', 1.0, 'In Stock', 'Two', 2, 'Poetry')"))
+        matches = conn.execute(text("SELECT rowid FROM books_fts WHERE books_fts MATCH 'category : poetry' "
+                                    "ORDER BY rowid")).scalars().all()
+    assert matches == [7, 10]
+
+
+def test_run_migrations_backfills_category_stats(tmp_path):
+    """Testa que a migração cria e preenche a tabela de estatísticas por categoria."""
+    engine = create_legacy_database(tmp_path)
+
+    run_migrations(engine)
+
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO books (title, price, availability, rating, rating_value, category) "
+                          "VALUES ('New', 1.0, 'In Stock', 'Two', 2, 'Poetry')"))
+        rows = conn.execute(text(
+            "SELECT category, book_count, min_price, max_price, rating_2, rating_3 FROM category_stats ORDER BY category"
+        )).all()
+    assert rows == [("Poetry", 2, 1.0, 51.77, 1, 1), ("Travel", 1, 9.5, 9.5, 0, 0)]
+
+
+def test_run_migrations_backfills_book_url_from_scraped_csv(tmp_path, monkeypatch):
+    """Testa que a migração preenche book_url dos registros antigos a partir dos CSVs de coletas anteriores."""
+    engine = create_legacy_database(tmp_path)
+    (tmp_path / "books_data_20250101_000000.csv").write_text(
+        "title,price,rating,availability,category,image_url,book_url\n"
+        "Old,51.77,Three,In Stock,Poetry,,https://books.toscrape.com/catalogue/old_7/index.html\n"
+        "Older,9.5,One,In Stock,Poetry,,https://books.toscrape.com/catalogue/older_9/index.html\n",
+        encoding="utf-8"
+    )
+    monkeypatch.setattr(migrations, "LEGACY_CSV_DIR", str(tmp_path))
+
+    run_migrations(engine)
+
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT id, book_url FROM books ORDER BY id")).all()
+    assert rows == [(7, "https://books.toscrape.com/catalogue/old_7/index.html"), (9, None)]
+
+
+def test_first_keyed_ingest_adopts_legacy_records(tmp_path, monkeypatch):
+    """Testa que a primeira ingestão com URL reaproveita registros antigos sem book_url em vez de duplicá-los."""
+    engine = create_legacy_database(tmp_path)
+    monkeypatch.setattr(migrations, "LEGACY_CSV_DIR", str(tmp_path))
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+    books = make_books(2)
+    books[0].update(title="Old", category="Poetry")
+    books[1].update(title="Older", category="Travel")
+    books.append({**make_books(3)[2], 'title': "Brand New"})
+
+    with sessionmaker(bind=engine)() as db:
+        counts = upsert_books(db, books)
+        again = upsert_books(db, books)
+
+    assert counts == {'inserted': 1, 'updated': 2, 'unchanged': 0}
+    assert again == {'inserted': 0, 'updated': 0, 'unchanged': 3}
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT id, title FROM books WHERE book_url IS NOT NULL ORDER BY id")).all()
+    assert rows == [(7, "Old"), (9, "Older"), (10, "Brand New")]
@@ -0,0 +1,54 @@
+import os
+import sys
+import filecmp
+import requests
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+from app.services.scrapper.http_client import HttpClient
+from app.services.scrapper.recorder import ResponseRecorder
+from app.services.scrapper.replay_server import ReplayServer
+from app.services.scrapper.scrapper_service import BooksToScrapeScraper
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'books_toscrape')
+
+
+class TestReplayServer:
+    """Testes para o gravador de respostas e o servidor local de replay."""
+
+    def test_scraper_runs_against_replay_and_records_corpus(self, tmp_path):
+        """Testa que o scraper roda contra o servidor local e grava um corpus idêntico ao original."""
+        recorder = ResponseRecorder(str(tmp_path))
+        client = HttpClient(backoff_base=0, recorder=recorder)
+
+        with ReplayServer(FIXTURES_DIR) as server:
+            scraper = BooksToScrapeScraper(base_url=server.base_url, delay=0, http_client=client)
+            books = scraper.scrape_all_books()
+
+        assert len(books) == 4
+        assert all(book['book_url'].startswith(server.base_url) for book in books)
+        assert recorder.pages_recorded == 8
+        assert scraper.pages_parsed == 7
+        assert scraper.parse_ms_per_page > 0
+        for current_dir, _, files in os.walk(FIXTURES_DIR):
+            for name in files:
+                relative = os.path.relpath(os.path.join(current_dir, name), FIXTURES_DIR)
+                assert filecmp.cmp(os.path.join(FIXTURES_DIR, relative), tmp_path / relative, shallow=False)
+
+    def test_replay_server_injects_errors(self):
+        """Testa que o servidor local injeta erros 503 conforme a taxa configurada."""
+        with ReplayServer(FIXTURES_DIR, error_rate=1.0) as server:
+            response = requests.get(server.base_url)
+            client = HttpClient(backoff_base=0, max_retries=2)
+            result = client.get(server.base_url)
+
+        assert response.status_code == 503
+        assert result is None
+        assert server.errors_injected == 3
+
+    def test_replay_server_returns_404_for_unknown_pages(self):
+        """Testa que páginas fora do corpus retornam 404."""
+        with ReplayServer(FIXTURES_DIR) as server:
+            missing = requests.get(server.base_url + "catalogue/missing/index.html")
+            escaped = requests.get(server.base_url + "../conftest.py")
+
+        assert missing.status_code == 404
+        assert escaped.status_code == 404
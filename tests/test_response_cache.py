@@ -0,0 +1,102 @@
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+from app.core.auth import create_access_token
+from app.core.response_cache import CachedResponse, ResponseCache, RESPONSE_CACHE_CONTROL, response_cache
+from app.services.ingest_service import upsert_books
+
+
+class TestResponseCache:
+    """Testes para o cache de respostas renderizadas."""
+
+    def test_lru_eviction_respects_byte_budget(self):
+        """Testa que as entradas menos usadas são removidas ao exceder o orçamento de bytes."""
+        cache = ResponseCache(max_bytes=25)
+        cache.put("a", CachedResponse(b"x" * 10))
+        cache.put("b", CachedResponse(b"x" * 10))
+        cache.get("a")
+        cache.put("c", CachedResponse(b"x" * 10))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats()["bytes"] == 20
+        assert cache.stats()["evictions"] == 1
+
+    def test_entries_larger_than_budget_are_not_cached(self):
+        """Testa que respostas maiores que o orçamento não são armazenadas."""
+        cache = ResponseCache(max_bytes=5)
+        cache.put("a", CachedResponse(b"x" * 10))
+
+        assert cache.get("a") is None
+        assert cache.stats() == {"entries": 0, "bytes": 0, "max_bytes": 5, "hits": 0, "misses": 1,
+                                 "evictions": 0, "hit_rate": 0.0}
+
+    def test_repeated_reads_hit_cache_until_dataset_changes(self, client, db_session, multiple_books, sample_user):
+        """Testa que leituras repetidas vêm do cache e que uma nova ingestão invalida as respostas."""
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': sample_user.username})}"}
+
+        first = client.get("/api/v1/books/?limit=2", headers=headers)
+        second = client.get("/api/v1/books/?limit=2", headers=headers)
+        assert second.content == first.content
+        assert second.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+        assert response_cache.hits == 1
+        assert response_cache.misses == 1
+
+        upsert_books(db_session, [{
+            "title": "Fresh Book", "price": 1.0, "rating": "One", "availability": "In stock",
+            "category": "Poetry", "image_url": "", "book_url": "https://books.toscrape.com/catalogue/fresh/index.html"
+        }])
+        categories = client.get("/api/v1/categories/", headers=headers)
+        books = client.get("/api/v1/books/?limit=10", headers=headers)
+
+        assert "Poetry" in categories.json()
+        assert "Fresh Book" in [book["title"] for book in books.json()]
+        assert response_cache.misses == 3
+
+    def test_conditional_get_returns_not_modified(self, client, multiple_books, sample_user):
+        """Testa que If-None-Match com o ETag atual retorna 304 sem corpo e sem renderizar a resposta."""
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': sample_user.username})}",
+                   "Accept-Encoding": "identity"}
+
+        first = client.get("/api/v1/stats/overview", headers=headers)
+        etag = first.headers["ETag"]
+        not_modified = client.get("/api/v1/stats/overview", headers={**headers, "If-None-Match": etag})
+        weak_in_list = client.get("/api/v1/stats/overview", headers={**headers, "If-None-Match": f'"other", W/{etag}'})
+        stale = client.get("/api/v1/stats/overview", headers={**headers, "If-None-Match": '"other"'})
+
+        assert first.status_code == 200
+        assert first.headers["Cache-Control"] == RESPONSE_CACHE_CONTROL
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["ETag"] == etag
+        assert not_modified.headers["Cache-Control"] == RESPONSE_CACHE_CONTROL
+        assert weak_in_list.status_code == 304
+        assert stale.status_code == 200
+        assert response_cache.misses == 1
+        assert response_cache.hits == 1
+
+    def test_etag_changes_with_params_and_dataset_version(self, client, db_session, multiple_books, sample_user):
+        """Testa que o ETag depende dos parâmetros de consulta e muda após uma nova ingestão."""
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': sample_user.username})}"}
+
+        page = client.get("/api/v1/books/?limit=2&after_id=0", headers=headers).headers["ETag"]
+        same_page = client.get("/api/v1/books/?after_id=0&limit=2", headers=headers).headers["ETag"]
+        other_page = client.get("/api/v1/books/?limit=1", headers=headers).headers["ETag"]
+        upsert_books(db_session, [{
+            "title": "Fresh Book", "price": 1.0, "rating": "One", "availability": "In stock",
+            "category": "Poetry", "image_url": "", "book_url": "https://books.toscrape.com/catalogue/fresh/index.html"
+        }])
+        after_scrape = client.get("/api/v1/books/?limit=2&after_id=0", headers={**headers, "If-None-Match": page})
+
+        assert page == same_page
+        assert page != other_page
+        assert after_scrape.status_code == 200
+        assert after_scrape.headers["ETag"] != page
+
+    def test_health_exposes_cache_counters(self, client):
+        """Testa que o endpoint de health expõe os contadores do cache."""
+        response = client.get("/api/v1/health/")
+
+        assert response.status_code == 200
+        assert set(response.json()["response_cache"]) >= {"hits", "misses", "bytes", "hit_rate"}
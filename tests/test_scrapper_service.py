@@ -0,0 +1,306 @@
+import os
+import sys
+import asyncio
+import hashlib
+import threading
+import time
+import csv
+import pytest
+from urllib.parse import urlparse
+from sqlalchemy.orm import sessionmaker
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+from app.services.scrapper import scrapper_service
+from app.services.scrapper.scrapper_service import BooksToScrapeScraper
+from app.services.scrapper.fingerprint_store import FingerprintStore
+from app.services.scrapper.checkpoint_journal import CheckpointJournal
+from app.services.scrapper.pipeline import BatchWriter
+from app.entities.book_entity import Book
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'books_toscrape')
+
+
+def load_fixture_page(url, headers=None, with_etag=True):
+    path = urlparse(url).path.lstrip('/') or 'index.html'
+    file_path = os.path.join(FIXTURES_DIR, path)
+    if not os.path.isfile(file_path):
+        return None
+    with open(file_path, 'rb') as f:
+        content = f.read()
+
+    response_headers = {}
+    if with_etag:
+        response_headers['ETag'] = f'"{hashlib.md5(content).hexdigest()}"'
+        if headers and headers.get('If-None-Match') == response_headers['ETag']:
+            return {'status_code': 304, 'content': b'', 'url': url, 'headers': response_headers}
+    return {'status_code': 200, 'content': content, 'url': url, 'headers': response_headers}
+
+
+@pytest.fixture
+def fake_books_site(monkeypatch):
+    """Substitui as requisições HTTP do scraper pelas páginas salvas em tests/fixtures."""
+    requested = []
+
+    def fake_safe_request(url, *args, headers=None, **kwargs):
+        requested.append(url)
+        return load_fixture_page(url, headers)
+
+    monkeypatch.setattr(scrapper_service, "safe_request", fake_safe_request)
+    return requested
+
+
+class TestBooksToScrapeScraper:
+    """Testes para o scraper do Books to Scrape."""
+
+    def test_scrape_all_books_sequential(self, fake_books_site):
+        """Testa o scraping sequencial completo sobre as páginas salvas."""
+        scraper = BooksToScrapeScraper(delay=0)
+
+        books = scraper.scrape_all_books()
+
+        assert len(books) == 4
+        assert scraper.pages_fetched == 8
+        attic = next(book for book in books if book['title'] == 'A Light in the Attic')
+        assert attic == {
+            'title': 'A Light in the Attic',
+            'price': 51.77,
+            'rating': 'Three',
+            'availability': 'In Stock',
+            'category': 'Poetry',
+            'image_url': 'https://books.toscrape.com/media/cache/fe/72/fe72f0532301ec28892ae79a629a293c.jpg',
+            'book_url': 'https://books.toscrape.com/catalogue/a-light-in-the-attic_1000/index.html'
+        }
+
+    def test_scrape_all_books_async_matches_sequential(self, fake_books_site):
+        """Testa que o modo assíncrono produz os mesmos registros do modo sequencial."""
+        sequential = BooksToScrapeScraper(delay=0).scrape_all_books()
+        scraper = BooksToScrapeScraper(delay=0)
+
+        books = asyncio.run(scraper.scrape_all_books_async())
+
+        def key(book):
+            return book['book_url']
+
+        assert sorted(books, key=key) == sorted(sequential, key=key)
+        assert scraper.pages_fetched == 8
+        assert scraper.pages_per_second > 0
+
+    def test_scrape_all_books_async_limits_requests_per_host(self, monkeypatch):
+        """Testa que o modo assíncrono respeita o limite de requisições simultâneas por host."""
+        lock = threading.Lock()
+        in_flight = {'current': 0, 'max': 0}
+
+        def slow_safe_request(url, *args, **kwargs):
+            with lock:
+                in_flight['current'] += 1
+                in_flight['max'] = max(in_flight['max'], in_flight['current'])
+            time.sleep(0.02)
+            with lock:
+                in_flight['current'] -= 1
+            return load_fixture_page(url)
+
+        monkeypatch.setattr(scrapper_service, "safe_request", slow_safe_request)
+        scraper = BooksToScrapeScraper(delay=0, max_concurrency_per_host=2)
+
+        books = asyncio.run(scraper.scrape_all_books_async())
+
+        assert len(books) == 4
+        assert in_flight['max'] == 2
+
+    def test_incremental_scrape_skips_unchanged_pages(self, fake_books_site, db_session):
+        """Testa que o modo incremental usa GET condicional e não reprocessa páginas inalteradas."""
+        store = FingerprintStore.load(db_session)
+        first = BooksToScrapeScraper(delay=0, fingerprint_store=store).scrape_all_books()
+        store.save(db_session)
+
+        scraper = BooksToScrapeScraper(delay=0, fingerprint_store=FingerprintStore.load(db_session))
+        second = scraper.scrape_all_books()
+
+        assert len(first) == 4
+        assert second == []
+        assert scraper.pages_unchanged == 4
+
+    def test_incremental_scrape_compares_content_hash_without_validators(self, monkeypatch):
+        """Testa que, sem ETag/Last-Modified, o hash do conteúdo identifica páginas inalteradas."""
+        monkeypatch.setattr(
+            scrapper_service, "safe_request",
+            lambda url, *args, **kwargs: load_fixture_page(url, with_etag=False)
+        )
+        store = FingerprintStore()
+        BooksToScrapeScraper(delay=0, fingerprint_store=store).scrape_all_books()
+        store.fingerprints.update(store.pending)
+        store.pending = {}
+
+        scraper = BooksToScrapeScraper(delay=0, fingerprint_store=store)
+        books = scraper.scrape_all_books()
+
+        assert books == []
+        assert scraper.pages_unchanged == 4
+
+    def test_interrupted_scrape_resumes_from_checkpoint(self, fake_books_site, monkeypatch, tmp_path):
+        """Testa que uma coleta interrompida é retomada a partir do journal de checkpoint."""
+        journal_path = str(tmp_path / "checkpoint.jsonl")
+        failing_url = "https://books.toscrape.com/catalogue/olio_984/index.html"
+
+        def flaky_safe_request(url, *args, headers=None, **kwargs):
+            fake_books_site.append(url)
+            return None if url == failing_url else load_fixture_page(url, headers)
+
+        monkeypatch.setattr(scrapper_service, "safe_request", flaky_safe_request)
+        first = BooksToScrapeScraper(delay=0, checkpoint=CheckpointJournal(journal_path)).scrape_all_books()
+
+        journal = CheckpointJournal(journal_path)
+        assert len(first) == 3
+        assert len(journal.completed_books) == 3
+        assert journal.is_category_done("https://books.toscrape.com/catalogue/category/books/travel_2/index.html")
+        assert not journal.is_category_done("https://books.toscrape.com/catalogue/category/books/poetry_23/index.html")
+
+        monkeypatch.setattr(
+            scrapper_service, "safe_request",
+            lambda url, *args, headers=None, **kwargs: fake_books_site.append(url) or load_fixture_page(url, headers)
+        )
+        fake_books_site.clear()
+        scraper = BooksToScrapeScraper(delay=0, checkpoint=journal)
+        second = scraper.scrape_all_books()
+
+        assert len(second) == 4
+        assert {book['book_url'] for book in second} == {book['book_url'] for book in first} | {failing_url}
+        assert [url for url in fake_books_site if '/catalogue/' in url and '/category/' not in url] == [failing_url]
+
+    def test_checkpoint_journal_ignores_truncated_entries(self, tmp_path):
+        """Testa que uma linha parcialmente escrita no journal não impede a retomada."""
+        journal_path = tmp_path / "checkpoint.jsonl"
+        journal = CheckpointJournal(str(journal_path))
+        journal.record_book("https://books.toscrape.com/catalogue/olio_984/index.html", {'title': 'Olio'})
+        journal.close()
+        with open(journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"type": "book", "url": "https://books.to')
+
+        restored = CheckpointJournal(str(journal_path))
+
+        assert list(restored.records()) == [{'title': 'Olio'}]
+        restored.clear()
+        assert not journal_path.exists()
+
+    def test_checkpoint_journal_keeps_only_urls_in_memory(self, tmp_path):
+        """Testa que o journal guarda em memória apenas as URLs concluídas e relê os livros do arquivo."""
+        journal = CheckpointJournal(str(tmp_path / "checkpoint.jsonl"))
+        for number in range(3):
+            journal.record_book(f"https://books.toscrape.com/catalogue/book_{number}/index.html", {'title': f"Book {number}"})
+        journal.record_book("https://books.toscrape.com/catalogue/unchanged_9/index.html", None)
+
+        assert journal.completed_books == {f"https://books.toscrape.com/catalogue/book_{number}/index.html"
+                                           for number in range(3)} | {
+            "https://books.toscrape.com/catalogue/unchanged_9/index.html"}
+        assert not any(isinstance(value, dict) for value in vars(journal).values())
+        assert [book['title'] for book in journal.records()] == ["Book 0", "Book 1", "Book 2"]
+        journal.clear()
+
+    def test_listing_only_scrape_skips_detail_pages(self, fake_books_site):
+        """Testa que o modo listing-only monta os livros apenas a partir das páginas de listagem."""
+        detailed = {book['book_url']: book for book in BooksToScrapeScraper(delay=0).scrape_all_books()}
+        fake_books_site.clear()
+        scraper = BooksToScrapeScraper(delay=0, listing_only=True)
+
+        books = scraper.scrape_all_books()
+
+        assert len(books) == 4
+        assert scraper.pages_fetched == 4
+        assert not [url for url in fake_books_site if '/catalogue/' in url and '/category/' not in url]
+        for book in books:
+            expected = detailed[book['book_url']]
+            assert {k: v for k, v in book.items() if k != 'image_url'} == \
+                   {k: v for k, v in expected.items() if k != 'image_url'}
+            assert book['image_url'].startswith('https://books.toscrape.com/media/cache/')
+
+        async_books = asyncio.run(BooksToScrapeScraper(delay=0, listing_only=True).scrape_all_books_async())
+        assert sorted(async_books, key=lambda b: b['book_url']) == sorted(books, key=lambda b: b['book_url'])
+
+    def test_listing_only_scrape_fetches_detail_for_missing_fields(self, monkeypatch):
+        """Testa que o modo listing-only busca a página de detalhe quando falta algum campo na listagem."""
+        requested = []
+
+        def safe_request_without_price(url, *args, **kwargs):
+            requested.append(url)
+            response_data = load_fixture_page(url)
+            if url.endswith('poetry_23/page-2.html'):
+                response_data['content'] = response_data['content'].replace(b'<p class="price_color">', b'<p>')
+            return response_data
+
+        monkeypatch.setattr(scrapper_service, "safe_request", safe_request_without_price)
+        scraper = BooksToScrapeScraper(delay=0, listing_only=True)
+
+        books = scraper.scrape_all_books()
+
+        olio = next(book for book in books if book['title'] == 'Olio')
+        assert olio['price'] == 23.88
+        assert "https://books.toscrape.com/catalogue/olio_984/index.html" in requested
+        assert scraper.pages_fetched == 5
+
+    @pytest.mark.parametrize("parser_backend", ["strained", "lxml"])
+    def test_parser_backends_produce_identical_records(self, fake_books_site, parser_backend):
+        """Testa que os backends de parser rápidos produzem os mesmos registros do html.parser."""
+        expected = BooksToScrapeScraper(delay=0).scrape_all_books()
+
+        books = BooksToScrapeScraper(delay=0, parser_backend=parser_backend).scrape_all_books()
+        listing_books = BooksToScrapeScraper(delay=0, listing_only=True, parser_backend=parser_backend).scrape_all_books()
+
+        assert books == expected
+        assert len(listing_books) == 4
+
+    def test_scrape_all_books_async_with_parse_workers(self, fake_books_site):
+        """Testa que o parsing em um pool de processos produz os mesmos registros do parsing em linha."""
+        expected = BooksToScrapeScraper(delay=0).scrape_all_books()
+        scraper = BooksToScrapeScraper(delay=0, parse_workers=2)
+
+        books = asyncio.run(scraper.scrape_all_books_async())
+
+        assert sorted(books, key=lambda b: b['book_url']) == sorted(expected, key=lambda b: b['book_url'])
+        assert scraper._parse_executor is None
+
+    def test_invalid_parse_workers(self):
+        """Testa que um número negativo de processos de parsing é rejeitado."""
+        with pytest.raises(ValueError):
+            BooksToScrapeScraper(parse_workers=-1)
+
+    def test_invalid_parser_backend(self):
+        """Testa que um backend de parser desconhecido é rejeitado."""
+        with pytest.raises(ValueError):
+            BooksToScrapeScraper(parser_backend="regex")
+
+    @pytest.mark.parametrize("mode", ["sequential", "async"])
+    def test_streaming_scrape_writes_batches(self, fake_books_site, db_session, tmp_path, mode):
+        """Testa que o modo streaming grava os livros em lotes no banco e no CSV durante a coleta."""
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=db_session.get_bind())
+        writer = BatchWriter(BooksToScrapeScraper.save_to_db, session_factory=session_factory,
+                             batch_size=3, flush_interval=60, queue_maxsize=2, csv_dir=str(tmp_path))
+        scraper = BooksToScrapeScraper(delay=0)
+
+        with writer:
+            scraper.sink = writer.put
+            if mode == "async":
+                books = asyncio.run(scraper.scrape_all_books_async())
+            else:
+                books = scraper.scrape_all_books()
+
+        assert books == []
+        assert scraper.books_emitted == 4
+        assert writer.books_written == 4
+        assert writer.batches_written == 2
+        assert db_session.query(Book).count() == 4
+        with open(writer.csv_path, encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert sorted(row['title'] for row in rows) == sorted(book.title for book in db_session.query(Book))
+
+    def test_streaming_scrape_stops_when_writer_fails(self, fake_books_site, tmp_path):
+        """Testa que uma falha na gravação em lote interrompe a coleta."""
+        def failing_write_batch(batch, db):
+            raise RuntimeError("disk full")
+
+        writer = BatchWriter(failing_write_batch, batch_size=1, flush_interval=60)
+        scraper = BooksToScrapeScraper(delay=0, sink=writer.put)
+
+        with pytest.raises(RuntimeError):
+            with writer:
+                scraper.scrape_all_books()
+
+        assert writer.books_written == 0
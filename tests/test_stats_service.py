@@ -0,0 +1,94 @@
+import os
+import sys
+from sqlalchemy import func
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+from app.entities.book_entity import Book
+from app.entities.category_stats_entity import CategoryStats
+from app.services.stats_service import get_overview_stats, get_category_stats
+from app.services.ingest_service import upsert_books
+
+
+def aggregate_from_books(db_session):
+    rows = db_session.query(
+        Book.category, func.count(Book.id), func.avg(Book.price), func.min(Book.price), func.max(Book.price)
+    ).group_by(Book.category).order_by(Book.category).all()
+    return [(category, count, round(avg, 2), min_price, max_price) for category, count, avg, min_price, max_price in rows]
+
+
+def stats_as_tuples(db_session):
+    return [
+        (row["category"], row["total_books"], row["average_price"], row["min_price"], row["max_price"])
+        for row in get_category_stats(db_session)
+    ]
+
+
+class TestStatsService:
+    """Testes para as estatísticas pré-calculadas."""
+
+    def test_overview_stats(self, db_session, multiple_books):
+        """Testa as estatísticas gerais lidas da tabela de resumo."""
+        stats = get_overview_stats(db_session)
+
+        assert stats == {
+            "total_books": 3,
+            "average_price": 40.66,
+            "min_price": 19.99,
+            "max_price": 55.99,
+            "rating_distribution": {"Three": 1, "Four": 1, "Five": 1}
+        }
+
+    def test_unmapped_ratings_keep_their_stored_label(self, db_session, multiple_books):
+        """Testa que classificações fora da escala, como "Not rated", aparecem com o rótulo gravado."""
+        db_session.add(Book(title="Sem nota", price=10.0, availability="In stock", rating="Not rated",
+                            category="Fiction", image_url=""))
+        db_session.add(Book(title="Sem nota 2", price=12.0, availability="In stock", rating="Not rated",
+                            category="Technology", image_url=""))
+        db_session.commit()
+
+        overview = get_overview_stats(db_session)
+        by_category = {row["category"]: row["rating_distribution"] for row in get_category_stats(db_session)}
+
+        assert overview["rating_distribution"] == {"Three": 1, "Four": 1, "Five": 1, "Not rated": 2}
+        assert by_category == {"Fiction": {"Three": 1, "Not rated": 1},
+                               "Technology": {"Four": 1, "Five": 1, "Not rated": 1}}
+
+    def test_overview_stats_empty_database(self, db_session):
+        """Testa as estatísticas gerais sem livros cadastrados."""
+        stats = get_overview_stats(db_session)
+
+        assert stats["total_books"] == 0
+        assert stats["average_price"] == 0.0
+        assert stats["rating_distribution"] == {}
+
+    def test_category_stats_follow_inserts_updates_and_deletes(self, db_session, multiple_books):
+        """Testa que a tabela de resumo acompanha inserções, alterações e remoções de livros."""
+        assert stats_as_tuples(db_session) == aggregate_from_books(db_session)
+
+        multiple_books[0].price = 5.0
+        multiple_books[1].category = "Fiction"
+        multiple_books[1].rating = "One"
+        db_session.commit()
+        assert stats_as_tuples(db_session) == aggregate_from_books(db_session)
+
+        db_session.delete(multiple_books[2])
+        db_session.delete(multiple_books[0])
+        db_session.commit()
+        assert stats_as_tuples(db_session) == aggregate_from_books(db_session)
+        fiction = get_category_stats(db_session)[0]
+        assert fiction["rating_distribution"] == {"One": 1}
+        assert db_session.query(CategoryStats).count() == 1
+
+    def test_category_stats_follow_bulk_upsert(self, db_session):
+        """Testa que a ingestão em lote atualiza as estatísticas de forma incremental."""
+        books = [
+            {"title": f"Book {i}", "price": 10.0 + i, "rating": "Two", "availability": "In stock",
+             "category": "Poetry" if i % 2 else "Travel", "image_url": "",
+             "book_url": f"https://books.toscrape.com/catalogue/book_{i}/index.html"}
+            for i in range(6)
+        ]
+        upsert_books(db_session, books)
+        books[1]["price"] = 1.0
+        books[2]["category"] = "Poetry"
+        upsert_books(db_session, books)
+
+        assert stats_as_tuples(db_session) == aggregate_from_books(db_session)
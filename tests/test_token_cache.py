@@ -0,0 +1,85 @@
+import os
+import sys
+import time
+from datetime import timedelta
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'api'))
+import app.core.auth as auth
+from app.core.auth import create_access_token
+from app.core.token_cache import VerifiedTokenCache, verified_tokens
+from app.schemas.user_schema import UserOut
+
+
+class TestVerifiedTokenCache:
+    """Testes para o cache de tokens verificados usado na autenticação."""
+
+    def test_entry_never_outlives_token_exp(self, monkeypatch):
+        """Testa que a entrada expira no `exp` do token quando ele é anterior ao TTL."""
+        cache = VerifiedTokenCache(ttl=60)
+        principal = UserOut(id=1, username="testuser")
+        cache.put("short", principal, time.time() + 5)
+        cache.put("long", principal, time.time() + 3600)
+        cache.put("expired", principal, time.time() - 1)
+
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 10)
+
+        assert cache.get("short") is None
+        assert cache.get("long") == principal
+        assert cache.get("expired") is None
+        assert cache.stats()["entries"] == 1
+
+    def test_bounded_entries_and_user_invalidation(self):
+        """Testa o limite de entradas e a invalidação de todos os tokens de um usuário."""
+        cache = VerifiedTokenCache(max_entries=2)
+        alice = UserOut(id=1, username="alice")
+        bob = UserOut(id=2, username="bob")
+        cache.put("a1", alice)
+        cache.put("b1", bob)
+        cache.get("a1")
+        cache.put("a2", alice)
+
+        assert cache.get("b1") is None
+        assert cache.stats()["evictions"] == 1
+
+        cache.invalidate_user("alice")
+
+        assert cache.get("a1") is None
+        assert cache.get("a2") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_repeated_requests_skip_token_verification(self, client, sample_user, monkeypatch):
+        """Testa que requisições com o mesmo token não decodificam o JWT nem consultam o usuário de novo."""
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': sample_user.username})}"}
+        calls = []
+        get_user = auth.get_user
+        monkeypatch.setattr(auth, "get_user", lambda db, username: calls.append(username) or get_user(db, username))
+
+        first = client.get("/api/v1/users/me", headers=headers)
+        second = client.get("/api/v1/users/me", headers=headers)
+        health = client.get("/api/v1/health/").json()["token_cache"]
+
+        assert first.status_code == second.status_code == 200
+        assert second.json() == first.json() == {"id": 1, "username": "testuser"}
+        assert calls == ["testuser"]
+        assert health["hits"] == 1
+        assert health["misses"] == 1
+        assert health["hit_rate"] == 0.5
+
+    def test_expired_and_invalid_tokens_are_not_cached(self, client, sample_user):
+        """Testa que tokens rejeitados não entram no cache."""
+        expired = create_access_token({"sub": sample_user.username}, timedelta(minutes=-1))
+        unknown = create_access_token({"sub": "nobody"})
+
+        for token in (expired, unknown, "invalid_token"):
+            assert client.get("/api/v1/users/me", headers={"Authorization": f"Bearer {token}"}).status_code == 401
+
+        assert verified_tokens.stats()["entries"] == 0
+
+    def test_user_creation_invalidates_cached_tokens(self, client, sample_user):
+        """Testa que a criação de um usuário remove os tokens em cache com o mesmo nome."""
+        verified_tokens.put("stale-token", UserOut(id=99, username="newuser"))
+
+        response = client.post("/api/v1/users/", json={"username": "newuser", "password": "secret"})
+
+        assert response.status_code == 200
+        assert verified_tokens.get("stale-token") is None